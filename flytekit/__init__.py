@@ -133,9 +133,8 @@ Secrets and SecurityContext
    SecurityContext
 
 """
+import importlib as _importlib
 
-
-import flytekit.plugins  # This will be deprecated, these are the old plugins, the new plugins live in plugins/
 from flytekit.core.base_sql_task import SQLTask
 from flytekit.core.base_task import SecurityContext, TaskMetadata, kwtypes
 from flytekit.core.condition import conditional
@@ -154,10 +153,24 @@ from flytekit.core.task import Secret, reference_task, task
 from flytekit.core.workflow import ImperativeWorkflow as Workflow
 from flytekit.core.workflow import WorkflowFailurePolicy, reference_workflow, workflow
 from flytekit.loggers import logger
-from flytekit.types import schema
 
 __version__ = "0.0.0+develop"
 
+# Submodules that used to be imported eagerly by ``import flytekit``. They pull in heavy optional dependencies (pandas,
+# numpy, ...) so they are now only loaded when first accessed as an attribute of this package.
+_LAZY_SUBMODULES = {
+    # This will be deprecated, these are the old plugins, the new plugins live in plugins/
+    "plugins": "flytekit.plugins",
+    "schema": "flytekit.types.schema",
+}
+
+
+def __getattr__(name):
+    module = _LAZY_SUBMODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return _importlib.import_module(module)
+
 
 def current_context() -> ExecutionParameters:
     """
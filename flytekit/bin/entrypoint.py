@@ -5,6 +5,8 @@ import logging as _logging
 import os as _os
 import pathlib
 import random as _random
+import subprocess as _subprocess
+import sys as _sys
 import traceback as _traceback
 from typing import List
 
@@ -39,6 +41,7 @@ from flytekit.interfaces.data import data_proxy as _data_proxy
 from flytekit.interfaces.data.gcs import gcs_proxy as _gcs_proxy
 from flytekit.interfaces.data.s3 import s3proxy as _s3proxy
 from flytekit.interfaces.stats.taggable import get_stats as _get_stats
+from flytekit.models import common as _common_models
 from flytekit.models import dynamic_job as _dynamic_job
 from flytekit.models import literals as _literal_models
 from flytekit.models.core import errors as _error_models
@@ -81,6 +84,38 @@ def _map_job_index_to_child_index(local_input_dir, datadir, index):
     return mapping_proto.literals[index].scalar.primitive.integer
 
 
+def _dynamic_job_spec_outputs(task_def: PythonTask, spec: _dynamic_job.DynamicJobSpec) -> dict:
+    """
+    Converts the dynamic job spec once, reports its size and enforces the configured size limit. Returns the files to
+    write to the engine dir.
+    """
+    futures = spec.to_flyte_idl()
+    size = futures.ByteSize()
+    msg = (
+        f"Dynamic job spec for {task_def.name} has {len(futures.nodes)} nodes and {len(futures.tasks)} tasks, "
+        f"serialized size {size} bytes"
+    )
+    max_size = _sdk_config.DYNAMIC_JOB_SPEC_MAX_SIZE_BYTES.get()
+    if max_size and size > max_size:
+        _logging.error(f"{msg}, which exceeds the limit of {max_size} bytes")
+        return {
+            _constants.ERROR_FILE_NAME: _error_models.ErrorDocument(
+                _error_models.ContainerError(
+                    "USER:DynamicJobSpecTooLarge",
+                    f"{msg}, which exceeds the limit of {max_size} bytes. Pass large values to the nodes of the "
+                    f"dynamic workflow as files, directories or schemas rather than as Python values.",
+                    _error_models.ContainerError.Kind.NON_RECOVERABLE,
+                    _execution_models.ExecutionError.ErrorKind.USER,
+                )
+            )
+        }
+    if size > _sdk_config.DYNAMIC_JOB_SPEC_WARN_SIZE_BYTES.get():
+        _logging.warning(msg)
+    else:
+        _logging.info(msg)
+    return {_constants.FUTURES_FILE_NAME: futures}
+
+
 def _dispatch_execute(
     ctx: FlyteContext,
     task_def: PythonTask,
@@ -115,7 +150,7 @@ def _dispatch_execute(
         elif isinstance(outputs, _literal_models.LiteralMap):
             output_file_dict = {_constants.OUTPUT_FILE_NAME: outputs}
         elif isinstance(outputs, _dynamic_job.DynamicJobSpec):
-            output_file_dict = {_constants.FUTURES_FILE_NAME: outputs}
+            output_file_dict = _dynamic_job_spec_outputs(task_def, outputs)
         else:
             _logging.getLogger().error(f"SystemError: received unknown outputs from task {outputs}")
             output_file_dict[_constants.ERROR_FILE_NAME] = _error_models.ErrorDocument(
@@ -174,7 +209,8 @@ def _dispatch_execute(
         _logging.error("!! End Error Captured by Flyte !!")
 
     for k, v in output_file_dict.items():
-        _common_utils.write_proto_to_file(v.to_flyte_idl(), _os.path.join(ctx.execution_state.engine_dir, k))
+        proto = v.to_flyte_idl() if isinstance(v, _common_models.FlyteIdlEntity) else v
+        _common_utils.write_proto_to_file(proto, _os.path.join(ctx.execution_state.engine_dir, k))
 
     ctx.file_access.upload_directory(ctx.execution_state.engine_dir, output_prefix)
     _logging.info(f"Engine folder written successfully to the output prefix {output_prefix}")
@@ -495,6 +531,24 @@ def execute_task_cmd(
         )
 
 
+def _prepare_in_process_execution(dest_dir: str, distribution_files: List[str]):
+    """
+    Evicts already imported modules whose files were just written by a fast distribution, and makes sure the import
+    system sees the new files. Other modules under dest_dir (e.g. a virtualenv or flytekit itself) stay loaded.
+
+    :param dest_dir: Where the distribution was extracted
+    :param distribution_files: The paths of the files of the distribution, relative to dest_dir
+    """
+    if distribution_files:
+        dest_dir = _os.path.abspath(dest_dir)
+        written = {_os.path.join(dest_dir, f) for f in distribution_files}
+        for name, module in list(_sys.modules.items()):
+            module_file = getattr(module, "__file__", None)
+            if module_file and _os.path.abspath(module_file) in written:
+                del _sys.modules[name]
+    _importlib.invalidate_caches()
+
+
 @_pass_through.command("pyflyte-fast-execute")
 @_click.option("--additional-distribution", required=False)
 @_click.option("--dest-dir", required=False)
@@ -508,13 +562,11 @@ def fast_execute_task_cmd(additional_distribution, dest_dir, task_execute_cmd):
     :param task_execute_cmd:
     :return:
     """
+    distribution_files = []
     if additional_distribution is not None:
         if not dest_dir:
             dest_dir = _os.getcwd()
-        _download_distribution(additional_distribution, dest_dir)
-
-    # Use the commandline to run the task execute command rather than calling it directly in python code
-    # since the current runtime bytecode references the older user code, rather than the downloaded distribution.
+        distribution_files = _download_distribution(additional_distribution, dest_dir)
 
     # Insert the call to fast before the unbounded resolver args
     cmd = []
@@ -523,7 +575,17 @@ def fast_execute_task_cmd(additional_distribution, dest_dir, task_execute_cmd):
             cmd.extend(["--dynamic-addl-distro", additional_distribution, "--dynamic-dest-dir", dest_dir])
         cmd.append(arg)
 
-    _os.system(" ".join(cmd))
+    if _sdk_config.FAST_EXECUTE_IN_PROCESS.get() and cmd and cmd[0] in _pass_through.commands:
+        # Nothing has imported the user code yet, so running the task in this interpreter picks up the downloaded
+        # distribution. Only make sure that stale copies of it cannot shadow the new files.
+        _prepare_in_process_execution(dest_dir, distribution_files)
+        return _pass_through.main(args=cmd, prog_name=cmd[0], standalone_mode=False)
+
+    # Otherwise, use the commandline to run the task execute command rather than calling it directly in python code
+    # since the current runtime bytecode may reference the older user code, rather than the downloaded distribution.
+    returncode = _subprocess.call(cmd)
+    if returncode != 0:
+        raise SystemExit(returncode)
 
 
 @_pass_through.command("pyflyte-map-execute")
@@ -7,7 +7,7 @@ import typing
 import click
 
 from flytekit.clis.sdk_in_container import constants, serialize
-from flytekit.configuration import internal
+from flytekit.configuration import internal, sdk
 from flytekit.core import context_manager
 from flytekit.core.context_manager import ImageConfig, look_up_image_info
 from flytekit.tools import fast_registration, module_loader
@@ -162,9 +162,10 @@ def package(ctx, image_config, source, output, force, fast, in_container_source_
                     digest = fast_registration.compute_digest(source)
                     archive_fname = os.path.join(output_tmpdir, f"{digest}.tar.gz")
                     click.secho(f"Fast mode enabled: compressed archive {archive_fname}", dim=True)
-                    # Write using gzip
-                    with tarfile.open(archive_fname, "w:gz") as tar:
-                        tar.add(source, arcname="", filter=fast_registration.filter_tar_file_fn)
+                    with open(archive_fname, "wb") as fp:
+                        fast_registration.write_archive(
+                            source, fp, workers=sdk.FAST_REGISTRATION_COMPRESSION_WORKERS.get() or None
+                        )
 
                 with tarfile.open(output, "w:gz") as tar:
                     tar.add(output_tmpdir, arcname="")
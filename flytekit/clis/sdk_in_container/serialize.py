@@ -2,10 +2,11 @@ import logging as _logging
 import math as _math
 import os as _os
 import sys
-import tarfile as _tarfile
 import typing
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor as _ThreadPoolExecutor
 from enum import Enum as _Enum
+from itertools import islice as _islice
 from typing import List
 
 import click
@@ -22,6 +23,7 @@ from flytekit.common.tasks import task as _sdk_task
 from flytekit.common.translator import get_serializable
 from flytekit.common.utils import write_proto_to_file as _write_proto_to_file
 from flytekit.configuration import internal as _internal_config
+from flytekit.configuration import sdk as _sdk_config
 from flytekit.core import context_manager as flyte_context
 from flytekit.core.base_task import PythonTask
 from flytekit.core.launch_plan import LaunchPlan
@@ -30,8 +32,9 @@ from flytekit.models import launch_plan as _launch_plan_models
 from flytekit.models import task as task_models
 from flytekit.models.admin import workflow as admin_workflow_models
 from flytekit.tools.fast_registration import compute_digest as _compute_digest
-from flytekit.tools.fast_registration import filter_tar_file_fn as _filter_tar_file_fn
+from flytekit.tools.fast_registration import write_archive as _write_archive
 from flytekit.tools.module_loader import iterate_registerable_entities_in_order
+from flytekit.tools.serialize_cache import ModuleDigests, SerializationCache
 
 # Identifier fields use placeholders for registration-time substitution.
 # Additional fields, such as auth and the raw output data prefix have more complex structures
@@ -53,6 +56,9 @@ CTX_CONFIG_FILE_LOC = "config_file_loc"
 CTX_FLYTEKIT_VIRTUALENV_ROOT = "flytekit_virtualenv_root"
 CTX_PYTHON_INTERPRETER = "python_interpreter"
 
+# Default location of the incremental serialization cache, relative to the output folder.
+_DEFAULT_SERIALIZE_CACHE_DIR = ".flyte_serialize_cache"
+
 
 class SerializationMode(_Enum):
     DEFAULT = 0
@@ -105,33 +111,98 @@ def _should_register_with_admin(entity) -> bool:
     )
 
 
-def get_registrable_entities(ctx: flyte_context.FlyteContext) -> typing.List:
+def _idl_entity_key(entity) -> typing.Tuple[str, str]:
+    if isinstance(entity, _idl_admin_TaskSpec):
+        return "task", entity.template.id.name
+    if isinstance(entity, _idl_admin_WorkflowSpec):
+        return "workflow", entity.template.id.name
+    return "launch_plan", entity.id.name
+
+
+def _entity_cache_key(entity) -> str:
+    if isinstance(entity, PythonTask):
+        return f"task/{entity.name}"
+    if isinstance(entity, WorkflowBase):
+        return f"workflow/{entity.name}"
+    return f"launch_plan/{entity.name}"
+
+
+def get_registrable_entities(
+    ctx: flyte_context.FlyteContext,
+    cache: typing.Optional[SerializationCache] = None,
+    module_digests: typing.Optional[ModuleDigests] = None,
+) -> typing.List:
     """
     Returns all entities that can be serialized and should be sent over to Flyte backend. This will filter any entities
     that are not known to Admin
+
+    If a cache and module digests are provided, entities whose defining module (and everything it imports) is unchanged
+    since the cache was written are taken from the cache instead of being serialized again.
     """
     new_api_serializable_entities = OrderedDict()
+    registrable_entities = OrderedDict()
     # TODO: Clean up the copy() - it's here because we call get_default_launch_plan, which may create a LaunchPlan
     #  object, which gets added to the FlyteEntities.entities list, which we're iterating over.
     for entity in flyte_context.FlyteEntities.entities.copy():
         if isinstance(entity, PythonTask) or isinstance(entity, WorkflowBase) or isinstance(entity, LaunchPlan):
+            key = digest = None
+            if cache is not None and module_digests is not None:
+                key = _entity_cache_key(entity)
+                module = getattr(entity, "instantiated_in", None)
+                digest = module_digests.digest(module) if module else None
+                cached = cache.get(key, digest)
+                if cached is not None:
+                    for idl in cached:
+                        registrable_entities.setdefault(_idl_entity_key(idl), idl)
+                    continue
+
+            num_serialized = len(new_api_serializable_entities)
             get_serializable(new_api_serializable_entities, ctx.serialization_settings, entity)
 
             if isinstance(entity, WorkflowBase):
                 lp = LaunchPlan.get_default_launch_plan(ctx, entity)
                 get_serializable(new_api_serializable_entities, ctx.serialization_settings, lp)
 
-    new_api_model_values = list(new_api_serializable_entities.values())
-    entities_to_be_serialized = list(filter(_should_register_with_admin, new_api_model_values))
-    return [v.to_flyte_idl() for v in entities_to_be_serialized]
+            produced = [
+                v.to_flyte_idl()
+                for v in _islice(new_api_serializable_entities.values(), num_serialized, None)
+                if _should_register_with_admin(v)
+            ]
+            for idl in produced:
+                registrable_entities.setdefault(_idl_entity_key(idl), idl)
+            if key is not None:
+                cache.put(key, digest, produced)
+
+    return list(registrable_entities.values())
 
 
-def persist_registrable_entities(entities: typing.List, folder: str):
+def _write_if_changed(fname: str, contents: bytes):
+    """
+    Skips rewriting files whose contents are already up to date, so unchanged outputs keep their mtime.
+    """
+    try:
+        if _os.path.getsize(fname) == len(contents):
+            with open(fname, "rb") as reader:
+                if reader.read() == contents:
+                    return
+    except OSError:
+        pass
+    with open(fname, "wb") as writer:
+        writer.write(contents)
+
+
+def persist_registrable_entities(
+    entities: typing.List, folder: str, max_workers: typing.Optional[int] = None
+) -> typing.List[str]:
     """
     For protobuf serializable list of entities, writes a file with the name if the entity and
-    enumeration order to the specified folder
+    enumeration order to the specified folder. Files are written concurrently on a thread pool of ``max_workers``
+    threads.
+
+    :return: The names of the files written, relative to the folder.
     """
     zero_padded_length = _determine_text_chars(len(entities))
+    outputs = []
     for i, entity in enumerate(entities):
         name = ""
         fname_index = str(i).zfill(zero_padded_length)
@@ -148,13 +219,17 @@ def persist_registrable_entities(entities: typing.List, folder: str):
             click.secho(f"Entity is incorrect formatted {entity} - type {type(entity)}", fg="red")
             sys.exit(-1)
         click.secho(f"  Packaging {name} -> {fname}", dim=True)
-        fname = _os.path.join(folder, fname)
-        with open(fname, "wb") as writer:
-            # todo: add a flag
-            # print(fname)
-            # print(entity)
-            # print("\n" * 5)
-            writer.write(entity.SerializeToString())
+        outputs.append((fname, entity))
+
+    with _ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(_write_if_changed, _os.path.join(folder, fname), entity.SerializeToString())
+            for fname, entity in outputs
+        ]
+        for f in futures:
+            f.result()
+
+    return [fname for fname, _ in outputs]
 
 
 @system_entry_point
@@ -167,6 +242,8 @@ def serialize_all(
     config_path: str = None,
     flytekit_virtualenv_root: str = None,
     python_interpreter: str = None,
+    incremental: bool = False,
+    cache_dir: str = None,
 ):
     """
     This function will write to the folder specified the following protobuf types ::
@@ -186,6 +263,10 @@ def serialize_all(
     :param image: The fully qualified and versioned default image to use
     :param config_path: Path to the config file, if any, to be used during serialization
     :param flytekit_virtualenv_root: The full path of the virtual env in the container.
+    :param incremental: Reuse cached protobufs for entities whose modules have not changed since the last run, and
+        remove outputs of the last run that are no longer produced.
+    :param cache_dir: Where to keep the incremental serialization cache. Defaults to a hidden folder in the output
+        folder.
     """
 
     # m = module (i.e. python file)
@@ -239,12 +320,29 @@ def serialize_all(
 
         click.echo(f"Found {len(flyte_context.FlyteEntities.entities)} tasks/workflows")
 
-        new_api_model_values = get_registrable_entities(ctx)
-
-        loaded_entities = serialized_old_style_entities + new_api_model_values
         if folder is None:
             folder = "."
-        persist_registrable_entities(loaded_entities, folder)
+
+        cache = module_digests = None
+        if incremental:
+            cache = SerializationCache(
+                cache_dir or _os.path.join(folder, _DEFAULT_SERIALIZE_CACHE_DIR),
+                SerializationCache.settings_key(serialization_settings, _flytekit.__version__),
+            )
+            module_digests = ModuleDigests([local_source_root or _os.getcwd()])
+
+        new_api_model_values = get_registrable_entities(ctx, cache=cache, module_digests=module_digests)
+
+        loaded_entities = serialized_old_style_entities + new_api_model_values
+        outputs = persist_registrable_entities(loaded_entities, folder)
+
+        if cache is not None:
+            for stale in set(cache.previous_outputs) - set(outputs):
+                stale_path = _os.path.join(folder, stale)
+                if _os.path.exists(stale_path):
+                    _os.remove(stale_path)
+            cache.save(outputs)
+            click.echo(f"Reused {cache.hits} cached entities, serialized {cache.misses}")
 
         click.secho(f"Successfully serialized {len(loaded_entities)} flyte objects", fg="green")
 
@@ -342,8 +440,20 @@ def tasks(ctx, folder=None):
 # For now let's just assume that the directory needs to exist. If you're docker run -v'ing, docker will create the
 # directory for you so it shouldn't be a problem.
 @click.option("-f", "--folder", type=click.Path(exists=True))
+@click.option(
+    "--incremental",
+    is_flag=True,
+    default=False,
+    help="Only re-serialize entities whose defining module, or a local module it imports, changed since the last run.",
+)
+@click.option(
+    "--cache-dir",
+    required=False,
+    type=click.Path(file_okay=False),
+    help="Where to keep the incremental serialization cache. Defaults to a hidden folder in the output folder.",
+)
 @click.pass_context
-def workflows(ctx, folder=None):
+def workflows(ctx, folder=None, incremental=False, cache_dir=None):
     _logging.getLogger().setLevel(_logging.DEBUG)
 
     if folder:
@@ -359,6 +469,8 @@ def workflows(ctx, folder=None):
         image=ctx.obj[CTX_IMAGE],
         config_path=ctx.obj[CTX_CONFIG_FILE_LOC],
         flytekit_virtualenv_root=ctx.obj[CTX_FLYTEKIT_VIRTUALENV_ROOT],
+        incremental=incremental,
+        cache_dir=cache_dir,
     )
 
 
@@ -382,9 +494,8 @@ def fast_workflows(ctx, folder=None):
     folder = folder if folder else ""
     archive_fname = _os.path.join(folder, f"{digest}.tar.gz")
     click.echo(f"Writing compressed archive to {archive_fname}")
-    # Write using gzip
-    with _tarfile.open(archive_fname, "w:gz") as tar:
-        tar.add(source_dir, arcname="", filter=_filter_tar_file_fn)
+    with open(archive_fname, "wb") as fp:
+        _write_archive(source_dir, fp, workers=_sdk_config.FAST_REGISTRATION_COMPRESSION_WORKERS.get() or None)
 
     pkgs = ctx.obj[CTX_PACKAGES]
     dir = ctx.obj[CTX_LOCAL_SRC_ROOT]
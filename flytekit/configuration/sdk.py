@@ -85,9 +85,134 @@ PARQUET_ENGINE = _config_common.FlyteStringConfigurationEntry("sdk", "parquet_en
 This is the parquet engine to use when reading data from parquet files.
 """
 
+DYNAMIC_JOB_SPEC_WARN_SIZE_BYTES = _config_common.FlyteIntegerConfigurationEntry(
+    "sdk", "dynamic_job_spec_warn_size_bytes", default=10 * 1024 * 1024
+)
+"""
+Dynamic tasks log a warning if the serialized workflow they produce (futures.pb) is larger than this. Large futures
+files usually come from passing big Python values directly to nodes inside the dynamic body.
+"""
+
+DYNAMIC_JOB_SPEC_MAX_SIZE_BYTES = _config_common.FlyteIntegerConfigurationEntry(
+    "sdk", "dynamic_job_spec_max_size_bytes", default=0
+)
+"""
+If non-zero, dynamic tasks fail with a non-recoverable user error instead of writing a futures.pb larger than this.
+"""
+
 FAST_REGISTRATION_DIR = _config_common.FlyteStringConfigurationEntry("sdk", "fast_registration_dir")
 """
 This is the remote directory where fast-registered code will be uploaded to.
 Users calling fast-execute need write permission to this directory.
 Furthermore, it is important that whichever role executes your workflow has read access to this directory.
 """
+
+FAST_REGISTRATION_COMPRESSION_WORKERS = _config_common.FlyteIntegerConfigurationEntry(
+    "sdk", "fast_registration_compression_workers", default=0
+)
+"""
+Number of threads used to gzip-compress fast registration archives. Zero means one per CPU.
+"""
+
+FAST_REGISTRATION_STREAM_UPLOAD = _config_common.FlyteBoolConfigurationEntry(
+    "sdk", "fast_registration_stream_upload", default=False
+)
+"""
+If set, fast registration archives are streamed to the remote store as they are compressed, instead of being staged in a
+temporary file first. Only effective for stores that support uploads of unknown size (s3, gs and the local filesystem).
+"""
+
+FAST_DISTRIBUTION_CACHE_DIR = _config_common.FlyteStringConfigurationEntry("sdk", "fast_distribution_cache_dir")
+"""
+If set, fast-execute keeps extracted code distributions in this directory, keyed by the distribution digest, and
+copies them into place instead of downloading them again. Point it at a node-local volume to share it across tasks.
+"""
+
+FAST_EXECUTE_IN_PROCESS = _config_common.FlyteBoolConfigurationEntry("sdk", "fast_execute_in_process", default=False)
+"""
+If set, fast-execute runs pyflyte-execute and pyflyte-map-execute commands in the same interpreter once the code
+distribution is in place, rather than starting a new Python process. Modules imported from files of the distribution
+are evicted first. Unlike a new process, module level state of flytekit and its dependencies carries over, and a
+failing task raises its exception instead of exiting with a return code.
+"""
+
+TASK_TEMPLATE_CACHE_DIR = _config_common.FlyteStringConfigurationEntry("sdk", "task_template_cache_dir")
+"""
+If set, tasks resolved from their task template (e.g. SQL tasks) keep the downloaded ``task_template.pb`` files in this
+directory, keyed by the path they were downloaded from. Templates are never modified once registered, so every
+container on a node that runs the same task reads the template from there instead of downloading it again.
+"""
+
+SQLITE3_DB_CACHE_DIR = _config_common.FlyteStringConfigurationEntry("sdk", "sqlite3_db_cache_dir")
+"""
+If set, SQLite3Task keeps downloaded (and unpacked) databases in this directory, keyed by their uri and etag, and opens
+them read-only from there instead of downloading them for every execution. Point it at a node-local volume to share
+it across tasks.
+"""
+
+SQLITE3_MMAP_SIZE_BYTES = _config_common.FlyteIntegerConfigurationEntry(
+    "sdk", "sqlite3_mmap_size_bytes", default=256 * 1024 * 1024
+)
+"""
+The mmap_size SQLite3Task sets on databases opened from the cache, so that reads are served from the page cache.
+"""
+
+UNTYPED_DICT_AS_MSGPACK = _config_common.FlyteBoolConfigurationEntry("sdk", "untyped_dict_as_msgpack", default=False)
+"""
+If set, untyped ``dict`` inputs and outputs are declared as binary and stored msgpack encoded instead of as a Struct.
+This keeps integers and bytes intact and is much faster for large dictionaries. Values are always written in the
+format the interface of the task declares, so tasks registered before the setting changed keep working.
+Requires ``msgpack``.
+"""
+
+STREAMING_BLOCK_SIZE_BYTES = _config_common.FlyteIntegerConfigurationEntry(
+    "sdk", "streaming_block_size_bytes", default=8 * 1024 * 1024
+)
+"""
+The number of bytes fetched by each range request when a remote file is opened with ``FlyteFile.open(streaming=True)``.
+"""
+
+STREAMING_CACHE_BLOCKS = _config_common.FlyteIntegerConfigurationEntry("sdk", "streaming_cache_blocks", default=8)
+"""
+The number of recently read blocks of a streamed remote file that are kept in memory.
+"""
+
+STREAMING_READ_AHEAD_BLOCKS = _config_common.FlyteIntegerConfigurationEntry(
+    "sdk", "streaming_read_ahead_blocks", default=2
+)
+"""
+The number of blocks of a streamed remote file fetched in the background ahead of sequential reads.
+"""
+
+BINARY_OFFLOAD_THRESHOLD_BYTES = _config_common.FlyteIntegerConfigurationEntry(
+    "sdk", "binary_offload_threshold_bytes", default=1024 * 1024
+)
+"""
+Serialized protobuf messages and bytes values larger than this are written to the blob store, and their literal only
+holds the uri, so that they don't bloat the inputs and outputs of tasks. A negative value disables offloading.
+"""
+
+PROTOBUF_AS_BINARY = _config_common.FlyteBoolConfigurationEntry("sdk", "protobuf_as_binary", default=False)
+"""
+If set, protobuf message inputs and outputs are declared as binary and stored serialized instead of as a Struct.
+Decoding is then a single parse, and the message type is checked against the tag of the value. Values are always
+written in the format the interface of the task declares, so tasks registered before the setting changed keep working.
+"""
+
+LOGGING_SUMMARIZE_VALUES = _config_common.FlyteBoolConfigurationEntry("sdk", "logging_summarize_values", default=True)
+"""
+If set, the inputs and outputs of tasks are logged as size-capped summaries, e.g. the shape and columns of a
+DataFrame, the length and first items of a list or the uri of a file. Otherwise they're logged in full. Either way they
+are only formatted if the log record is emitted.
+"""
+
+LOGGING_MAX_ITEMS = _config_common.FlyteIntegerConfigurationEntry("sdk", "logging_max_items", default=5)
+"""
+The number of items of a collection, columns of a DataFrame or fields of a dataclass shown in logged summaries.
+"""
+
+LOGGING_MAX_VALUE_LENGTH = _config_common.FlyteIntegerConfigurationEntry("sdk", "logging_max_value_length", default=256)
+"""
+The number of characters after which the logged summary of a single input or output, or of a value nested in one, is
+cut off.
+"""
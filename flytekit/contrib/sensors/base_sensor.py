@@ -1,4 +1,5 @@
 import abc as _abc
+import asyncio as _asyncio
 import datetime as _datetime
 import logging as _logging
 import sys as _sys
@@ -9,17 +10,26 @@ import six as _six
 
 
 class Sensor(object, metaclass=_abc.ABCMeta):
-    def __init__(self, evaluation_interval=None, max_failures=0):
+    def __init__(self, evaluation_interval=None, max_failures=0, backoff_factor=1.0, max_evaluation_interval=None):
         """
         :param datetime.timedelta evaluation_interval: This is the time to wait between evaluation attempts of this
             sensor. If the sensor takes longer to evaluate than the poll_interval, it will immediately begin
             evaluation again.
         :param int max_failures: This is the maximum number of failures that can happen while attempting to sense
             before perma-failing.
+        :param float backoff_factor: The evaluation interval is multiplied by this factor after every evaluation that
+            didn't sense the condition. The default of 1 polls at a fixed interval.
+        :param datetime.timedelta max_evaluation_interval: The evaluation interval does not back off beyond this.
+            Defaults to ten times the evaluation interval.
         """
         if evaluation_interval is None:
             evaluation_interval = _datetime.timedelta(seconds=30)
+        if max_evaluation_interval is None:
+            max_evaluation_interval = evaluation_interval * 10
         self._evaluation_interval = evaluation_interval
+        self._current_interval = evaluation_interval
+        self._backoff_factor = backoff_factor
+        self._max_evaluation_interval = max(max_evaluation_interval, evaluation_interval)
         self._max_failures = max_failures
         self._failures = 0
         self._exc_info = None
@@ -50,13 +60,17 @@ class Sensor(object, metaclass=_abc.ABCMeta):
 
         now = _datetime.datetime.utcnow()
 
-        time_to_wait_eval_period = self._evaluation_interval - (now - self._last_executed_time)
+        time_to_wait_eval_period = self._current_interval - (now - self._last_executed_time)
         if time_to_wait_eval_period > _datetime.timedelta():
             return self._sensed, time_to_wait_eval_period
 
         try:
             self._sensed, time_to_wait = self._do_poll()
-            time_to_wait = time_to_wait or self._evaluation_interval
+            if not self._sensed and self._backoff_factor != 1.0:
+                self._current_interval = min(
+                    self._current_interval * self._backoff_factor, self._max_evaluation_interval
+                )
+            time_to_wait = time_to_wait or self._current_interval
         except BaseException:
             self._failures += 1
             self._exc_info = _sys.exc_info()
@@ -88,3 +102,45 @@ class Sensor(object, metaclass=_abc.ABCMeta):
                 _time.sleep(time_to_wait.total_seconds())
             if timeout is not None and (_datetime.datetime.utcnow() - started) > timeout:
                 return False
+
+    async def sense_async(self, timeout=None, executor=None):
+        """
+        Like sense, but waits without blocking the event loop so that many sensors can be waited on at once. The
+        polls run on the given executor (or the default executor of the loop).
+        :param datetime.timedelta timeout:
+        :param concurrent.futures.Executor executor:
+        :rtype: bool
+        """
+        loop = _asyncio.get_running_loop()
+        started = _datetime.datetime.utcnow()
+        while True:
+            sensed, time_to_wait = await loop.run_in_executor(executor, self.sense_with_wait_hint)
+            if sensed:
+                return True
+            if timeout is not None:
+                remaining = timeout - (_datetime.datetime.utcnow() - started)
+                if remaining <= _datetime.timedelta():
+                    return False
+                if time_to_wait:
+                    time_to_wait = min(time_to_wait, remaining)
+            if time_to_wait:
+                await _asyncio.sleep(time_to_wait.total_seconds())
+
+
+def sense_all(sensors, timeout=None, max_workers=None):
+    """
+    Polls all sensors concurrently, each at its own interval, until every one of them has sensed its condition or the
+    timeout expires.
+    :param list[Sensor] sensors:
+    :param datetime.timedelta timeout:
+    :param int max_workers: The maximum number of polls that run at the same time.
+    :rtype: bool
+    """
+    from concurrent.futures import ThreadPoolExecutor as _ThreadPoolExecutor
+
+    async def _sense_all(executor):
+        results = await _asyncio.gather(*[s.sense_async(timeout=timeout, executor=executor) for s in sensors])
+        return all(results)
+
+    with _ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return _asyncio.run(_sense_all(executor))
@@ -1,5 +1,72 @@
+import socket as _socket
+import threading as _threading
+
 from flytekit.contrib.sensors.base_sensor import Sensor as _Sensor
 from flytekit.plugins import hmsclient as _hmsclient
+from flytekit.plugins import thrift as _thrift
+
+
+class _SharedMetastoreClient(object):
+    """
+    A metastore connection that stays open across polls and is shared by every sensor that talks to the same
+    metastore. Thrift clients are not thread safe, so calls are serialized.
+    """
+
+    _clients = {}
+    _clients_lock = _threading.Lock()
+
+    def __init__(self, host, port):
+        self._client = _hmsclient.HMSClient(host=host, port=port)
+        self._lock = _threading.Lock()
+        self._is_open = False
+
+    @classmethod
+    def get(cls, host, port):
+        """
+        :param Text host:
+        :param Text port:
+        :rtype: _SharedMetastoreClient
+        """
+        with cls._clients_lock:
+            if (host, port) not in cls._clients:
+                cls._clients[(host, port)] = cls(host, port)
+            return cls._clients[(host, port)]
+
+    @property
+    def client(self):
+        return self._client
+
+    def _reset(self):
+        self._is_open = False
+        try:
+            self._client.close()
+        except Exception:
+            pass
+
+    def call(self, method, *args, **kwargs):
+        """
+        Calls a method of the client on the open connection. Idle connections get dropped by metastores and load
+        balancers, so on a transport error the connection is reopened and the call retried once. The connection is
+        dropped on any other error that isn't a metastore answer, so the next poll reconnects.
+
+        :param Text method: The name of the HMSClient method
+        """
+        with self._lock:
+            for attempt in range(2):
+                if not self._is_open:
+                    self._client.open()
+                    self._is_open = True
+                try:
+                    return getattr(self._client, method)(*args, **kwargs)
+                except _hmsclient.genthrift.hive_metastore.ttypes.NoSuchObjectException:
+                    raise
+                except (_thrift.transport.TTransport.TTransportException, _socket.error):
+                    self._reset()
+                    if attempt:
+                        raise
+                except BaseException:
+                    self._reset()
+                    raise
 
 
 class _HiveSensor(_Sensor):
@@ -14,7 +81,8 @@ class _HiveSensor(_Sensor):
         self._schema = schema
         self._host = host
         self._port = port
-        self._hive_metastore_client = _hmsclient.HMSClient(host=host, port=port)
+        self._shared_client = _SharedMetastoreClient.get(host, port)
+        self._hive_metastore_client = self._shared_client.client
         super(_HiveSensor, self).__init__(**kwargs)
 
 
@@ -34,12 +102,11 @@ class HiveTableSensor(_HiveSensor):
         """
         :rtype: (bool, Optional[datetime.timedelta])
         """
-        with self._hive_metastore_client as client:
-            try:
-                client.get_table(self._schema, self._table_name)
-                return True, None
-            except _hmsclient.genthrift.hive_metastore.ttypes.NoSuchObjectException:
-                return False, None
+        try:
+            self._shared_client.call("get_table", self._schema, self._table_name)
+            return True, None
+        except _hmsclient.genthrift.hive_metastore.ttypes.NoSuchObjectException:
+            return False, None
 
 
 class HiveNamedPartitionSensor(_HiveSensor):
@@ -49,7 +116,8 @@ class HiveNamedPartitionSensor(_HiveSensor):
         operator because it is more efficient than evaluating a filter expression.
 
         :param Text table_name: The name of the table
-        :param Text partition_name: The name of the partition to listen for  (example: 'ds=2017-01-01/region=NYC')
+        :param list[Text] partition_names: The names of the partitions to listen for
+            (example: ['ds=2017-01-01/region=NYC']). All of them are looked up with a single metastore call.
         :param Text host: The host for the Hive metastore Thrift service.
         :param Text port: The port for the Hive metastore Thrift Service
         :param **kwargs: See _HiveSensor and flytekit.contrib.sensors.base_sensor.Sensor for more
@@ -63,13 +131,13 @@ class HiveNamedPartitionSensor(_HiveSensor):
         """
         :rtype: (bool, Optional[datetime.timedelta])
         """
-        with self._hive_metastore_client as client:
-            try:
-                for partition_name in self._partition_names:
-                    client.get_partition_by_name(self._schema, self._table_name, partition_name)
-                return True, None
-            except _hmsclient.genthrift.hive_metastore.ttypes.NoSuchObjectException:
-                return False, None
+        names = sorted(set(self._partition_names))
+        try:
+            # Only the partitions that exist are returned
+            partitions = self._shared_client.call("get_partitions_by_names", self._schema, self._table_name, names)
+            return len(partitions) == len(names), None
+        except _hmsclient.genthrift.hive_metastore.ttypes.NoSuchObjectException:
+            return False, None
 
 
 class HiveFilteredPartitionSensor(_HiveSensor):
@@ -94,14 +162,14 @@ class HiveFilteredPartitionSensor(_HiveSensor):
         """
         :rtype: (bool, Optional[datetime.timedelta])
         """
-        with self._hive_metastore_client as client:
-            partitions = client.get_partitions_by_filter(
-                db_name=self._schema,
-                tbl_name=self._table_name,
-                filter=self._partition_filter,
-                max_parts=1,
-            )
-            if partitions:
-                return True, None
-            else:
-                return False, None
+        partitions = self._shared_client.call(
+            "get_partitions_by_filter",
+            db_name=self._schema,
+            tbl_name=self._table_name,
+            filter=self._partition_filter,
+            max_parts=1,
+        )
+        if partitions:
+            return True, None
+        else:
+            return False, None
@@ -2,18 +2,22 @@ from flytekit.common import constants as _common_constants
 from flytekit.common.exceptions import user as _user_exceptions
 from flytekit.common.tasks import sdk_runnable as _sdk_runnable
 from flytekit.contrib.sensors.base_sensor import Sensor as _Sensor
+from flytekit.contrib.sensors.base_sensor import sense_all as _sense_all
 
 
 class SensorTask(_sdk_runnable.SdkRunnableTask):
     def _execute_user_code(self, context, inputs):
         sensor = super(SensorTask, self)._execute_user_code(context=context, inputs=inputs)
         if sensor is not None:
-            if not isinstance(sensor, _Sensor):
-                raise _user_exceptions.FlyteTypeException(
-                    received_type=type(sensor),
-                    expected_type=_Sensor,
-                )
-            succeeded = sensor.sense()
+            # A list of sensors is polled concurrently, the task succeeds once all of them sensed their condition
+            sensors = sensor if isinstance(sensor, (list, tuple)) else [sensor]
+            for s in sensors:
+                if not isinstance(s, _Sensor):
+                    raise _user_exceptions.FlyteTypeException(
+                        received_type=type(s),
+                        expected_type=_Sensor,
+                    )
+            succeeded = sensors[0].sense() if len(sensors) == 1 else _sense_all(sensors)
             if not succeeded:
                 raise _user_exceptions.FlyteRecoverableException()
 
@@ -48,6 +52,9 @@ def sensor_task(
                 port=1234,
             )
 
+    The function may also return a list of sensors, they are then polled concurrently and the task completes once
+    every one of them sensed its condition.
+
     :param _task_function: this is the decorated method and shouldn't be declared explicitly.  The function must
         take a first argument, and then named arguments matching those defined in @inputs.  No keyword
         arguments are allowed for wrapped task functions.
@@ -25,7 +25,7 @@ from typing import Any, Dict, Generic, List, Optional, Tuple, Type, TypeVar, Uni
 
 from flytekit.common.tasks.sdk_runnable import ExecutionParameters
 from flytekit.core.context_manager import FlyteContext, FlyteContextManager, FlyteEntities, SerializationSettings
-from flytekit.core.interface import Interface, transform_interface_to_typed_interface
+from flytekit.core.interface import ConversionPlan, Interface, transform_interface_to_typed_interface
 from flytekit.core.local_cache import LocalCache
 from flytekit.core.promise import (
     Promise,
@@ -36,7 +36,7 @@ from flytekit.core.promise import (
     translate_inputs_to_literals,
 )
 from flytekit.core.tracker import TrackedInstance
-from flytekit.core.type_engine import TypeEngine
+from flytekit.core.value_summary import LazySummary
 from flytekit.loggers import logger
 from flytekit.models import dynamic_job as _dynamic_job
 from flytekit.models import interface as _interface_models
@@ -210,6 +210,13 @@ class Task(object):
         """
         return None
 
+    @property
+    def _input_plan(self) -> Optional[ConversionPlan]:
+        """
+        The conversion plan for the inputs of this task, if it has python native types for them.
+        """
+        return None
+
     def _dispatch_execute(
         self, ctx: FlyteContext, task_name: str, input_literal_map: _literal_models.LiteralMap, cache_version: str
     ) -> Union[_literal_models.LiteralMap, _dynamic_job.DynamicJobSpec]:
@@ -236,6 +243,7 @@ class Task(object):
             incoming_values=kwargs,
             flyte_interface_types=self.interface.inputs,
             native_types=self.get_input_types(),
+            plan=self._input_plan,
         )
         input_literal_map = _literal_models.LiteralMap(literals=kwargs)
 
@@ -369,6 +377,8 @@ class PythonTask(TrackedInstance, Task, Generic[T]):
         self._python_interface = interface if interface else Interface()
         self._environment = environment if environment else {}
         self._task_config = task_config
+        self._input_conversion_plan: Optional[ConversionPlan] = None
+        self._output_conversion_plan: Optional[ConversionPlan] = None
 
     # TODO lets call this interface and the other as flyte_interface?
     @property
@@ -394,6 +404,10 @@ class PythonTask(TrackedInstance, Task, Generic[T]):
     def get_type_for_output_var(self, k: str, v: Any) -> Optional[Type[Any]]:
         """
         Returns the python type for the specified output variable by name.
+
+        :py:meth:`dispatch_execute` resolves the types of all outputs once, when it builds its conversion plan, and
+        calls this with ``v=None``. Overrides must therefore derive the type from ``k`` (and the interface) alone, not
+        from the value.
         """
         return self._python_interface.outputs[k]
 
@@ -424,6 +438,32 @@ class PythonTask(TrackedInstance, Task, Generic[T]):
     def _outputs_interface(self) -> Dict[Any, Variable]:
         return self.interface.outputs
 
+    @property
+    def _input_plan(self) -> ConversionPlan:
+        """
+        The conversion plan for the inputs of this task. It is built on first use and rebuilt only if the interface
+        of the task is replaced.
+        """
+        variables = self.interface.inputs
+        plan = self._input_conversion_plan
+        if plan is None or plan.variables is not variables:
+            plan = self._input_conversion_plan = ConversionPlan(variables, self.python_interface.inputs)
+        return plan
+
+    @property
+    def _output_plan(self) -> ConversionPlan:
+        """
+        The conversion plan for the outputs that :py:meth:`dispatch_execute` produces, built from
+        ``_outputs_interface`` and :py:meth:`get_type_for_output_var`, which is called without a value. It is
+        rebuilt whenever ``_outputs_interface`` returns another dict.
+        """
+        variables = self._outputs_interface
+        plan = self._output_conversion_plan
+        if plan is None or plan.variables is not variables:
+            python_types = {k: self.get_type_for_output_var(k, None) for k in variables}
+            plan = self._output_conversion_plan = ConversionPlan(variables, python_types)
+        return plan
+
     def dispatch_execute(
         self, ctx: FlyteContext, input_literal_map: _literal_models.LiteralMap
     ) -> Union[_literal_models.LiteralMap, _dynamic_job.DynamicJobSpec]:
@@ -446,18 +486,18 @@ class PythonTask(TrackedInstance, Task, Generic[T]):
         ) as exec_ctx:
             # TODO We could support default values here too - but not part of the plan right now
             # Translate the input literals to Python native
-            native_inputs = TypeEngine.literal_map_to_kwargs(exec_ctx, input_literal_map, self.python_interface.inputs)
+            native_inputs = self._input_plan.literal_map_to_kwargs(exec_ctx, input_literal_map)
 
             # TODO: Logger should auto inject the current context information to indicate if the task is running within
             #   a workflow or a subworkflow etc
-            logger.info(f"Invoking {self.name} with inputs: {native_inputs}")
+            logger.info("Invoking %s with inputs: %s", self.name, LazySummary(native_inputs))
             try:
                 native_outputs = self.execute(**native_inputs)
             except Exception as e:
                 logger.exception(f"Exception when executing {e}")
                 raise e
 
-            logger.info(f"Task executed successfully in user level, outputs: {native_outputs}")
+            logger.info("Task executed successfully in user level, outputs: %s", LazySummary(native_outputs))
             # Lets run the post_execute method. This may result in a IgnoreOutputs Exception, which is
             # bubbled up to be handled at the callee layer.
             native_outputs = self.post_execute(new_user_params, native_outputs)
@@ -469,7 +509,8 @@ class PythonTask(TrackedInstance, Task, Generic[T]):
             ):
                 return native_outputs
 
-            expected_output_names = list(self._outputs_interface.keys())
+            output_plan = self._output_plan
+            expected_output_names = output_plan.names
             if len(expected_output_names) == 1:
                 # Here we have to handle the fact that the task could've been declared with a typing.NamedTuple of
                 # length one. That convention is used for naming outputs - and single-length-NamedTuples are
@@ -490,13 +531,14 @@ class PythonTask(TrackedInstance, Task, Generic[T]):
             # built into the IDL that all the values of a literal map are of the same type.
             literals = {}
             for k, v in native_outputs_as_map.items():
-                literal_type = self._outputs_interface[k].type
-                py_type = self.get_type_for_output_var(k, v)
+                c = output_plan[k]
 
                 if isinstance(v, tuple):
-                    raise AssertionError(f"Output({k}) in task{self.name} received a tuple {v}, instead of {py_type}")
+                    raise AssertionError(
+                        f"Output({k}) in task{self.name} received a tuple {v}, instead of {c.python_type}"
+                    )
                 try:
-                    literals[k] = TypeEngine.to_literal(exec_ctx, v, py_type, literal_type)
+                    literals[k] = c.transformer.to_literal(exec_ctx, v, c.python_type, c.literal_type)
                 except Exception as e:
                     raise AssertionError(f"failed to convert return value for var {k} with error {type(e)}: {e}") from e
 
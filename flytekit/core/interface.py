@@ -13,9 +13,11 @@ from docstring_parser.common import Docstring
 from flytekit.common.exceptions.user import FlyteValidationException
 from flytekit.core import context_manager
 from flytekit.core.docstring import param_metadata_from_docstring, returns_metadata_from_docstring
-from flytekit.core.type_engine import TypeEngine
+from flytekit.core.type_engine import TypeEngine, TypeTransformer
 from flytekit.loggers import logger
 from flytekit.models import interface as _interface_models
+from flytekit.models import literals as _literal_models
+from flytekit.models import types as _type_models
 
 
 class Interface(object):
@@ -218,6 +220,80 @@ def transform_interface_to_typed_interface(
     return _interface_models.TypedInterface(inputs_map, outputs_map)
 
 
+class VariableConversion(typing.NamedTuple):
+    """
+    How a single interface variable is converted between python values and literals.
+    """
+
+    name: str
+    python_type: Type
+    literal_type: _type_models.LiteralType
+    transformer: TypeTransformer
+
+
+class ConversionPlan(object):
+    """
+    The resolved transformer, literal type and python type of every variable on one side of an interface. Entities
+    build their plans once and reuse them for every call instead of looking the transformers up for each value.
+    """
+
+    def __init__(self, variables: Dict[str, _interface_models.Variable], python_types: Dict[str, Type]):
+        """
+        :param variables: The variables of one side of a ``TypedInterface``
+        :param python_types: The python types of the same variables
+        """
+        self._variables = variables
+        self._names = tuple(variables.keys())
+        self._conversions = {
+            k: VariableConversion(k, python_types[k], v.type, TypeEngine.get_transformer(python_types[k]))
+            for k, v in variables.items()
+        }
+        self._python_types = {k: c.python_type for k, c in self._conversions.items()}
+
+    @property
+    def variables(self) -> Dict[str, _interface_models.Variable]:
+        """
+        The variables this plan was built from.
+        """
+        return self._variables
+
+    @property
+    def names(self) -> Tuple[str, ...]:
+        return self._names
+
+    @property
+    def python_types(self) -> Dict[str, Type]:
+        # Copied so that callers can't change the plan
+        return dict(self._python_types)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._conversions
+
+    def __getitem__(self, name: str) -> VariableConversion:
+        return self._conversions[name]
+
+    def __iter__(self):
+        return iter(self._conversions.values())
+
+    def literal_map_to_kwargs(
+        self, ctx: context_manager.FlyteContext, lm: _literal_models.LiteralMap
+    ) -> Dict[str, Any]:
+        """
+        Same as :py:meth:`TypeEngine.literal_map_to_kwargs` for the variables of this plan.
+        """
+        if len(lm.literals) != len(self._names):
+            raise ValueError(
+                f"Received more input values {len(lm.literals)}" f" than allowed by the input spec {len(self._names)}"
+            )
+        return {
+            c.name: c.transformer.to_python_value(ctx, lm.literals[c.name], c.python_type)
+            for c in self._conversions.values()
+        }
+
+
 def transform_types_to_list_of_type(m: Dict[str, type]) -> Dict[str, type]:
     """
     Converts a given variables to be collections of their type. This is useful for array jobs / map style code.
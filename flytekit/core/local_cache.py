@@ -1,6 +1,7 @@
-from typing import Callable, List, Optional
+from typing import TYPE_CHECKING, Callable, List, Optional
 
-from joblib import Memory
+if TYPE_CHECKING:
+    from joblib import Memory
 
 # Location in the file system where serialized objects will be stored
 # TODO: read from config
@@ -10,11 +11,14 @@ CACHE_VERBOSITY = 5
 
 
 class LocalCache(object):
-    _memory: Memory
+    _memory: "Memory"
     _initialized: bool = False
 
     @staticmethod
     def initialize():
+        # joblib (and numpy with it) is only needed when local caching is actually used, keep it off the import path
+        from joblib import Memory
+
         LocalCache._memory = Memory(CACHE_LOCATION, verbose=CACHE_VERBOSITY)
         LocalCache._initialized = True
 
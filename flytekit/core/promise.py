@@ -14,7 +14,7 @@ from flytekit.core import context_manager as _flyte_context
 from flytekit.core import interface as flyte_interface
 from flytekit.core import type_engine
 from flytekit.core.context_manager import BranchEvalMode, ExecutionState, FlyteContext, FlyteContextManager
-from flytekit.core.interface import Interface
+from flytekit.core.interface import ConversionPlan, Interface
 from flytekit.core.node import Node
 from flytekit.core.type_engine import DataclassTransformer, DictTransformer, ListTransformer, TypeEngine
 from flytekit.models import interface as _interface_models
@@ -33,6 +33,7 @@ def translate_inputs_to_literals(
     incoming_values: Dict[str, Any],
     flyte_interface_types: Dict[str, _interface_models.Variable],
     native_types: Dict[str, type],
+    plan: Optional[ConversionPlan] = None,
 ) -> Dict[str, _literal_models.Literal]:
     """
     The point of this function is to extract out Literals from a collection of either Python native values (which would
@@ -64,15 +65,26 @@ def translate_inputs_to_literals(
     :param incoming_values: This is a map of your task's input or wf's output kwargs basically
     :param flyte_interface_types: One side of an :py:class:`flytekit.models.interface.TypedInterface` basically.
     :param native_types: Map to native Python type.
+    :param plan: The conversion plan of ``flyte_interface_types``, if the caller has one. Plain native values are then
+        converted by their variable's transformer directly.
     """
 
     def extract_value(
         ctx: FlyteContext, input_val: Any, val_type: type, flyte_literal_type: _type_models.LiteralType
     ) -> _literal_models.Literal:
         if flyte_literal_type.sum is not None:
-            for s in flyte_literal_type.sum.summands:
+            if isinstance(input_val, Promise):
+                return input_val.val
+            if getattr(val_type, "__origin__", None) is Union:
+                # Try the variants that match the value first, each only once
+                plan = TypeEngine.get_transformer(val_type).plan(val_type)
+                summands = plan.summands(flyte_literal_type)
+                candidates = [(plan.variants[i], summands[i]) for i in plan.for_value(input_val) if summands[i]]
+            else:
+                candidates = [(val_type, s) for s in flyte_literal_type.sum.summands]
+            for t, s in candidates:
                 try:
-                    return extract_value(ctx, input_val, val_type, s)
+                    return extract_value(ctx, input_val, t, s)
                 except:
                     continue
             raise Exception(f"Could not extract value for sum type: '{flyte_literal_type}' from '{input_val}'")
@@ -91,13 +103,10 @@ def translate_inputs_to_literals(
             literals = [extract_value(ctx, v, sub_type, flyte_literal_type.collection_type) for v in input_val]
             return _literal_models.Literal(collection=_literal_models.LiteralCollection(literals=literals))
         elif isinstance(input_val, dict):
-            if (
-                flyte_literal_type.map_value_type is None
-                and flyte_literal_type.simple != _type_models.SimpleType.STRUCT
-            ):
+            if flyte_literal_type.map_value_type is None and not DictTransformer.is_untyped(flyte_literal_type):
                 raise Exception(f"Not a map type {flyte_literal_type} but got a map {input_val}")
             k_type, sub_type = DictTransformer.get_dict_types(val_type)
-            if flyte_literal_type.simple == _type_models.SimpleType.STRUCT:
+            if DictTransformer.is_untyped(flyte_literal_type):
                 return TypeEngine.to_literal(ctx, input_val, type(input_val), flyte_literal_type)
             else:
                 literals = {
@@ -122,11 +131,16 @@ def translate_inputs_to_literals(
             if flyte_literal_type.record is None:
                 raise Exception(f"Got a dataclass for a non-record type: '{input_val}' expected '{flyte_literal_type}'")
 
+            # Only fields that may hold promises need the walk, everything else goes straight to its transformer
+            codec = TypeEngine._DATACLASS_TRANSFORMER.codec(type(input_val))
             res = {}
-            for f in dataclasses.fields(input_val):
-                res[f.name] = extract_value(
-                    ctx, getattr(input_val, f.name), f.type, flyte_literal_type.record.field_types[f.name]
-                )
+            for name, t, transformer in zip(codec.names, codec.types, codec.transformers):
+                v = getattr(input_val, name)
+                lt = flyte_literal_type.record.field_types[name]
+                if v is None or isinstance(v, (Promise, VoidPromise, list, dict, tuple)) or dataclasses.is_dataclass(v):
+                    res[name] = extract_value(ctx, v, t, lt)
+                else:
+                    res[name] = transformer.to_literal(ctx, v, t, lt)
 
             return _literal_models.Literal(record=_literal_models.Record(fields=res))
         else:
@@ -137,6 +151,22 @@ def translate_inputs_to_literals(
         raise ValueError("Incoming values cannot be None, must be a dict")
 
     result = {}  # So as to not overwrite the input_kwargs
+    if plan is not None:
+        for k, v in incoming_values.items():
+            if k not in plan:
+                raise ValueError(f"Received unexpected keyword argument {k}")
+            c = plan[k]
+            if (
+                c.literal_type.sum is not None
+                or v is None
+                or isinstance(v, (Promise, VoidPromise, list, dict, tuple))
+                or dataclasses.is_dataclass(v)
+            ):
+                result[k] = extract_value(ctx, v, c.python_type, c.literal_type)
+            else:
+                result[k] = c.transformer.to_literal(ctx, v, c.python_type, c.literal_type)
+        return result
+
     for k, v in incoming_values.items():
         if k not in flyte_interface_types:
             raise ValueError(f"Received unexpected keyword argument {k}")
@@ -452,12 +482,17 @@ class Promise(object):
 
 
 def create_native_named_tuple(
-    ctx: FlyteContext, promises: Union[Promise, typing.List[Promise]], entity_interface: Interface
+    ctx: FlyteContext,
+    promises: Union[Promise, typing.List[Promise]],
+    entity_interface: Interface,
+    plan: Optional[ConversionPlan] = None,
 ) -> Optional[Tuple]:
     """
     Creates and returns a Named tuple with all variables that match the expected named outputs. this makes
     it possible to run things locally and expect a more native behavior, i.e. address elements of a named tuple
     by name.
+
+    :param plan: The conversion plan of the entity's outputs, if it has one
     """
     if entity_interface is None:
         raise ValueError("Interface of the entity is required to generate named outputs")
@@ -466,6 +501,9 @@ def create_native_named_tuple(
         return None
 
     if isinstance(promises, Promise):
+        if plan is not None:
+            c = plan[plan.names[0]]
+            return c.transformer.to_python_value(ctx, promises.val, c.python_type)
         v = [v for k, v in entity_interface.outputs.items()][0]  # get output native type
         return TypeEngine.to_python_value(ctx, promises.val, v)
 
@@ -483,7 +521,11 @@ def create_native_named_tuple(
                 "Workflow outputs can only be promises that are returned by tasks. Found a value of"
                 f"type {type(p)}. Workflows cannot return local variables or constants."
             )
-        outputs[p.var] = TypeEngine.to_python_value(ctx, p.val, entity_interface.outputs[p.var])
+        if plan is not None:
+            c = plan[p.var]
+            outputs[p.var] = c.transformer.to_python_value(ctx, p.val, c.python_type)
+        else:
+            outputs[p.var] = TypeEngine.to_python_value(ctx, p.val, entity_interface.outputs[p.var])
 
     # Should this class be part of the Interface?
     t = collections.namedtuple(named_tuple_name, list(outputs.keys()))
@@ -597,15 +639,12 @@ def binding_data_from_python_std(
         return _literal_models.BindingData(record=_literal_models.BindingRecord(fields=fields))
 
     elif isinstance(t_value, dict):
-        if (
-            expected_literal_type.map_value_type is None
-            and expected_literal_type.simple != _type_models.SimpleType.STRUCT
-        ):
+        if expected_literal_type.map_value_type is None and not DictTransformer.is_untyped(expected_literal_type):
             raise AssertionError(
                 f"this should be a Dictionary type and it is not: {type(t_value)} vs {expected_literal_type}"
             )
         k_type, v_type = DictTransformer.get_dict_types(t_value_type)
-        if expected_literal_type.simple == _type_models.SimpleType.STRUCT:
+        if DictTransformer.is_untyped(expected_literal_type):
             lit = TypeEngine.to_literal(ctx, t_value, type(t_value), expected_literal_type)
             return _literals_models.BindingData(scalar=lit.scalar)
         else:
@@ -631,21 +670,14 @@ def binding_data_from_python_std(
                 f"Expected type is not a sum type: '{expected_literal_type}' (python type '{t_value_type}')"
             )
 
-        for t in t_value_type.__args__:
+        plan = TypeEngine.get_transformer(t_value_type).plan(t_value_type)
+        summands = plan.summands(expected_literal_type)
+        # Promises match no variant by type and are tried in the declared order
+        for i in plan.for_value(t_value):
+            if summands[i] is None:
+                continue
             try:
-                typ = None
-                ltyp = TypeEngine.to_literal_type(t)
-                for (
-                    s
-                ) in expected_literal_type.sum.summands:  # todo(maximsmol): O(n^2) algo, not sure if Type is hashable
-                    if ltyp != s:
-                        continue
-                    typ = s
-
-                if typ is None:
-                    continue
-
-                return binding_data_from_python_std(ctx, typ, t_value, t)
+                return binding_data_from_python_std(ctx, summands[i], t_value, plan.variants[i])
             except ValueError as e:
                 if "not supported" not in str(e):
                     raise e
@@ -913,6 +945,8 @@ def flyte_entity_call_handler(entity: Union[SupportsNodeCreation, LocallyExecuta
             )
         ) as child_ctx:
             result = entity.local_execute(child_ctx, **kwargs)
+            # Tasks and workflows keep a conversion plan for their outputs, read it in the mode they were executed in
+            output_plan = getattr(entity, "_output_plan", None)
 
         expected_outputs = len(entity.python_interface.outputs)
         if expected_outputs == 0:
@@ -922,7 +956,7 @@ def flyte_entity_call_handler(entity: Union[SupportsNodeCreation, LocallyExecuta
                 raise Exception(f"Workflow local execution expected 0 outputs but something received {result}")
 
         if (1 < expected_outputs == len(result)) or (result is not None and expected_outputs == 1):
-            return create_native_named_tuple(ctx, result, entity.python_interface)
+            return create_native_named_tuple(ctx, result, entity.python_interface, plan=output_plan)
 
         raise ValueError(
             f"Expected outputs and actual outputs do not match. Result {result}. "
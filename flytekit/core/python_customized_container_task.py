@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+import functools
+import hashlib
 import os
+import shutil
+import tempfile
+import threading
 from typing import Any, Dict, List, Optional, Type, TypeVar
 
 from flyteidl.core import tasks_pb2 as _tasks_pb2
 
 from flytekit.common import utils as common_utils
 from flytekit.common.tasks.raw_container import _get_container_definition
+from flytekit.configuration import sdk as _sdk_config
 from flytekit.core.base_task import PythonTask, Task, TaskResolverMixin
 from flytekit.core.context_manager import FlyteContext, Image, ImageConfig, SerializationSettings
 from flytekit.core.resources import Resources, ResourceSpec
@@ -196,6 +202,31 @@ class PythonCustomizedContainerTask(ExecutableTemplateShimTask, PythonTask[TC]):
         return obj
 
 
+@functools.lru_cache()
+def _load_executor_class(path: str) -> Type[ShimTaskExecutor]:
+    return load_object_from_module(path)
+
+
+def _fetch_cached_template(ctx: FlyteContext, template_path: str, cache_dir: str) -> str:
+    """
+    Returns the path of a copy of the template in ``cache_dir``, downloading it first if it isn't there yet.
+    """
+    cached = os.path.join(cache_dir, hashlib.sha256(template_path.encode("utf-8")).hexdigest() + ".pb")
+    if os.path.exists(cached):
+        return cached
+
+    # Download next to the final location and rename, so that concurrent tasks never read a partial file
+    os.makedirs(cache_dir, exist_ok=True)
+    partial = tempfile.mkdtemp(suffix=".partial", dir=cache_dir)
+    try:
+        local_path = os.path.join(partial, "task_template.pb")
+        ctx.file_access.get_data(template_path, local_path)
+        os.replace(local_path, cached)
+    finally:
+        shutil.rmtree(partial, ignore_errors=True)
+    return cached
+
+
 class TaskTemplateResolver(TrackedInstance, TaskResolverMixin):
     """
     This is a special resolver that resolves the task above at execution time, using only the ``TaskTemplate``,
@@ -217,10 +248,16 @@ class TaskTemplateResolver(TrackedInstance, TaskResolverMixin):
       executor. The strings will be ``["{{.taskTemplatePath}}", "path.to.your.executor"]``
 
     Also, ``get_all_tasks`` will always return an empty list, at least for now.
+
+    Templates never change once they are registered, so loaded templates are kept in memory by their path, and if
+    ``sdk.task_template_cache_dir`` is configured the downloaded files are shared through that directory by all the
+    containers on a node. Every task that is loaded gets its own copy of the template, executors may modify it.
     """
 
     def __init__(self):
         super(TaskTemplateResolver, self).__init__()
+        self._templates: Dict[str, _tasks_pb2.TaskTemplate] = {}
+        self._templates_lock = threading.Lock()
 
     def name(self) -> str:
         return "task template resolver"
@@ -229,14 +266,28 @@ class TaskTemplateResolver(TrackedInstance, TaskResolverMixin):
     # sense for ExecutableTemplateShimTask to inherit from Task.
     def load_task(self, loader_args: List[str]) -> ExecutableTemplateShimTask:
         logger.info(f"Task template loader args: {loader_args}")
+        task_template_model = self._load_template(loader_args[0])
+        executor_class = _load_executor_class(loader_args[1])
+        return ExecutableTemplateShimTask(task_template_model, executor_class)
+
+    def _load_template(self, template_path: str) -> _task_model.TaskTemplate:
+        with self._templates_lock:
+            task_template_proto = self._templates.get(template_path)
+        if task_template_proto is not None:
+            return _task_model.TaskTemplate.from_flyte_idl(task_template_proto)
+
         ctx = FlyteContext.current_context()
-        task_template_local_path = os.path.join(ctx.execution_state.working_dir, "task_template.pb")
-        ctx.file_access.get_data(loader_args[0], task_template_local_path)
+        cache_dir = _sdk_config.TASK_TEMPLATE_CACHE_DIR.get()
+        if cache_dir:
+            task_template_local_path = _fetch_cached_template(ctx, template_path, cache_dir)
+        else:
+            task_template_local_path = os.path.join(ctx.execution_state.working_dir, "task_template.pb")
+            ctx.file_access.get_data(template_path, task_template_local_path)
         task_template_proto = common_utils.load_proto_from_file(_tasks_pb2.TaskTemplate, task_template_local_path)
-        task_template_model = _task_model.TaskTemplate.from_flyte_idl(task_template_proto)
 
-        executor_class = load_object_from_module(loader_args[1])
-        return ExecutableTemplateShimTask(task_template_model, executor_class)
+        with self._templates_lock:
+            self._templates[template_path] = task_template_proto
+        return _task_model.TaskTemplate.from_flyte_idl(task_template_proto)
 
     def loader_args(self, settings: SerializationSettings, t: PythonCustomizedContainerTask) -> List[str]:
         return ["{{.taskTemplatePath}}", f"{t.executor_type.__module__}.{t.executor_type.__name__}"]
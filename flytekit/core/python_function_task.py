@@ -202,8 +202,10 @@ class PythonFunctionTask(PythonAutoContainerTask[T]):
                     }
                 )
 
-            # Gather underlying TaskTemplates that get referenced.
+            # Gather underlying TaskTemplates that get referenced. Distinct task objects can serialize to the same
+            # template (e.g. map_task called on the same task twice), which only needs to be sent once.
             tts = []
+            tt_ids = set()
             for entity, model in model_entities.items():
                 # We only care about gathering tasks here. Launch plans are handled by
                 # propeller. Subworkflows should already be in the workflow spec.
@@ -223,6 +225,9 @@ class PythonFunctionTask(PythonAutoContainerTask[T]):
 
                 # Store the valid task template so that we can pass it to the
                 # DynamicJobSpec later
+                if model.template.id in tt_ids:
+                    continue
+                tt_ids.add(model.template.id)
                 tts.append(model.template)
 
             if ctx.serialization_settings.should_fast_serialize():
@@ -13,6 +13,7 @@ from flytekit.core.promise import (
     translate_inputs_to_literals,
 )
 from flytekit.core.type_engine import TypeEngine
+from flytekit.core.value_summary import LazySummary
 from flytekit.loggers import logger
 from flytekit.models import dynamic_job as _dynamic_job
 from flytekit.models import interface as _interface_models
@@ -113,13 +114,13 @@ class ReferenceEntity(object):
         # Translate the input literals to Python native
         native_inputs = TypeEngine.literal_map_to_kwargs(ctx, input_literal_map, self.python_interface.inputs)
 
-        logger.info(f"Invoking {self.name} with inputs: {native_inputs}")
+        logger.info("Invoking %s with inputs: %s", self.name, LazySummary(native_inputs))
         try:
             native_outputs = self.execute(**native_inputs)
         except Exception as e:
             logger.exception(f"Exception when executing {e}")
             raise e
-        logger.info(f"Task executed successfully in user level, outputs: {native_outputs}")
+        logger.info("Task executed successfully in user level, outputs: %s", LazySummary(native_outputs))
 
         expected_output_names = list(self.python_interface.outputs.keys())
         if len(expected_output_names) == 1:
@@ -5,6 +5,7 @@ from typing import Any, Generic, Type, TypeVar, Union
 from flytekit import ExecutionParameters, FlyteContext, FlyteContextManager, logger
 from flytekit.core.tracker import TrackedInstance
 from flytekit.core.type_engine import TypeEngine
+from flytekit.core.value_summary import LazySummary
 from flytekit.models import dynamic_job as _dynamic_job
 from flytekit.models import literals as _literal_models
 from flytekit.models import task as _task_model
@@ -90,14 +91,16 @@ class ExecutableTemplateShimTask(object):
             guessed_python_input_types = TypeEngine.guess_python_types(self.task_template.interface.inputs)
             native_inputs = TypeEngine.literal_map_to_kwargs(exec_ctx, input_literal_map, guessed_python_input_types)
 
-            logger.info(f"Invoking FlyteTask executor {self.task_template.id.name} with inputs: {native_inputs}")
+            logger.info(
+                "Invoking FlyteTask executor %s with inputs: %s", self.task_template.id.name, LazySummary(native_inputs)
+            )
             try:
                 native_outputs = self.execute(**native_inputs)
             except Exception as e:
                 logger.exception(f"Exception when executing {e}")
                 raise e
 
-            logger.info(f"Task executed successfully in user level, outputs: {native_outputs}")
+            logger.info("Task executed successfully in user level, outputs: %s", LazySummary(native_outputs))
             # Lets run the post_execute method. This may result in a IgnoreOutputs Exception, which is
             # bubbled up to be handled at the callee layer.
             native_outputs = self.post_execute(new_user_params, native_outputs)
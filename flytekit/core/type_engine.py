@@ -3,6 +3,7 @@ from __future__ import annotations
 import dataclasses
 import datetime as _datetime
 import enum
+import importlib
 import inspect
 import json as _json
 import mimetypes
@@ -19,6 +20,7 @@ from google.protobuf.json_format import ParseDict as _ParseDict
 from google.protobuf.struct_pb2 import Struct
 
 from flytekit.common.types import primitives as _primitives
+from flytekit.configuration import sdk as _sdk_config
 from flytekit.core.context_manager import FlyteContext
 from flytekit.core.with_metadata import FlyteMetadata
 from flytekit.loggers import logger
@@ -26,6 +28,7 @@ from flytekit.models import interface as _interface_models
 from flytekit.models import types as _type_models
 from flytekit.models.core import types as _core_types
 from flytekit.models.literals import (
+    Binary,
     Blob,
     BlobMetadata,
     Literal,
@@ -176,6 +179,78 @@ class RestrictedType(TypeTransformer[T], ABC):
         raise RestrictedTypeError(f"Transformer for type {self.python_type} is restricted currently")
 
 
+class _DataclassCodec(object):
+    """
+    Converts instances of one dataclass to and from record literals. The fields, their transformers and their literal
+    types are resolved once, when the codec is built, instead of for every value.
+    """
+
+    def __init__(self, t: Type):
+        self.python_type = t
+        self.fields = dataclasses.fields(t)
+        self.names = [f.name for f in self.fields]
+        self.types = [f.type for f in self.fields]
+        self.transformers = [TypeEngine.get_transformer(f.type) for f in self.fields]
+        self.field_literal_types = [TypeEngine.to_literal_type(f.type) for f in self.fields]
+        self.literal_type = LiteralType(
+            record=_type_models.RecordType(field_types=dict(zip(self.names, self.field_literal_types)))
+        )
+
+    def _field_literal_types(self, expected: LiteralType) -> typing.List[LiteralType]:
+        if expected is self.literal_type:
+            return self.field_literal_types
+        if expected.record is None:
+            raise AssertionError(f"Expected type is not a record: '{expected}'")
+        return [expected.record.field_types[name] for name in self.names]
+
+    def _check_type(self, python_val: typing.Any):
+        if type(python_val) is self.python_type:
+            return
+        if not dataclasses.is_dataclass(python_val):
+            raise AssertionError(
+                f"{type(python_val)} is not of type @dataclass, only Dataclasses are supported for "
+                f"user defined datatypes in Flytekit"
+            )
+        if dataclasses.fields(python_val) != self.fields:
+            raise AssertionError(
+                f"Dataclass does not matched requested type: '{type(python_val)}' != '{self.python_type}'"
+            )
+
+    def encode(self, ctx: FlyteContext, python_val: typing.Any, expected: LiteralType) -> Literal:
+        return self.encode_many(ctx, [python_val], expected)[0]
+
+    def encode_many(
+        self, ctx: FlyteContext, python_vals: typing.Iterable, expected: LiteralType
+    ) -> typing.List[Literal]:
+        field_lts = self._field_literal_types(expected)
+        fields = list(zip(self.names, self.types, self.transformers, field_lts))
+        check = self._check_type
+        res = []
+        for v in python_vals:
+            check(v)
+            res.append(Literal(record=Record({n: tf.to_literal(ctx, getattr(v, n), t, lt) for n, t, tf, lt in fields})))
+        return res
+
+    def decode(self, ctx: FlyteContext, lv: Literal) -> typing.Any:
+        return self.decode_many(ctx, [lv])[0]
+
+    def decode_many(self, ctx: FlyteContext, lvs: typing.Iterable[Literal]) -> typing.List[typing.Any]:
+        fields = list(zip(self.names, self.types, self.transformers))
+        cls = self.python_type
+        res = []
+        for lv in lvs:
+            if lv.record is None:
+                raise AssertionError(f"Provided literal is not a record: '{lv}'")
+            record_fields = lv.record.fields
+            kwargs = {}
+            for n, t, tf in fields:
+                if n not in record_fields:
+                    raise AssertionError(f"Literal is missing a field: '{n}'")
+                kwargs[n] = tf.to_python_value(ctx, record_fields[n], t)
+            res.append(cls(**kwargs))
+        return res
+
+
 class DataclassTransformer(TypeTransformer[object]):
     """
     The Dataclass Transformer, provides a type transformer for arbitrary Python dataclasses, that have
@@ -184,17 +259,29 @@ class DataclassTransformer(TypeTransformer[object]):
 
     def __init__(self):
         super().__init__("Object-Dataclass-Transformer", object)
+        self._codecs: typing.Dict[Type, _DataclassCodec] = {}
+
+    def codec(self, t: Type) -> _DataclassCodec:
+        """
+        Returns the codec of the dataclass, it is built on first use.
+        """
+        c = self._codecs.get(t)
+        if c is None:
+            if not dataclasses.is_dataclass(t):
+                raise AssertionError(
+                    f"{t} is not of type @dataclass, only Dataclasses are supported for "
+                    f"user defined datatypes in Flytekit"
+                )
+            c = _DataclassCodec(t)
+            self._codecs[t] = c
+        return c
 
     def get_literal_type(self, t: Type[T]) -> LiteralType:
         """
         Extracts the Literal type definition for a Dataclass and returns a type Struct.
         If possible also extracts the JSONSchema for the dataclass.
         """
-        fields = {}
-        for f in dataclasses.fields(t):
-            fields[f.name] = TypeEngine.to_literal_type(f.type)
-
-        return LiteralType(record=_type_models.RecordType(field_types=fields))
+        return self.codec(t).literal_type
 
     def to_literal(self, ctx: FlyteContext, python_val: T, python_type: Type[T], expected: LiteralType) -> Literal:
         if not dataclasses.is_dataclass(python_val):
@@ -202,90 +289,208 @@ class DataclassTransformer(TypeTransformer[object]):
                 f"{type(python_val)} is not of type @dataclass, only Dataclasses are supported for "
                 f"user defined datatypes in Flytekit"
             )
+        return self.codec(python_type).encode(ctx, python_val, expected)
 
-        if dataclasses.fields(python_val) != dataclasses.fields(python_type):
-            raise AssertionError(f"Dataclass does not matched requested type: '{type(python_val)}' != '{python_type}'")
+    def to_python_value(self, ctx: FlyteContext, lv: Literal, expected_python_type: Type[T]) -> T:
+        return self.codec(expected_python_type).decode(ctx, lv)
 
-        if expected.record is None:
-            raise AssertionError(f"Expected type is not a record: '{expected}'")
 
-        res = {}
-        for f in dataclasses.fields(python_type):
-            v = getattr(python_val, f.name)
-            res[f.name] = TypeEngine.to_literal(ctx, v, f.type, expected.record.field_types[f.name])
+_SIMPLE_TYPE_KINDS = {
+    SimpleType.NONE: "none",
+    SimpleType.INTEGER: "integer",
+    SimpleType.FLOAT: "float",
+    SimpleType.STRING: "string",
+    SimpleType.BOOLEAN: "boolean",
+    SimpleType.DATETIME: "datetime",
+    SimpleType.DURATION: "duration",
+    SimpleType.BINARY: "binary",
+    SimpleType.ERROR: "error",
+    SimpleType.STRUCT: "generic",
+}
 
-        return Literal(record=Record(res))
 
-    def to_python_value(self, ctx: FlyteContext, lv: Literal, expected_python_type: Type[T]) -> T:
-        if not dataclasses.is_dataclass(expected_python_type):
-            raise AssertionError(
-                f"{expected_python_type} is not of type @dataclass, only Dataclasses are supported for "
-                f"user defined datatypes in Flytekit"
-            )
+def _literal_type_kind(lt: LiteralType) -> typing.Optional[str]:
+    """
+    The kind of literal that values of the literal type are represented as, None if it can't be told from the type.
+    """
+    if lt.simple is not None:
+        return _SIMPLE_TYPE_KINDS.get(lt.simple)
+    if lt.blob is not None:
+        return "blob"
+    if lt.schema is not None:
+        return "schema"
+    if lt.collection_type is not None:
+        return "collection"
+    if lt.map_value_type is not None:
+        return "map"
+    if lt.enum_type is not None:
+        return "string"
+    return None
+
+
+def _literal_kind(lv: Literal) -> typing.Optional[str]:
+    if lv.collection is not None:
+        return "collection"
+    if lv.map is not None:
+        return "map"
+    s = lv.scalar
+    if s is None:
+        return None
+    if s.primitive is not None:
+        p = s.primitive
+        for kind, v in (
+            ("integer", p.integer),
+            ("float", p.float_value),
+            ("string", p.string_value),
+            ("boolean", p.boolean),
+            ("datetime", p.datetime),
+            ("duration", p.duration),
+        ):
+            if v is not None:
+                return kind
+        return None
+    if s.none_type is not None:
+        return "none"
+    if s.blob is not None:
+        return "blob"
+    if s.schema is not None:
+        return "schema"
+    if s.generic is not None:
+        return "generic"
+    if s.binary is not None:
+        return "binary"
+    if s.error is not None:
+        return "error"
+    return None
+
+
+class _UnionPlan(object):
+    """
+    The variants of one Union type and their literal types, computed once. Variants are picked by the runtime type of
+    a value or the kind of a literal. The order in which to try the variants is cached for every runtime type and
+    literal kind, with the variant that last succeeded first, so converting a value normally takes a single attempt.
+    """
+
+    def __init__(self, python_type: Type):
+        self.variants = list(python_type.__args__)
+        self.literal_types = [TypeEngine.to_literal_type(t) for t in self.variants]
+        self.literal_type = LiteralType(sum=_type_models.SumType(summands=self.literal_types))
+        self._none_index = next((i for i, t in enumerate(self.variants) if t is type(None)), None)
+        self._kinds = [_literal_type_kind(lt) for lt in self.literal_types]
+        self._by_python_type: typing.Dict[type, typing.List[int]] = {}
+        self._by_literal_kind: typing.Dict[typing.Optional[str], typing.List[int]] = {}
+        # The summands matched to the variants for the last expected type that isn't this Union's own
+        self._last_summands: typing.Optional[typing.Tuple[LiteralType, typing.List[typing.Optional[LiteralType]]]]
+        self._last_summands = None
 
-        if lv.record is None:
-            raise AssertionError(f"Provided literal is not a record: '{lv}'")
+    @staticmethod
+    def _is_instance(t: type, variant: Type) -> bool:
+        origin = getattr(variant, "__origin__", None) or variant
+        return inspect.isclass(origin) and issubclass(t, origin)
+
+    def for_value(self, python_val: typing.Any) -> typing.List[int]:
+        if python_val is None:
+            return [self._none_index] if self._none_index is not None else []
+        t = type(python_val)
+        order = self._by_python_type.get(t)
+        if order is None:
+            others = [i for i in range(len(self.variants)) if i != self._none_index]
+            exact = [i for i in others if self.variants[i] is t]
+            subclass = [i for i in others if i not in exact and self._is_instance(t, self.variants[i])]
+            order = exact + subclass + [i for i in others if i not in exact and i not in subclass]
+            self._by_python_type[t] = order
+        return order
+
+    def for_literal(self, lv: Literal) -> typing.List[int]:
+        kind = _literal_kind(lv)
+        if kind == "none" and self._none_index is not None:
+            return [self._none_index]
+        order = self._by_literal_kind.get(kind)
+        if order is None:
+            others = [i for i in range(len(self.variants)) if i != self._none_index]
+            matching = [i for i in others if self._kinds[i] == kind]
+            unknown = [i for i in others if self._kinds[i] is None]
+            order = matching + unknown + [i for i in others if i not in matching and i not in unknown]
+            self._by_literal_kind[kind] = order
+        return order
+
+    def succeeded(self, python_val: typing.Any, index: int):
+        self._promote(self._by_python_type, type(python_val), index)
+
+    def succeeded_literal(self, lv: Literal, index: int):
+        self._promote(self._by_literal_kind, _literal_kind(lv), index)
 
-        res = {}
-        for f in dataclasses.fields(expected_python_type):
-            if f.name not in lv.record.fields:
-                raise AssertionError(f"Literal is missing a field: '{f.name}'")
-            res[f.name] = TypeEngine.to_python_value(ctx, lv.record.fields[f.name], f.type)
+    @staticmethod
+    def _promote(orders: dict, key: typing.Any, index: int):
+        # Callers may still be iterating the current order, so it's replaced rather than reordered in place
+        order = orders.get(key)
+        if order and order[0] != index:
+            orders[key] = [index] + [i for i in order if i != index]
 
-        return expected_python_type(**res)
+    def summands(self, expected: LiteralType) -> typing.List[typing.Optional[LiteralType]]:
+        """
+        The summand of expected that each variant converts to. Expected is normally the literal type of this very
+        Union, whose summands are in the order of the variants, in which case no literal types need to be compared.
+        Otherwise (e.g. the same variants declared in another order) every variant is matched to an equal summand.
+        """
+        if expected is self.literal_type:
+            return expected.sum.summands
+        last = self._last_summands
+        if last is not None and last[0] is expected:
+            return last[1]
+        summands = [next((s for s in expected.sum.summands if s == lt), None) for lt in self.literal_types]
+        self._last_summands = (expected, summands)
+        return summands
 
 
 class UnionTransformer(TypeTransformer[typing.Union[typing.Any]]):
     def __init__(self):
         super().__init__("Union-Transformer", typing.Union)
+        self._plans: typing.Dict[Type, _UnionPlan] = {}
+
+    def plan(self, t: Type) -> _UnionPlan:
+        p = self._plans.get(t)
+        if p is None:
+            p = _UnionPlan(t)
+            self._plans[t] = p
+        return p
 
     def get_literal_type(self, t: Type[T]) -> LiteralType:
-        summands = [TypeEngine.to_literal_type(x) for x in t.__args__]
-        return LiteralType(sum=_type_models.SumType(summands=summands))
+        return self.plan(t).literal_type
 
     def to_literal(self, ctx: FlyteContext, python_val: T, python_type: Type[T], expected: LiteralType) -> Literal:
         if expected.sum is None:
             raise AssertionError(f"Expected type is not a sum type: '{expected}'")
 
-        typ = None
-        val = None
-        for t in python_type.__args__:
+        plan = self.plan(python_type)
+        summands = plan.summands(expected)
+        # Each variant is attempted at most once, so conversions with side effects (e.g. uploads) never run twice
+        for i in plan.for_value(python_val):
+            if summands[i] is None:
+                continue
             try:
-                ltyp = TypeEngine.to_literal_type(t)
-                for s in expected.sum.summands:  # todo(maximsmol): O(n^2) algo, not sure if Type is hashable
-                    if ltyp != s:
-                        continue
-                    typ = s
-
-                if typ is None:
-                    continue
-
-                if t == type(None) and python_val is not None:
-                    continue
-
-                val = TypeEngine.to_literal(ctx, python_val, t, typ)
-                break
+                val = TypeEngine.to_literal(ctx, python_val, plan.variants[i], summands[i])
             except Exception:
                 continue
+            if val is not None:
+                plan.succeeded(python_val, i)
+                return val
 
-        if val is None or typ is None:
-            raise ValueError(f"Could not find suitable union instantiation: '{python_val}' ('{python_type}')")
-
-        return val
+        raise ValueError(f"Could not find suitable union instantiation: '{python_val}' ('{python_type}')")
 
     def to_python_value(self, ctx: FlyteContext, lv: Literal, expected_python_type: Type[T]) -> T:
-        for x in expected_python_type.__args__:
-
-            void_literal = Literal(scalar=Scalar(none_type=Void()))
-
+        plan = self.plan(expected_python_type)
+        for i in plan.for_literal(lv):
+            x = plan.variants[i]
+            if x is type(None):
+                return None
             try:
                 res = TypeEngine.to_python_value(ctx, lv, x)
-
-                if (res is None and lv == void_literal and x == type(None)) or (res is not None and x != type(None)):
-                    return res
-
             except Exception:
-                pass
+                continue
+            if res is not None:
+                plan.succeeded_literal(lv, i)
+                return res
 
         raise AssertionError(
             f"Provided literal could not be cast to variant type: '{lv}' not one of '{expected_python_type}'"
@@ -297,8 +502,54 @@ class UnionTransformer(TypeTransformer[typing.Union[typing.Any]]):
         raise ValueError(f"Enum transformer cannot reverse {literal_type}")
 
 
+_OFFLOADED_TAG_PREFIX = "offloaded:"
+
+
+def _to_binary_literal(ctx: FlyteContext, data: bytes, tag: str) -> Literal:
+    """
+    Wraps the bytes in a binary literal. Values larger than sdk.binary_offload_threshold_bytes are written to the blob
+    store instead, and the literal holds their uri.
+    """
+    threshold = _sdk_config.BINARY_OFFLOAD_THRESHOLD_BYTES.get()
+    if threshold is None or threshold < 0 or len(data) <= threshold:
+        return Literal(scalar=Scalar(binary=Binary(value=data, tag=tag)))
+
+    local_path = ctx.file_access.get_random_local_path()
+    with open(local_path, "wb") as f:
+        f.write(data)
+    remote_path = ctx.file_access.get_random_remote_path()
+    ctx.file_access.put_data(local_path, remote_path, is_multipart=False)
+    return Literal(scalar=Scalar(binary=Binary(value=remote_path.encode("utf-8"), tag=_OFFLOADED_TAG_PREFIX + tag)))
+
+
+def _from_binary_literal(ctx: FlyteContext, lv: Literal) -> typing.Tuple[bytes, str]:
+    """
+    Returns the bytes held by a binary literal, reading offloaded values back from the blob store, and their tag.
+    """
+    if not (lv and lv.scalar and lv.scalar.binary is not None):
+        raise AssertionError(f"Expected a binary literal, got {lv}")
+    binary = lv.scalar.binary
+    if not binary.tag.startswith(_OFFLOADED_TAG_PREFIX):
+        return binary.value, binary.tag
+
+    uri = binary.value.decode("utf-8")
+    local_path = uri
+    if ctx.file_access.is_remote(uri):
+        local_path = ctx.file_access.get_random_local_path()
+        ctx.file_access.get_data(uri, local_path)
+    with open(local_path, "rb") as f:
+        return f.read(), binary.tag[len(_OFFLOADED_TAG_PREFIX) :]
+
+
 class ProtobufTransformer(TypeTransformer[_proto_reflection.GeneratedProtocolMessageType]):
+    """
+    Stores protobuf messages as generic (struct) literals, or serialized in a binary literal tagged with the message
+    type if sdk.protobuf_as_binary is set. Values are written in the format the interface declares, and both formats
+    can be read.
+    """
+
     PB_FIELD_KEY = "pb_type"
+    TAG_PREFIX = f"{PB_FIELD_KEY}="
 
     def __init__(self):
         super().__init__("Protobuf-Transformer", _proto_reflection.GeneratedProtocolMessageType)
@@ -308,21 +559,60 @@ class ProtobufTransformer(TypeTransformer[_proto_reflection.GeneratedProtocolMes
         return f"{expected_python_type.__module__}.{expected_python_type.__name__}"
 
     def get_literal_type(self, t: Type[T]) -> LiteralType:
-        return LiteralType(simple=SimpleType.STRUCT, metadata={ProtobufTransformer.PB_FIELD_KEY: self.tag(t)})
+        simple = SimpleType.BINARY if _sdk_config.PROTOBUF_AS_BINARY.get() else SimpleType.STRUCT
+        return LiteralType(simple=simple, metadata={ProtobufTransformer.PB_FIELD_KEY: self.tag(t)})
 
     def to_literal(self, ctx: FlyteContext, python_val: T, python_type: Type[T], expected: LiteralType) -> Literal:
-        struct = Struct()
-        struct.update(_MessageToDict(python_val))
-        return Literal(scalar=Scalar(generic=struct))
+        if expected is None:
+            expected = self.get_literal_type(python_type)
+        if expected.simple == SimpleType.STRUCT:
+            struct = Struct()
+            struct.update(_MessageToDict(python_val))
+            return Literal(scalar=Scalar(generic=struct))
+        return _to_binary_literal(ctx, python_val.SerializeToString(), self.TAG_PREFIX + self.tag(python_type))
 
     def to_python_value(self, ctx: FlyteContext, lv: Literal, expected_python_type: Type[T]) -> T:
+        pb_obj = expected_python_type()
+        if lv and lv.scalar and lv.scalar.binary is not None:
+            data, tag = _from_binary_literal(ctx, lv)
+            if tag != self.TAG_PREFIX + self.tag(expected_python_type):
+                raise AssertionError(f"Cannot convert a binary literal with tag '{tag}' to {expected_python_type}")
+            pb_obj.ParseFromString(data)
+            return pb_obj
+
         if not (lv and lv.scalar and lv.scalar.generic is not None):
-            raise AssertionError("Can only convert a generic literal to a Protobuf")
+            raise AssertionError("Can only convert a binary or generic literal to a Protobuf")
+        return _ParseDict(_MessageToDict(lv.scalar.generic), pb_obj)
 
-        pb_obj = expected_python_type()
-        dictionary = _MessageToDict(lv.scalar.generic)
-        pb_obj = _ParseDict(dictionary, pb_obj)
-        return pb_obj
+
+class BytesTransformer(TypeTransformer[bytes]):
+    """
+    Stores bytes as they are in a binary literal.
+    """
+
+    TAG = "bytes"
+
+    def __init__(self):
+        super().__init__("Bytes", bytes)
+
+    def get_literal_type(self, t: Type[bytes]) -> LiteralType:
+        return LiteralType(simple=SimpleType.BINARY)
+
+    def to_literal(self, ctx: FlyteContext, python_val: T, python_type: Type[bytes], expected: LiteralType) -> Literal:
+        if not isinstance(python_val, (bytes, bytearray, memoryview)):
+            raise AssertionError(f"Expected bytes, received {type(python_val)}")
+        return _to_binary_literal(ctx, bytes(python_val), self.TAG)
+
+    def to_python_value(self, ctx: FlyteContext, lv: Literal, expected_python_type: Type[bytes]) -> bytes:
+        data, tag = _from_binary_literal(ctx, lv)
+        if tag != self.TAG:
+            raise AssertionError(f"Cannot convert a binary literal with tag '{tag}' to bytes")
+        return data
+
+    def guess_python_type(self, literal_type: LiteralType) -> Type[bytes]:
+        if literal_type.simple == SimpleType.BINARY and not literal_type.metadata:
+            return bytes
+        raise ValueError(f"Transformer {self} cannot reverse {literal_type}")
 
 
 class TypeEngine(typing.Generic[T]):
@@ -333,6 +623,7 @@ class TypeEngine(typing.Generic[T]):
     """
 
     _REGISTRY: typing.Dict[type, TypeTransformer[T]] = {}
+    _LAZY_REGISTRY: typing.Dict[str, str] = {}
     _DATACLASS_TRANSFORMER: TypeTransformer = DataclassTransformer()
 
     @classmethod
@@ -348,6 +639,35 @@ class TypeEngine(typing.Generic[T]):
             )
         cls._REGISTRY[transformer.python_type] = transformer
 
+    @classmethod
+    def register_lazy(cls, type_path: str, module: str):
+        """
+        Defers the registration of a transformer whose module is expensive to import. ``module`` is imported (and is
+        expected to call :py:meth:`register`) the first time a type with the fully qualified name ``type_path``, e.g.
+        ``pandas.core.frame.DataFrame``, or a subclass of it is looked up.
+        """
+        cls._LAZY_REGISTRY[type_path] = module
+
+    @classmethod
+    def _load_lazy_transformer(cls, python_type: Type) -> bool:
+        if not cls._LAZY_REGISTRY or not inspect.isclass(python_type):
+            return False
+        for t in python_type.__mro__:
+            module = cls._LAZY_REGISTRY.pop(f"{t.__module__}.{t.__qualname__}", None)
+            if module is not None:
+                importlib.import_module(module)
+                return True
+        return False
+
+    @classmethod
+    def _load_all_lazy_transformers(cls):
+        while cls._LAZY_REGISTRY:
+            type_path, module = cls._LAZY_REGISTRY.popitem()
+            try:
+                importlib.import_module(module)
+            except ImportError as e:
+                logger.debug(f"Skipping deferred transformer for {type_path}, {module} could not be imported: {e}")
+
     @classmethod
     def get_transformer(cls, python_type: Type) -> TypeTransformer[T]:
         """
@@ -365,6 +685,8 @@ class TypeEngine(typing.Generic[T]):
         Step 3:
             if v is of type data class, use the dataclass transformer
 
+            if v (or one of its base classes) has a deferred transformer, import it and start over
+
         Step 4:
             Walk the inheritance hierarchy of v and  find a transformer that matches the first base class.
             This is potentially non-deterministic - will depend on the registration pattern.
@@ -383,12 +705,17 @@ class TypeEngine(typing.Generic[T]):
                 return cls.get_transformer(python_type.__origin__)
             if python_type.__origin__ in cls._REGISTRY:
                 return cls._REGISTRY[python_type.__origin__]
+            if cls._load_lazy_transformer(python_type.__origin__):
+                return cls.get_transformer(python_type)
             raise ValueError(f"Generic Type {python_type.__origin__} not supported currently in Flytekit.")
 
         # Step 3
         if dataclasses.is_dataclass(python_type):
             return cls._DATACLASS_TRANSFORMER
 
+        if cls._load_lazy_transformer(python_type):
+            return cls.get_transformer(python_type)
+
         # To facilitate cases where users may specify one transformer for multiple types that all inherit from one
         # parent.
         for base_type in cls._REGISTRY.keys():
@@ -515,11 +842,15 @@ class TypeEngine(typing.Generic[T]):
         """
         Transforms a flyte-specific ``LiteralType`` to a regular python value.
         """
-        for _, transformer in cls._REGISTRY.items():
+        # Transformers may guess nested types, which can load deferred transformers into the registry
+        for _, transformer in list(cls._REGISTRY.items()):
             try:
                 return transformer.guess_python_type(flyte_type)
             except ValueError:
                 logger.debug(f"Skipping transformer {transformer.name} for {flyte_type}")
+        if cls._LAZY_REGISTRY:
+            cls._load_all_lazy_transformers()
+            return cls.guess_python_type(flyte_type)
         raise ValueError(f"No transformers could reverse Flyte literal type {flyte_type}")
 
 
@@ -557,7 +888,12 @@ class ListTransformer(TypeTransformer[T]):
 
     def to_literal(self, ctx: FlyteContext, python_val: T, python_type: Type[T], expected: LiteralType) -> Literal:
         t = self.get_sub_type(python_type)
-        lit_list = [TypeEngine.to_literal(ctx, x, t, expected.collection_type) for x in python_val]
+        transformer = TypeEngine.get_transformer(t)
+        if isinstance(transformer, DataclassTransformer):
+            # Lists of records are converted in bulk by the codec of the dataclass
+            lit_list = transformer.codec(t).encode_many(ctx, python_val, expected.collection_type)
+        else:
+            lit_list = [transformer.to_literal(ctx, x, t, expected.collection_type) for x in python_val]
         return Literal(collection=LiteralCollection(literals=lit_list))
 
     def to_python_value(self, ctx: FlyteContext, lv: Literal, expected_python_type: Type[T]) -> T:
@@ -565,7 +901,10 @@ class ListTransformer(TypeTransformer[T]):
             raise AssertionError(f"Provided literal is not a list: {lv}")
 
         st = self.get_sub_type(expected_python_type)
-        return [TypeEngine.to_python_value(ctx, x, st) for x in lv.collection.literals]
+        transformer = TypeEngine.get_transformer(st)
+        if isinstance(transformer, DataclassTransformer):
+            return transformer.codec(st).decode_many(ctx, lv.collection.literals)
+        return [transformer.to_python_value(ctx, x, st) for x in lv.collection.literals]
 
     def guess_python_type(self, literal_type: LiteralType) -> Type[T]:
         if literal_type.collection_type:
@@ -574,12 +913,96 @@ class ListTransformer(TypeTransformer[T]):
         raise ValueError(f"List transformer cannot reverse {literal_type}")
 
 
+_MSGPACK_TAG = "msgpack"
+
+
+def _msgpack():
+    try:
+        import msgpack
+    except ImportError as e:
+        raise ImportError(
+            "msgpack is required to store untyped dictionaries as binary literals, install flytekit[msgpack]"
+        ) from e
+    return msgpack
+
+
+def _untyped_dict_as_msgpack() -> bool:
+    """
+    Reads sdk.untyped_dict_as_msgpack, and fails right away if it is set but msgpack is not installed.
+    """
+    if not _sdk_config.UNTYPED_DICT_AS_MSGPACK.get():
+        return False
+    _msgpack()
+    return True
+
+
+def _set_struct_value(value: _struct.Value, v: typing.Any):
+    if v is None:
+        value.null_value = _struct.NULL_VALUE
+    elif isinstance(v, bool):
+        value.bool_value = v
+    elif isinstance(v, (int, float)):
+        value.number_value = v
+    elif isinstance(v, str):
+        value.string_value = v
+    elif isinstance(v, dict):
+        _fill_struct(value.struct_value, v)
+    elif isinstance(v, (list, tuple)):
+        values = value.list_value.values
+        for x in v:
+            _set_struct_value(values.add(), x)
+    else:
+        raise TypeError(f"Object of type {type(v).__name__} is not JSON serializable")
+
+
+def _fill_struct(s: Struct, d: dict):
+    fields = s.fields
+    for k, v in d.items():
+        # Same key coercion as json.dumps
+        _set_struct_value(fields[k if isinstance(k, str) else _json.dumps(k)], v)
+
+
+def _dict_to_struct(d: dict) -> Struct:
+    """
+    Builds a Struct directly from a python dictionary, without going through a JSON string.
+    """
+    s = Struct()
+    _fill_struct(s, d)
+    return s
+
+
+def _struct_value_to_python(value: _struct.Value) -> typing.Any:
+    kind = value.WhichOneof("kind")
+    if kind == "number_value":
+        # Struct only has doubles, like the json round trip this replaces. Use msgpack to keep ints intact.
+        return value.number_value
+    if kind == "string_value":
+        return value.string_value
+    if kind == "bool_value":
+        return value.bool_value
+    if kind == "struct_value":
+        return _struct_to_dict(value.struct_value)
+    if kind == "list_value":
+        return [_struct_value_to_python(x) for x in value.list_value.values]
+    return None
+
+
+def _struct_to_dict(s: Struct) -> dict:
+    """
+    Reads a python dictionary directly from a Struct, without going through a JSON string.
+    """
+    return {k: _struct_value_to_python(v) for k, v in s.fields.items()}
+
+
 class DictTransformer(TypeTransformer[dict]):
     """
     Transformer that transforms a univariate dictionary Dict[str, T] to a Literal Map or
     transforms a untyped dictionary to a JSON (struct/Generic)
     """
 
+    # Tells msgpack encoded dictionaries apart from other binary literal types, e.g. bytes
+    MSGPACK_METADATA = {"format": _MSGPACK_TAG}
+
     def __init__(self):
         super().__init__("Typed Dict", dict)
 
@@ -602,7 +1025,39 @@ class DictTransformer(TypeTransformer[dict]):
         """
         Creates a flyte-specific ``Literal`` value from a native python dictionary.
         """
-        return Literal(scalar=Scalar(generic=_json_format.Parse(_json.dumps(v), _struct.Struct())))
+        return Literal(scalar=Scalar(generic=_dict_to_struct(v)))
+
+    @staticmethod
+    def generic_literal_to_dict(lv: Literal) -> dict:
+        """
+        Reads a native python dictionary back from a ``Literal`` created by ``dict_to_generic_literal``.
+        """
+        return _struct_to_dict(lv.scalar.generic)
+
+    @staticmethod
+    def dict_to_binary_literal(ctx: FlyteContext, v: dict) -> Literal:
+        """
+        Creates a msgpack encoded binary ``Literal`` from a native python dictionary. Unlike a Struct, this keeps
+        integers and bytes intact. Large dictionaries are offloaded like any other binary literal.
+        """
+        return _to_binary_literal(ctx, _msgpack().packb(v, use_bin_type=True), _MSGPACK_TAG)
+
+    @staticmethod
+    def binary_literal_to_dict(ctx: FlyteContext, lv: Literal) -> dict:
+        """
+        Reads a native python dictionary back from a ``Literal`` created by ``dict_to_binary_literal``.
+        """
+        data, tag = _from_binary_literal(ctx, lv)
+        if tag != _MSGPACK_TAG:
+            raise TypeError(f"Cannot convert binary literal with tag '{tag}' to a python dictionary")
+        return _msgpack().unpackb(data, raw=False, strict_map_key=False)
+
+    @staticmethod
+    def is_untyped(lt: LiteralType) -> bool:
+        """
+        Whether the literal type is one of the types untyped dictionaries are stored as.
+        """
+        return lt.simple in (SimpleType.STRUCT, SimpleType.BINARY)
 
     def get_literal_type(self, t: Type[dict]) -> LiteralType:
         """
@@ -616,13 +1071,18 @@ class DictTransformer(TypeTransformer[dict]):
                     return _type_models.LiteralType(map_value_type=sub_type)
                 except Exception as e:
                     raise ValueError(f"Type of Generic List type is not supported, {e}")
+        if _untyped_dict_as_msgpack():
+            return _type_models.LiteralType(simple=SimpleType.BINARY, metadata=dict(self.MSGPACK_METADATA))
         return _primitives.Generic.to_flyte_literal_type()
 
     def to_literal(
         self, ctx: FlyteContext, python_val: typing.Any, python_type: Type[dict], expected: LiteralType
     ) -> Literal:
-        if expected and expected.simple and expected.simple == SimpleType.STRUCT:
-            return self.dict_to_generic_literal(python_val)
+        if expected and expected.simple:
+            if expected.simple == SimpleType.STRUCT:
+                return self.dict_to_generic_literal(python_val)
+            if expected.simple == SimpleType.BINARY:
+                return self.dict_to_binary_literal(ctx, python_val)
 
         lit_map = {}
         for k, v in python_val.items():
@@ -651,13 +1111,17 @@ class DictTransformer(TypeTransformer[dict]):
         # for empty generic we have to explicitly test for lv.scalar.generic is not None as empty dict
         # evaluates to false
         if lv and lv.scalar and lv.scalar.generic is not None:
-            return _json.loads(_json_format.MessageToJson(lv.scalar.generic))
+            return self.generic_literal_to_dict(lv)
+        if lv and lv.scalar and lv.scalar.binary is not None:
+            return self.binary_literal_to_dict(ctx, lv)
         raise TypeError(f"Cannot convert from {lv} to {expected_python_type}")
 
     def guess_python_type(self, literal_type: LiteralType) -> Type[T]:
         if literal_type.map_value_type:
             mt = TypeEngine.guess_python_type(literal_type.map_value_type)
             return typing.Dict[str, mt]
+        if literal_type.simple == SimpleType.BINARY and literal_type.metadata == self.MSGPACK_METADATA:
+            return dict
         raise ValueError(f"Dictionary transformer cannot reverse {literal_type}")
 
 
@@ -892,6 +1356,7 @@ def _register_default_type_transformers():
     TypeEngine.register(BinaryIOTransformer())
     TypeEngine.register(EnumTransformer())
     TypeEngine.register(ProtobufTransformer())
+    TypeEngine.register(BytesTransformer())
     TypeEngine.register(UnionTransformer())
 
     # inner type is. Also unsupported are typing's Tuples. Even though you can look inside them, Flyte's type system
@@ -904,5 +1369,12 @@ def _register_default_type_transformers():
     TypeEngine.register(RestrictedType("non typed tuple", typing.Tuple))
     TypeEngine.register(RestrictedType("named tuple", typing.NamedTuple))
 
+    # The schema types need numpy and pandas, only import them once they are actually used
+    TypeEngine.register_lazy("flytekit.types.schema.types.FlyteSchema", "flytekit.types.schema")
+    TypeEngine.register_lazy("pandas.core.frame.DataFrame", "flytekit.types.schema")
+    TypeEngine.register_lazy("numpy.ndarray", "flytekit.types.numpy")
+    # Only needed to reverse literal types, the class registers its transformer when it is imported
+    TypeEngine.register_lazy("flytekit.types.list.types.FlyteList", "flytekit.types.list")
+
 
 _register_default_type_transformers()
@@ -0,0 +1,213 @@
+"""
+Size-capped, human readable summaries of python values, used to log the inputs and outputs of tasks without
+stringifying entire dataframes, long lists or deep dataclass trees.
+"""
+import dataclasses
+import typing
+
+from flytekit.configuration import sdk as _sdk_config
+
+Summarizer = typing.Callable[[typing.Any, "SummaryLimits"], str]
+"""
+Returns a summary of a value, nested values should be summarized with :py:meth:`SummaryLimits.summarize`.
+"""
+
+# Containers nested deeper than this are only summarized by their type and length
+_MAX_DEPTH = 3
+
+
+class SummaryLimits(object):
+    """
+    The limits a summary is built with, they are read from the sdk configuration when not given.
+    """
+
+    def __init__(self, max_items: typing.Optional[int] = None, max_length: typing.Optional[int] = None, depth: int = 0):
+        """
+        :param max_items: Number of items of a collection, columns of a frame or fields of a dataclass to show
+        :param max_length: Number of characters after which the summary of a single value is cut off
+        :param depth: How deep into nested values this summary is
+        """
+        self.max_items = _sdk_config.LOGGING_MAX_ITEMS.get() if max_items is None else max_items
+        self.max_length = _sdk_config.LOGGING_MAX_VALUE_LENGTH.get() if max_length is None else max_length
+        self.depth = depth
+
+    def summarize(self, v: typing.Any) -> str:
+        """
+        Summarizes a value nested in the one being summarized.
+        """
+        return summarize(v, limits=SummaryLimits(self.max_items, self.max_length, self.depth + 1))
+
+    def head(self, values: typing.Iterable[typing.Any], total: int) -> str:
+        """
+        Summarizes the first ``max_items`` of ``values``, which holds ``total`` items.
+        """
+        return self._join((self.summarize(v) for v in values), total)
+
+    def head_items(self, items: typing.Iterable[typing.Tuple[str, typing.Any]], total: int, sep: str = ": ") -> str:
+        """
+        Summarizes the values of the first ``max_items`` of ``items``, which holds ``total`` (name, value) pairs.
+        """
+        return self._join((f"{k}{sep}{self.summarize(v)}" for k, v in items), total)
+
+    def _join(self, summaries: typing.Iterator[str], total: int) -> str:
+        if self.depth >= _MAX_DEPTH:
+            return "..." if total else ""
+        items = []
+        for s in summaries:
+            if len(items) >= self.max_items:
+                break
+            items.append(s)
+        if total > len(items):
+            items.append("...")
+        return ", ".join(items)
+
+    def truncate(self, s: str) -> str:
+        if len(s) <= self.max_length:
+            return s
+        return f"{s[: self.max_length]}..."
+
+
+_SUMMARIZERS: typing.Dict[type, Summarizer] = {}
+# Summarizers for types whose modules are expensive (or unnecessary) to import, by fully qualified type name
+_NAMED_SUMMARIZERS: typing.Dict[str, Summarizer] = {}
+_RESOLVED: typing.Dict[type, typing.Optional[Summarizer]] = {}
+
+
+def register_summarizer(t: typing.Union[type, str], summarizer: Summarizer):
+    """
+    Registers how values of type ``t``, and of its subclasses, are summarized in logs. ``t`` can also be the fully
+    qualified name of the type, e.g. ``pandas.core.frame.DataFrame``, so that its module doesn't need to be imported.
+    """
+    if isinstance(t, str):
+        _NAMED_SUMMARIZERS[t] = summarizer
+    else:
+        _SUMMARIZERS[t] = summarizer
+    _RESOLVED.clear()
+
+
+def _get_summarizer(t: type) -> typing.Optional[Summarizer]:
+    if t in _RESOLVED:
+        return _RESOLVED[t]
+    summarizer = None
+    for base in t.__mro__:
+        summarizer = _SUMMARIZERS.get(base) or _NAMED_SUMMARIZERS.get(f"{base.__module__}.{base.__qualname__}")
+        if summarizer is not None:
+            break
+    _RESOLVED[t] = summarizer
+    return summarizer
+
+
+def summarize(v: typing.Any, limits: typing.Optional[SummaryLimits] = None) -> str:
+    """
+    Returns a summary of ``v`` that is at most about ``max_length`` characters long per value.
+
+    :param v: The value to summarize
+    :param limits: The limits to summarize with, by default the ones in the sdk configuration
+    """
+    if limits is None:
+        limits = SummaryLimits()
+    summarizer = _get_summarizer(type(v))
+    if summarizer is not None:
+        s = summarizer(v, limits)
+    elif dataclasses.is_dataclass(v) and not isinstance(v, type):
+        fields = dataclasses.fields(v)
+        s = "{}({})".format(
+            type(v).__name__, limits.head_items(((f.name, getattr(v, f.name)) for f in fields), len(fields), sep="=")
+        )
+    else:
+        s = repr(v)
+    return limits.truncate(s)
+
+
+class LazySummary(object):
+    """
+    Summarizes a value only when it is formatted, i.e. pass it as an argument to a logger call instead of formatting it
+    into the message, and nothing is computed unless the record is emitted. Dictionaries (e.g. task inputs) and
+    tuples (e.g. task outputs) are summarized item by item, so every item gets its own length limit.
+
+    When sdk.logging_summarize_values is off, values are formatted in full.
+    """
+
+    def __init__(self, value: typing.Any):
+        self._value = value
+
+    def __str__(self):
+        if not _sdk_config.LOGGING_SUMMARIZE_VALUES.get():
+            return str(self._value)
+        limits = SummaryLimits()
+        if type(self._value) is dict:
+            return "{" + ", ".join(f"{k}: {summarize(v, limits)}" for k, v in self._value.items()) + "}"
+        if type(self._value) is tuple:
+            return "(" + ", ".join(summarize(v, limits) for v in self._value) + ")"
+        return summarize(self._value, limits)
+
+    def __repr__(self):
+        return str(self)
+
+
+def _summarize_str(v: str, limits: SummaryLimits) -> str:
+    if len(v) <= limits.max_length:
+        return repr(v)
+    # Only the start of a long string is shown, don't copy the rest of it
+    return f"{type(v).__name__}(len={len(v)}){v[: limits.max_length]!r}"
+
+
+def _summarize_bytes(v: bytes, limits: SummaryLimits) -> str:
+    return f"{type(v).__name__}(len={len(v)})"
+
+
+def _summarize_sequence(v: typing.Collection, limits: SummaryLimits) -> str:
+    return f"{type(v).__name__}(len={len(v)})[{limits.head(v, len(v))}]"
+
+
+def _summarize_dict(v: dict, limits: SummaryLimits) -> str:
+    items = ((limits.summarize(k), x) for k, x in v.items())
+    return f"{type(v).__name__}(len={len(v)}){{{limits.head_items(items, len(v))}}}"
+
+
+def _summarize_blob(v, limits: SummaryLimits) -> str:
+    # The remote uri if the value came from (or was uploaded to) a blob store, otherwise the local path
+    return f"{type(v).__name__}({v.remote_source or v.path})"
+
+
+def _summarize_schema(v, limits: SummaryLimits) -> str:
+    return f"{type(v).__name__}({v.remote_path})"
+
+
+def _summarize_flyte_list(v, limits: SummaryLimits) -> str:
+    if not v.is_loaded:
+        # Don't fetch the items of a remote list just to log them, its repr is the range of the list file it reads
+        return repr(v)
+    return f"FlyteList(len={len(v)})[{limits.head(v, len(v))}]"
+
+
+def _summarize_data_frame(v, limits: SummaryLimits) -> str:
+    columns = list(v.columns)
+    return f"DataFrame(shape={v.shape}, columns=[{limits.head(columns, len(columns))}])"
+
+
+def _summarize_spark_data_frame(v, limits: SummaryLimits) -> str:
+    # The number of rows of a spark DataFrame is only known once it is computed
+    columns = v.columns
+    return f"DataFrame(columns=[{limits.head(columns, len(columns))}])"
+
+
+def _summarize_ndarray(v, limits: SummaryLimits) -> str:
+    return f"ndarray(shape={v.shape}, dtype={v.dtype})"
+
+
+register_summarizer(str, _summarize_str)
+register_summarizer(bytes, _summarize_bytes)
+register_summarizer(bytearray, _summarize_bytes)
+register_summarizer(list, _summarize_sequence)
+register_summarizer(tuple, _summarize_sequence)
+register_summarizer(set, _summarize_sequence)
+register_summarizer(frozenset, _summarize_sequence)
+register_summarizer(dict, _summarize_dict)
+register_summarizer("flytekit.types.file.file.FlyteFile", _summarize_blob)
+register_summarizer("flytekit.types.directory.types.FlyteDirectory", _summarize_blob)
+register_summarizer("flytekit.types.schema.types.FlyteSchema", _summarize_schema)
+register_summarizer("flytekit.types.list.types.FlyteList", _summarize_flyte_list)
+register_summarizer("pandas.core.frame.DataFrame", _summarize_data_frame)
+register_summarizer("pyspark.sql.dataframe.DataFrame", _summarize_spark_data_frame)
+register_summarizer("numpy.ndarray", _summarize_ndarray)
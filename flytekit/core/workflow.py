@@ -16,6 +16,7 @@ from flytekit.core.condition import ConditionalSection
 from flytekit.core.context_manager import CompilationState, FlyteContext, FlyteContextManager, FlyteEntities
 from flytekit.core.docstring import parse_docstring
 from flytekit.core.interface import (
+    ConversionPlan,
     Interface,
     transform_inputs_to_parameters,
     transform_interface_to_typed_interface,
@@ -179,6 +180,8 @@ class WorkflowBase(object):
         self._unbound_inputs = set()
         self._nodes = []
         self._output_bindings: Optional[List[_literal_models.Binding]] = []
+        self._input_conversion_plan: Optional[ConversionPlan] = None
+        self._output_conversion_plan: Optional[ConversionPlan] = None
         FlyteEntities.entities.append(self)
         super().__init__(**kwargs)
 
@@ -214,6 +217,29 @@ class WorkflowBase(object):
     def nodes(self) -> List[Node]:
         return self._nodes
 
+    @property
+    def _input_plan(self) -> ConversionPlan:
+        """
+        The conversion plan for the inputs of this workflow. It is rebuilt only if the interface is replaced, like when
+        inputs are added to an imperative workflow.
+        """
+        variables = self.interface.inputs
+        plan = self._input_conversion_plan
+        if plan is None or plan.variables is not variables:
+            plan = self._input_conversion_plan = ConversionPlan(variables, self.python_interface.inputs)
+        return plan
+
+    @property
+    def _output_plan(self) -> ConversionPlan:
+        """
+        The conversion plan for the outputs of this workflow.
+        """
+        variables = self.interface.outputs
+        plan = self._output_conversion_plan
+        if plan is None or plan.variables is not variables:
+            plan = self._output_conversion_plan = ConversionPlan(variables, self.python_interface.outputs)
+        return plan
+
     def __repr__(self):
         return (
             f"WorkflowBase - {self._name} && "
@@ -243,10 +269,11 @@ class WorkflowBase(object):
     def local_execute(self, ctx: FlyteContext, **kwargs) -> Union[Tuple[Promise], Promise, VoidPromise]:
         # This is done to support the invariant that Workflow local executions always work with Promise objects
         # holding Flyte literal values. Even in a wf, a user can call a sub-workflow with a Python native value.
+        input_plan = self._input_plan
         for k, v in kwargs.items():
             if not isinstance(v, Promise):
-                t = self.python_interface.inputs[k]
-                kwargs[k] = Promise(var=k, val=TypeEngine.to_literal(ctx, v, t, self.interface.inputs[k].type))
+                c = input_plan[k]
+                kwargs[k] = Promise(var=k, val=c.transformer.to_literal(ctx, v, c.python_type, c.literal_type))
 
         # The output of this will always be a combination of Python native values and Promises containing Flyte
         # Literals.
@@ -274,7 +301,8 @@ class WorkflowBase(object):
                 function_outputs, f"{function_outputs} received but should've been VoidPromise or None."
             )
 
-        expected_output_names = list(self.python_interface.outputs.keys())
+        output_plan = self._output_plan
+        expected_output_names = output_plan.names
         if len(expected_output_names) == 1:
             # Here we have to handle the fact that the wf could've been declared with a typing.NamedTuple of
             # length one. That convention is used for naming outputs - and single-length-NamedTuples are
@@ -294,6 +322,7 @@ class WorkflowBase(object):
             wf_outputs_as_map,
             flyte_interface_types=self.interface.outputs,
             native_types=self.python_interface.outputs,
+            plan=output_plan,
         )
         # Recreate new promises that use the workflow's output names.
         new_promises = [Promise(var, wf_outputs_as_literal_dict[var]) for var in expected_output_names]
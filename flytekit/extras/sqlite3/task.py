@@ -1,18 +1,22 @@
 import contextlib
+import hashlib
 import os
 import shutil
 import sqlite3
 import tempfile
 import typing
+import urllib.parse
 from dataclasses import dataclass
 
 import pandas as pd
 
 from flytekit import FlyteContext, kwtypes
+from flytekit.configuration import sdk as _sdk_config
 from flytekit.core.base_sql_task import SQLTask
 from flytekit.core.context_manager import SerializationSettings
 from flytekit.core.python_customized_container_task import PythonCustomizedContainerTask
 from flytekit.core.shim_task import ShimTaskExecutor
+from flytekit.loggers import logger
 from flytekit.models import task as task_models
 from flytekit.types.schema import FlyteSchema
 
@@ -31,6 +35,78 @@ def unarchive_file(local_path: str, to_dir: str):
     return os.path.join(archive_dir, files[0])
 
 
+_CACHED_DB_FILE_NAME = "database"
+
+
+def fetch_cached_db(ctx: FlyteContext, uri: str, compressed: bool, cache_dir: str) -> typing.Optional[str]:
+    """
+    Returns the path of a local, unpacked copy of the database at ``uri`` in ``cache_dir``, downloading it first if
+    this version of it (as identified by its etag) isn't there yet. Returns None if the version of the remote database
+    can't be determined, in which case it must not be cached.
+    """
+    etag = ctx.file_access.etag(uri)
+    if not etag:
+        return None
+
+    key = hashlib.sha256(f"{uri}\0{etag}\0{compressed}".encode("utf-8")).hexdigest()
+    cached = os.path.join(cache_dir, key)
+    db_path = os.path.join(cached, _CACHED_DB_FILE_NAME)
+    if os.path.exists(db_path):
+        logger.debug(f"Using cached db {db_path} for {uri}")
+        return db_path
+
+    # Download next to the final location and rename, so concurrent tasks on the node never see a partial database
+    os.makedirs(cache_dir, exist_ok=True)
+    partial = tempfile.mkdtemp(prefix=f"{key}.", suffix=".partial", dir=cache_dir)
+    try:
+        local_path = os.path.join(partial, os.path.basename(uri))
+        ctx.file_access.download(uri, local_path)
+        if compressed:
+            archive_path = local_path
+            local_path = unarchive_file(archive_path, partial)
+        os.rename(local_path, os.path.join(partial, _CACHED_DB_FILE_NAME))
+        if compressed:
+            # Only the database is kept in the cache
+            os.remove(archive_path)
+            shutil.rmtree(os.path.dirname(local_path))
+        os.rename(partial, cached)
+    except OSError:
+        if not os.path.exists(db_path):
+            raise
+        # Another task populated the cache first
+    finally:
+        if os.path.exists(partial):
+            shutil.rmtree(partial, ignore_errors=True)
+    return db_path
+
+
+def connect_read_only(db_path: str, mmap_size: int) -> sqlite3.Connection:
+    """
+    Opens a database that is never modified while it is in use. ``immutable`` lets SQLite skip all locking and change
+    detection, and a large ``mmap_size`` serves reads straight from the page cache, which is shared by every task
+    reading the same file on the node.
+    """
+    con = sqlite3.connect(f"file:{urllib.parse.quote(db_path)}?mode=ro&immutable=1", uri=True)
+    con.execute(f"PRAGMA mmap_size={int(mmap_size)}")
+    return con
+
+
+def query_to_output(con: sqlite3.Connection, query: str, chunksize: typing.Optional[int] = None) -> typing.Any:
+    """
+    Runs the query and returns its results as a DataFrame, or if a chunksize is given, as a FlyteSchema with one part
+    file per chunk of rows so that the results never have to fit in memory at once.
+    """
+    if not chunksize:
+        return pd.read_sql_query(query, con)
+
+    ctx = FlyteContext.current_context()
+    schema = FlyteSchema(local_path=ctx.file_access.get_random_local_directory())
+    writer = schema.open(pd.DataFrame)
+    for chunk in pd.read_sql_query(query, con, chunksize=chunksize):
+        writer.write(chunk)
+    return schema
+
+
 @dataclass
 class SQLite3Config(object):
     """
@@ -45,10 +121,15 @@ class SQLite3Config(object):
         uri: default FlyteFile that will be downloaded on execute
         compressed: Boolean that indicates if the given file is a compressed archive. Supported file types are
                     [zip, tar, gztar, bztar, xztar]
+        chunksize: If set, the results are read this many rows at a time and written as a multi-part schema
+
+    If ``sdk.sqlite3_db_cache_dir`` is configured, downloaded databases are kept there and opened read-only by later
+    executions, as long as the etag of the uri doesn't change.
     """
 
     uri: str
     compressed: bool = False
+    chunksize: typing.Optional[int] = None
 
 
 class SQLite3Task(PythonCustomizedContainerTask[SQLite3Config], SQLTask[SQLite3Config]):
@@ -107,13 +188,26 @@ class SQLite3Task(PythonCustomizedContainerTask[SQLite3Config], SQLTask[SQLite3C
             "query_template": self.query_template,
             "uri": self.task_config.uri,
             "compressed": self.task_config.compressed,
+            "chunksize": self.task_config.chunksize,
         }
 
 
 class SQLite3TaskExecutor(ShimTaskExecutor[SQLite3Task]):
     def execute_from_model(self, tt: task_models.TaskTemplate, **kwargs) -> typing.Any:
+        ctx = FlyteContext.current_context()
+        interpolated_query = SQLite3Task.interpolate_query(tt.custom["query_template"], **kwargs)
+        chunksize = tt.custom.get("chunksize")
+
+        cache_dir = _sdk_config.SQLITE3_DB_CACHE_DIR.get()
+        if cache_dir:
+            db_path = fetch_cached_db(ctx, tt.custom["uri"], tt.custom["compressed"], cache_dir)
+            if db_path is not None:
+                print(f"Connecting to cached db {db_path}")
+                print(f"Interpolated query {interpolated_query}")
+                with contextlib.closing(connect_read_only(db_path, _sdk_config.SQLITE3_MMAP_SIZE_BYTES.get())) as con:
+                    return query_to_output(con, interpolated_query, chunksize)
+
         with tempfile.TemporaryDirectory() as temp_dir:
-            ctx = FlyteContext.current_context()
             file_ext = os.path.basename(tt.custom["uri"])
             local_path = os.path.join(temp_dir, file_ext)
             ctx.file_access.download(tt.custom["uri"], local_path)
@@ -121,8 +215,6 @@ class SQLite3TaskExecutor(ShimTaskExecutor[SQLite3Task]):
                 local_path = unarchive_file(local_path, temp_dir)
 
             print(f"Connecting to db {local_path}")
-            interpolated_query = SQLite3Task.interpolate_query(tt.custom["query_template"], **kwargs)
             print(f"Interpolated query {interpolated_query}")
             with contextlib.closing(sqlite3.connect(local_path)) as con:
-                df = pd.read_sql_query(interpolated_query, con)
-                return df
+                return query_to_output(con, interpolated_query, chunksize)
@@ -1,4 +1,16 @@
 import abc as _abc
+import contextlib as _contextlib
+import os as _os
+import tempfile as _tempfile
+
+
+def join_remote_path(remote_path, relative_path):
+    """
+    :param Text remote_path: a remote directory, with or without trailing slash
+    :param Text relative_path:
+    :rtype: Text
+    """
+    return remote_path.rstrip("/") + "/" + relative_path
 
 
 class DataProxy(object, metaclass=_abc.ABCMeta):
@@ -9,6 +21,16 @@ class DataProxy(object, metaclass=_abc.ABCMeta):
         """
         pass
 
+    def etag(self, path):
+        """
+        Returns an opaque version tag for the object at ``path`` that changes whenever its contents change, or None if
+        the proxy can't tell. Callers may use it to cache downloads.
+
+        :param Text path:
+        :rtype: Optional[Text]
+        """
+        return None
+
     def download_directory(self, remote_path, local_path):
         """
         :param Text remote_path:
@@ -23,6 +45,53 @@ class DataProxy(object, metaclass=_abc.ABCMeta):
         """
         pass
 
+    def list_directory(self, remote_path):
+        """
+        Returns the paths of all files under ``remote_path``, relative to it, without downloading them. Returns None if
+        the proxy can't list directories.
+
+        :param Text remote_path:
+        :rtype: Optional[list[Text]]
+        """
+        return None
+
+    def download_files(self, remote_path, local_path, relative_paths):
+        """
+        Downloads the given files of the directory ``remote_path`` to the same relative paths under ``local_path``.
+
+        :param Text remote_path:
+        :param Text local_path:
+        :param list[Text] relative_paths:
+        """
+        for relative_path in relative_paths:
+            to_path = _os.path.join(local_path, relative_path)
+            _os.makedirs(_os.path.dirname(to_path), exist_ok=True)
+            self.download(join_remote_path(remote_path, relative_path), to_path)
+
+    @_contextlib.contextmanager
+    def download_stream(self, remote_path):
+        """
+        Yields a readable binary file object over the contents of ``remote_path``. Proxies that cannot stream reads
+        download the object to a temporary file first.
+
+        :param Text remote_path:
+        """
+        with _tempfile.TemporaryDirectory() as tmp_dir:
+            local_path = _os.path.join(tmp_dir, "download")
+            self.download(remote_path, local_path)
+            with open(local_path, "rb") as f:
+                yield f
+
+    def open_ranges(self, remote_path):
+        """
+        Returns the size of the object at ``remote_path`` and a function that reads the bytes in ``[start, end)`` of
+        it, or None if the proxy cannot read byte ranges.
+
+        :param Text remote_path:
+        :rtype: Optional[flytekit.interfaces.data.ranged.RangeSource]
+        """
+        return None
+
     def upload(self, file_path, to_path):
         """
         :param Text file_path:
@@ -30,6 +99,19 @@ class DataProxy(object, metaclass=_abc.ABCMeta):
         """
         pass
 
+    @_contextlib.contextmanager
+    def upload_stream(self, to_path):
+        """
+        Yields a writable binary file object whose contents are uploaded to ``to_path`` once the context exits without
+        error. Proxies that can only upload objects of a known size stage the data in a temporary file.
+
+        :param Text to_path:
+        """
+        with _tempfile.NamedTemporaryFile() as fp:
+            yield fp
+            fp.flush()
+            self.upload(fp.name, to_path)
+
     def upload_directory(self, local_path, remote_path):
         """
         :param Text local_path:
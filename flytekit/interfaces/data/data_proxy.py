@@ -1,13 +1,14 @@
 import datetime
 import os
 import pathlib
-from typing import Optional, Union
+from typing import List, Optional, Union
 
 from flytekit.common import constants as _constants
 from flytekit.common import utils as _common_utils
 from flytekit.common.exceptions import user as _user_exception
 from flytekit.configuration import platform as _platform_config
 from flytekit.configuration import sdk as _sdk_config
+from flytekit.interfaces.data import ranged as _ranged
 from flytekit.interfaces.data.gcs import gcs_proxy as _gcs_proxy
 from flytekit.interfaces.data.latch import latch_proxy as _latch_proxy
 from flytekit.interfaces.data.http import http_data_proxy as _http_data_proxy
@@ -86,13 +87,15 @@ class RemoteDataContext(_OutputDataContext):
 
 class Data(object):
     # TODO: More proxies for more environments.
+    # Proxies are instantiated on first use, some of them (e.g. latch) read and validate configuration when created.
     _DATA_PROXIES = {
-        "latch:/": _latch_proxy.LatchProxy(),
-        "s3:/": _s3proxy.AwsS3Proxy(),
-        "gs:/": _gcs_proxy.GCSProxy(),
-        "http://": _http_data_proxy.HttpFileProxy(),
-        "https://": _http_data_proxy.HttpFileProxy(),
+        "latch:/": _latch_proxy.LatchProxy,
+        "s3:/": _s3proxy.AwsS3Proxy,
+        "gs:/": _gcs_proxy.GCSProxy,
+        "http://": _http_data_proxy.HttpFileProxy,
+        "https://": _http_data_proxy.HttpFileProxy,
     }
+    _PROXY_INSTANCES = {}
 
     @classmethod
     def _load_data_proxy_by_path(cls, path):
@@ -100,9 +103,12 @@ class Data(object):
         :param Text path:
         :rtype: flytekit.interfaces.data.common.DataProxy
         """
-        for k, v in cls._DATA_PROXIES.items():
+        for k, proxy_class in cls._DATA_PROXIES.items():
             if path.startswith(k):
-                return v
+                proxy = cls._PROXY_INSTANCES.get(proxy_class)
+                if proxy is None:
+                    proxy = cls._PROXY_INSTANCES[proxy_class] = proxy_class()
+                return proxy
         return _OutputDataContext.get_default_proxy()
 
     @classmethod
@@ -165,6 +171,24 @@ class Data(object):
                 )
             )
 
+    @classmethod
+    def download_stream(cls, remote_path):
+        """
+        Returns a context manager yielding a readable binary file object over the contents of remote_path.
+
+        :param Text remote_path:
+        """
+        return cls._load_data_proxy_by_path(remote_path).download_stream(remote_path)
+
+    @classmethod
+    def upload_stream(cls, remote_path):
+        """
+        Returns a context manager yielding a writable binary file object, whose contents are uploaded to remote_path.
+
+        :param Text remote_path:
+        """
+        return cls._load_data_proxy_by_path(remote_path).upload_stream(remote_path)
+
     @classmethod
     def get_remote_path(cls):
         """
@@ -187,29 +211,22 @@ class FileAccessProvider(object):
         remote_proxy: Union[_s3proxy.AwsS3Proxy, _gcs_proxy.GCSProxy, None] = None,
     ):
 
-        # Local access
+        # Local access. The sandbox directories and the proxies are only created once they are first used, so that
+        # merely importing flytekit doesn't touch the filesystem.
         if local_sandbox_dir is None or local_sandbox_dir == "":
             raise Exception("Can't use empty path")
-        local_sandbox_dir_appended = os.path.join(local_sandbox_dir, "local_flytekit")
-        pathlib.Path(local_sandbox_dir_appended).mkdir(parents=True, exist_ok=True)
-        self._local_sandbox_dir = local_sandbox_dir_appended
-        self._local = _local_file_proxy.LocalFileProxy(local_sandbox_dir_appended)
+        self._local_sandbox_dir = os.path.join(local_sandbox_dir, "local_flytekit")
+        self._local = None
 
         # Remote/cloud stuff
-        self._latch = _latch_proxy.LatchProxy()
-        if isinstance(remote_proxy, _s3proxy.AwsS3Proxy):
-            self._aws = remote_proxy
-        if isinstance(remote_proxy, _gcs_proxy.GCSProxy):
-            self._gcs = remote_proxy
-        if remote_proxy is not None:
-            self._remote = remote_proxy
-        else:
-            mock_remote = os.path.join(local_sandbox_dir, "mock_remote")
-            pathlib.Path(mock_remote).mkdir(parents=True, exist_ok=True)
-            self._remote = _local_file_proxy.LocalFileProxy(mock_remote)
+        self._latch = None
+        self._aws = remote_proxy if isinstance(remote_proxy, _s3proxy.AwsS3Proxy) else None
+        self._gcs = remote_proxy if isinstance(remote_proxy, _gcs_proxy.GCSProxy) else None
+        self._remote = remote_proxy
+        self._mock_remote_dir = os.path.join(local_sandbox_dir, "mock_remote")
 
         # HTTP access
-        self._http_proxy = _http_data_proxy.HttpFileProxy()
+        self._http_proxy = None
 
     @staticmethod
     def is_remote(path: Union[str, os.PathLike]) -> bool:
@@ -240,6 +257,8 @@ class FileAccessProvider(object):
 
     @property
     def latch(self) -> _latch_proxy.LatchProxy:
+        if self._latch is None:
+            self._latch = _latch_proxy.LatchProxy()
         return self._latch
 
     @property
@@ -256,20 +275,26 @@ class FileAccessProvider(object):
 
     @property
     def remote(self):
-        if self._remote is not None:
-            return self._remote
-        raise Exception("No cloud provider specified")
+        if self._remote is None:
+            pathlib.Path(self._mock_remote_dir).mkdir(parents=True, exist_ok=True)
+            self._remote = _local_file_proxy.LocalFileProxy(self._mock_remote_dir)
+        return self._remote
 
     @property
     def http(self) -> _http_data_proxy.HttpFileProxy:
+        if self._http_proxy is None:
+            self._http_proxy = _http_data_proxy.HttpFileProxy()
         return self._http_proxy
 
     @property
     def local_sandbox_dir(self) -> os.PathLike:
+        pathlib.Path(self._local_sandbox_dir).mkdir(parents=True, exist_ok=True)
         return self._local_sandbox_dir
 
     @property
     def local_access(self) -> _local_file_proxy.LocalFileProxy:
+        if self._local is None:
+            self._local = _local_file_proxy.LocalFileProxy(self.local_sandbox_dir)
         return self._local
 
     def get_random_remote_path(self, file_path_or_file_name: Optional[str] = None) -> str:
@@ -310,6 +335,14 @@ class FileAccessProvider(object):
         """
         return self._get_data_proxy_by_path(remote_path).exists(remote_path)
 
+    def etag(self, remote_path: str) -> Optional[str]:
+        """
+        Returns a tag that changes whenever the contents at remote_path change, or None if it can't be determined
+
+        :param Text remote_path: remote s3:// or gs:// path
+        """
+        return self._get_data_proxy_by_path(remote_path).etag(remote_path)
+
     def download_directory(self, remote_path: str, local_path: str):
         """
         :param Text remote_path: remote s3:// path
@@ -317,6 +350,29 @@ class FileAccessProvider(object):
         """
         return self._get_data_proxy_by_path(remote_path).download_directory(remote_path, local_path)
 
+    def list_directory(self, remote_path: str) -> Optional[List[str]]:
+        """
+        Returns the paths of the files under remote_path relative to it, or None if they can't be listed
+
+        :param Text remote_path: remote latch:///, s3:// or gs:// path
+        """
+        return self._get_data_proxy_by_path(remote_path).list_directory(remote_path)
+
+    def download_files(self, remote_path: str, local_path: str, relative_paths: List[str]):
+        """
+        :param Text remote_path: remote directory
+        :param Text local_path: directory to copy to
+        :param relative_paths: paths of the files to download, relative to remote_path
+        """
+        try:
+            with _common_utils.PerformanceTimer(f"Copying {len(relative_paths)} files ({remote_path} -> {local_path})"):
+                return self._get_data_proxy_by_path(remote_path).download_files(remote_path, local_path, relative_paths)
+        except Exception as ex:
+            raise _user_exception.FlyteAssertion(
+                f"Failed to get files {relative_paths} from {remote_path} to {local_path}.\n\n"
+                f"Original exception: {str(ex)}"
+            ) from ex
+
     def download(self, remote_path: str, local_path: str):
         """
         :param Text remote_path: remote s3:// path
@@ -331,6 +387,35 @@ class FileAccessProvider(object):
         """
         return self._get_data_proxy_by_path(to_path).upload(file_path, to_path)
 
+    def open_ranges(self, remote_path: str) -> Optional[_ranged.RangeSource]:
+        """
+        Returns the size of the remote file and a function that reads byte ranges from it, or None if the remote store
+        can't serve byte ranges.
+
+        :param Text remote_path: remote latch:///, s3://, gs:// or http(s):// path
+        """
+        return self._get_data_proxy_by_path(remote_path).open_ranges(remote_path)
+
+    def open_ranged(self, remote_path: str, mode: str = "rb", block_size: Optional[int] = None):
+        """
+        Opens the remote file for reading without downloading it, its contents are fetched with range reads as they
+        are read. Returns None if the remote store can't serve byte ranges.
+
+        :param Text remote_path: remote latch:///, s3://, gs:// or http(s):// path
+        :param Text mode: "rb" or "r"
+        :param int block_size: Number of bytes fetched at once, defaults to sdk.streaming_block_size_bytes
+        """
+        source = self.open_ranges(remote_path)
+        if source is None:
+            return None
+        return _ranged.open_ranged(
+            source,
+            mode,
+            block_size=block_size or _sdk_config.STREAMING_BLOCK_SIZE_BYTES.get(),
+            cache_blocks=_sdk_config.STREAMING_CACHE_BLOCKS.get(),
+            read_ahead=_sdk_config.STREAMING_READ_AHEAD_BLOCKS.get(),
+        )
+
     def upload_directory(self, local_path: str, remote_path: str):
         """
         :param Text local_path:
@@ -1,4 +1,6 @@
+import contextlib as _contextlib
 import os as _os
+import subprocess as _std_subprocess
 import sys as _sys
 import uuid as _uuid
 
@@ -79,6 +81,35 @@ class GCSProxy(_common_data.DataProxy):
         except Exception:
             return False
 
+    def etag(self, remote_path):
+        """
+        :param Text remote_path: remote gs:// path
+        :rtype: Optional[Text]
+        """
+        GCSProxy._check_binary()
+
+        if not remote_path.startswith("gs://"):
+            raise ValueError("Not an GS Key. Please use FQN (GS ARN) of the format gs://...")
+
+        try:
+            return GCSProxy._stat(remote_path).get("ETag")
+        except _std_subprocess.CalledProcessError:
+            # e.g. the object doesn't exist or can't be read, its version is unknown
+            return None
+
+    @staticmethod
+    def _stat(remote_path):
+        """
+        :param Text remote_path: remote gs:// path
+        :rtype: dict[Text, Text]
+        """
+        out = _std_subprocess.check_output([GCSProxy._GS_UTIL_CLI, "stat", remote_path], env=_os.environ.copy())
+        res = {}
+        for line in out.decode("utf-8").splitlines():
+            key, _, value = line.strip().partition(":")
+            res[key] = value.strip()
+        return res
+
     def download_directory(self, remote_path, local_path):
         """
         :param Text remote_path: remote gs:// path
@@ -92,6 +123,32 @@ class GCSProxy(_common_data.DataProxy):
         cmd = self._maybe_with_gsutil_parallelism("cp", "-r", _amend_path(remote_path), local_path)
         return _update_cmd_config_and_execute(cmd)
 
+    def list_directory(self, remote_path):
+        """
+        Lists the objects under the prefix with ``gsutil ls``.
+
+        :param Text remote_path: remote gs:// path
+        """
+        if not remote_path.startswith("gs://"):
+            raise ValueError("Not an GS Key. Please use FQN (GS ARN) of the format gs://...")
+
+        GCSProxy._check_binary()
+        remote_path = remote_path.rstrip("/") + "/"
+        try:
+            out = _std_subprocess.check_output(
+                [GCSProxy._GS_UTIL_CLI, "ls", remote_path + "**"], env=_os.environ.copy()
+            )
+        except _std_subprocess.CalledProcessError as e:
+            # gsutil ls exits with 1 when nothing matches
+            if e.returncode == 1 and not e.output:
+                return []
+            raise
+        res = []
+        for line in out.decode("utf-8").splitlines():
+            if line.startswith(remote_path) and not line.endswith("/"):
+                res.append(line[len(remote_path) :])
+        return sorted(res)
+
     def download(self, remote_path, local_path):
         """
         :param Text remote_path: remote gs:// path
@@ -105,6 +162,54 @@ class GCSProxy(_common_data.DataProxy):
         cmd = self._maybe_with_gsutil_parallelism("cp", remote_path, local_path)
         return _update_cmd_config_and_execute(cmd)
 
+    @_contextlib.contextmanager
+    def download_stream(self, remote_path):
+        """
+        Streams the object through ``gsutil cp <remote_path> -``.
+
+        :param Text remote_path: remote gs:// path
+        """
+        if not remote_path.startswith("gs://"):
+            raise ValueError("Not an GS Key. Please use FQN (GS ARN) of the format gs://...")
+
+        GCSProxy._check_binary()
+
+        proc = _std_subprocess.Popen(
+            [GCSProxy._GS_UTIL_CLI, "cp", remote_path, "-"], stdout=_std_subprocess.PIPE, env=_os.environ.copy()
+        )
+        try:
+            yield proc.stdout
+        except BaseException:
+            proc.kill()
+            raise
+        finally:
+            proc.stdout.close()
+            ret_code = proc.wait()
+        if ret_code != 0:
+            raise _FlyteUserException(f"Streaming download of {remote_path} failed with exit code {ret_code}")
+
+    def open_ranges(self, remote_path):
+        """
+        Reads byte ranges of the object with ``gsutil cat -r``.
+
+        :param Text remote_path: remote gs:// path
+        """
+        if not remote_path.startswith("gs://"):
+            raise ValueError("Not an GS Key. Please use FQN (GS ARN) of the format gs://...")
+
+        GCSProxy._check_binary()
+        size = GCSProxy._stat(remote_path).get("Content-Length")
+        if size is None:
+            return None
+
+        def read_range(start, end):
+            return _std_subprocess.check_output(
+                [GCSProxy._GS_UTIL_CLI, "cat", "-r", "{}-{}".format(start, end - 1), remote_path],
+                env=_os.environ.copy(),
+            )
+
+        return int(size), read_range
+
     def upload(self, file_path, to_path):
         """
         :param Text file_path:
@@ -115,6 +220,29 @@ class GCSProxy(_common_data.DataProxy):
         cmd = self._maybe_with_gsutil_parallelism("cp", file_path, to_path)
         return _update_cmd_config_and_execute(cmd)
 
+    @_contextlib.contextmanager
+    def upload_stream(self, to_path):
+        """
+        Streams the written bytes to ``gsutil cp - <to_path>``.
+
+        :param Text to_path:
+        """
+        GCSProxy._check_binary()
+
+        proc = _std_subprocess.Popen(
+            [GCSProxy._GS_UTIL_CLI, "cp", "-", to_path], stdin=_std_subprocess.PIPE, env=_os.environ.copy()
+        )
+        try:
+            yield proc.stdin
+        except BaseException:
+            proc.kill()
+            raise
+        finally:
+            proc.stdin.close()
+            ret_code = proc.wait()
+        if ret_code != 0:
+            raise _FlyteUserException(f"Streaming upload to {to_path} failed with exit code {ret_code}")
+
     def upload_directory(self, local_path, remote_path):
         """
         :param Text local_path:
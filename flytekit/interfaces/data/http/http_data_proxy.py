@@ -1,7 +1,10 @@
+import contextlib as _contextlib
+
 import requests as _requests
 
 from flytekit.common.exceptions import user as _user_exceptions
 from flytekit.interfaces.data import common as _common_data
+from flytekit.interfaces.data import ranged as _ranged
 
 
 class HttpFileProxy(_common_data.DataProxy):
@@ -28,6 +31,16 @@ class HttpFileProxy(_common_data.DataProxy):
             )
         return rsp.status_code == type(self)._HTTP_OK
 
+    def etag(self, path):
+        """
+        :param Text path:
+        :rtype: Optional[Text]
+        """
+        rsp = _requests.head(path, allow_redirects=True)
+        if rsp.status_code != type(self)._HTTP_OK:
+            return None
+        return rsp.headers.get("ETag") or rsp.headers.get("Last-Modified")
+
     def download_directory(self, from_path, to_path):
         """
         :param Text from_path:
@@ -50,6 +63,26 @@ class HttpFileProxy(_common_data.DataProxy):
         with open(to_path, "wb") as writer:
             writer.write(rsp.content)
 
+    @_contextlib.contextmanager
+    def download_stream(self, from_path):
+        """
+        :param Text from_path:
+        """
+        with _requests.get(from_path, stream=True) as rsp:
+            if rsp.status_code != type(self)._HTTP_OK:
+                raise _user_exceptions.FlyteValueException(
+                    rsp.status_code,
+                    "Request for data @ {} failed. Expected status code {}".format(from_path, type(self)._HTTP_OK),
+                )
+            rsp.raw.decode_content = True
+            yield rsp.raw
+
+    def open_ranges(self, remote_path):
+        """
+        :param Text remote_path:
+        """
+        return _ranged.http_ranges(remote_path)
+
     def upload(self, from_path, to_path):
         """
         :param Text from_path:
@@ -1,3 +1,4 @@
+import contextlib as _contextlib
 import os as _os
 import requests
 import mimetypes
@@ -8,6 +9,7 @@ import math
 from flytekit.common.exceptions.user import FlyteUserException as _FlyteUserException
 from flytekit.configuration import latch as _latch_config
 from flytekit.interfaces.data import common as _common_data
+from flytekit.interfaces.data import ranged as _ranged
 from queue import Queue
 from threading import Thread
 
@@ -110,10 +112,10 @@ class LatchProxy(_common_data.DataProxy):
         
         return r.json()["exists"]
 
-    def download_directory(self, remote_path, local_path):
+    def _get_dir_urls(self, remote_path):
         """
         :param str remote_path: remote latch:/// path
-        :param str local_path: directory to copy to
+        :rtype: dict[str, str] presigned urls of the files in the directory, keyed by their path relative to it
         """
         if not remote_path.startswith("latch:///"):
             raise ValueError(f"expected a Latch URL (latch:///...): {remote_path}")
@@ -124,10 +126,13 @@ class LatchProxy(_common_data.DataProxy):
         dir_key = self._split_s3_path_to_key(remote_path)[1:]
         dir_key = _enforce_trailing_slash(dir_key)
         key_to_url_map = r.json()["key_to_url_map"]
+        return {key.replace(dir_key, "", 1): url for key, url in key_to_url_map.items()}
 
+    @staticmethod
+    def _get_all(urls, local_path):
         task_tuples = []
-        for key, url in key_to_url_map.items():
-            local_file_path = _os.path.join(local_path, key.replace(dir_key, "", 1))
+        for relative_path, url in urls.items():
+            local_file_path = _os.path.join(local_path, relative_path)
             dir = "/".join(local_file_path.split("/")[:-1])
             _os.makedirs(dir, exist_ok=True)
             task_tuples.append((url, local_file_path))
@@ -137,6 +142,31 @@ class LatchProxy(_common_data.DataProxy):
         pool.wait_completion()
         return True
 
+    def download_directory(self, remote_path, local_path):
+        """
+        :param str remote_path: remote latch:/// path
+        :param str local_path: directory to copy to
+        """
+        return LatchProxy._get_all(self._get_dir_urls(remote_path), local_path)
+
+    def list_directory(self, remote_path):
+        """
+        :param str remote_path: remote latch:/// path
+        """
+        return sorted(self._get_dir_urls(remote_path))
+
+    def download_files(self, remote_path, local_path, relative_paths):
+        """
+        :param str remote_path: remote latch:/// path
+        :param str local_path: directory to copy to
+        :param list[str] relative_paths: paths of the files to download, relative to remote_path
+        """
+        urls = self._get_dir_urls(remote_path)
+        missing = [p for p in relative_paths if p not in urls]
+        if missing:
+            raise _FlyteUserException("files `{}` do not exist in `{}`".format(missing, remote_path))
+        return LatchProxy._get_all({p: urls[p] for p in relative_paths}, local_path)
+
     def download(self, remote_path, local_path):
         """
         :param str remote_path: remote latch:/// path
@@ -153,6 +183,56 @@ class LatchProxy(_common_data.DataProxy):
         urlretrieve(url, local_path)
         return _os.path.exists(local_path)
 
+    def etag(self, remote_path):
+        """
+        The ETag the object store returns with the first byte of the file, the presigned url only permits GET requests.
+
+        :param str remote_path: remote latch:/// path
+        :rtype: Optional[str]
+        """
+        if not remote_path.startswith("latch:///"):
+            raise ValueError(f"expected a Latch URL (latch:///...): {remote_path}")
+
+        r = requests.post(self._latch_endpoint + "/api/get-presigned-url", json={"object_url": remote_path, "execution_name": _os.environ.get("FLYTE_INTERNAL_EXECUTION_ID")})
+        if r.status_code != 200:
+            return None
+
+        with requests.get(r.json()["url"], headers={"Range": "bytes=0-0"}, stream=True) as rsp:
+            if rsp.status_code not in (200, 206):
+                return None
+            return rsp.headers.get("ETag")
+
+    @_contextlib.contextmanager
+    def download_stream(self, remote_path):
+        """
+        :param str remote_path: remote latch:/// path
+        """
+        if not remote_path.startswith("latch:///"):
+            raise ValueError(f"expected a Latch URL (latch:///...): {remote_path}")
+
+        r = requests.post(self._latch_endpoint + "/api/get-presigned-url", json={"object_url": remote_path, "execution_name": _os.environ.get("FLYTE_INTERNAL_EXECUTION_ID")})
+        if r.status_code != 200:
+            raise _FlyteUserException("failed to get presigned url for `{}`".format(remote_path))
+
+        with requests.get(r.json()["url"], stream=True) as rsp:
+            if rsp.status_code != 200:
+                raise _FlyteUserException("failed to download `{}`".format(remote_path))
+            rsp.raw.decode_content = True
+            yield rsp.raw
+
+    def open_ranges(self, remote_path):
+        """
+        :param str remote_path: remote latch:/// path
+        """
+        if not remote_path.startswith("latch:///"):
+            raise ValueError(f"expected a Latch URL (latch:///...): {remote_path}")
+
+        r = requests.post(self._latch_endpoint + "/api/get-presigned-url", json={"object_url": remote_path, "execution_name": _os.environ.get("FLYTE_INTERNAL_EXECUTION_ID")})
+        if r.status_code != 200:
+            raise _FlyteUserException("failed to get presigned url for `{}`".format(remote_path))
+
+        return _ranged.http_ranges(r.json()["url"])
+
     @staticmethod
     def __upload(args):
         LatchProxy._upload(args[0], args[1], args[2], args[3])
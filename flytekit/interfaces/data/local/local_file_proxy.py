@@ -1,6 +1,6 @@
+import contextlib as _contextlib
 import os as _os
 import uuid as _uuid
-from distutils import dir_util as _dir_util
 from shutil import copyfile as _copyfile
 
 from flytekit.interfaces import random as _flyte_random
@@ -40,14 +40,37 @@ class LocalFileProxy(_common_data.DataProxy):
         """
         return _os.path.exists(strip_file_header(path))
 
+    def etag(self, path):
+        """
+        :param Text path:
+        :rtype: Text
+        """
+        st = _os.stat(strip_file_header(path))
+        return f"{st.st_size}-{st.st_mtime_ns}"
+
     def download_directory(self, from_path, to_path):
         """
         :param Text from_path:
         :param Text to_path:
         """
         if from_path != to_path:
+            # distutils is slow to import (it is shimmed by setuptools), only pay for it when copying directories
+            from distutils import dir_util as _dir_util
+
             _dir_util.copy_tree(strip_file_header(from_path), strip_file_header(to_path))
 
+    def list_directory(self, remote_path):
+        """
+        :param Text remote_path:
+        """
+        root = strip_file_header(remote_path)
+        res = []
+        for dir_path, _, file_names in _os.walk(root):
+            rel_dir = _os.path.relpath(dir_path, root)
+            for name in file_names:
+                res.append(name if rel_dir == "." else _os.path.join(rel_dir, name).replace(_os.sep, "/"))
+        return sorted(res)
+
     def download(self, from_path, to_path):
         """
         :param Text from_path:
@@ -55,6 +78,14 @@ class LocalFileProxy(_common_data.DataProxy):
         """
         _copyfile(strip_file_header(from_path), strip_file_header(to_path))
 
+    @_contextlib.contextmanager
+    def download_stream(self, from_path):
+        """
+        :param Text from_path:
+        """
+        with open(strip_file_header(from_path), "rb") as f:
+            yield f
+
     def upload(self, from_path, to_path):
         """
         :param Text from_path:
@@ -65,6 +96,22 @@ class LocalFileProxy(_common_data.DataProxy):
         # Write the object to a local file in the sandbox
         _copyfile(strip_file_header(from_path), strip_file_header(to_path))
 
+    @_contextlib.contextmanager
+    def upload_stream(self, to_path):
+        """
+        :param Text to_path:
+        """
+        to_path = strip_file_header(to_path)
+        _make_local_path(_os.path.dirname(to_path))
+        tmp_path = f"{to_path}.partial"
+        try:
+            with open(tmp_path, "wb") as f:
+                yield f
+            _os.replace(tmp_path, to_path)
+        finally:
+            if _os.path.exists(tmp_path):
+                _os.remove(tmp_path)
+
     def upload_directory(self, from_path, to_path):
         """
         :param Text from_path:
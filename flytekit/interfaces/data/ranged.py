@@ -0,0 +1,195 @@
+import collections as _collections
+import io as _io
+import threading as _threading
+from concurrent import futures as _futures
+from typing import Callable, Optional, Tuple
+
+import requests as _requests
+
+from flytekit.common.exceptions import user as _user_exceptions
+
+RangeReader = Callable[[int, int], bytes]
+"""
+Returns the bytes in ``[start, end)`` of a remote object.
+"""
+
+RangeSource = Tuple[int, RangeReader]
+"""
+The size of a remote object and a function to read byte ranges from it, as returned by ``DataProxy.open_ranges``.
+"""
+
+
+class _HttpRanges(object):
+    def __init__(self, url: str):
+        self._url = url
+        # requests sessions are not guaranteed to be thread-safe, read-ahead happens on a separate thread
+        self._local = _threading.local()
+
+    @property
+    def _session(self) -> _requests.Session:
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = _requests.Session()
+        return session
+
+    def size(self) -> Optional[int]:
+        # Presigned urls are only valid for GET requests, so ask for the first byte instead of sending a HEAD request
+        rsp = self._session.get(self._url, headers={"Range": "bytes=0-0"}, stream=True)
+        content_range = rsp.headers.get("Content-Range", "")
+        if rsp.status_code not in (206, 416) or not content_range.startswith("bytes "):
+            # The server does not support range requests and is sending the whole object, don't download it
+            rsp.close()
+            return None
+        # Reading the (at most one byte long) body lets the session reuse the connection
+        rsp.content
+        total = content_range.rpartition("/")[2]
+        return int(total) if total.isdigit() else None
+
+    def read(self, start: int, end: int) -> bytes:
+        rsp = self._session.get(self._url, headers={"Range": "bytes={}-{}".format(start, end - 1)})
+        if rsp.status_code != 206:
+            raise _user_exceptions.FlyteValueException(
+                rsp.status_code, "Range request for bytes {}-{} of {} failed".format(start, end - 1, self._url)
+            )
+        return rsp.content
+
+
+def http_ranges(url: str) -> Optional[RangeSource]:
+    """
+    Returns a range source that reads from ``url`` with HTTP Range requests, or None if the server does not support
+    them.
+
+    :param Text url:
+    """
+    ranges = _HttpRanges(url)
+    size = ranges.size()
+    if size is None:
+        return None
+    return size, ranges.read
+
+
+class RangedFile(_io.RawIOBase):
+    """
+    A seekable, read-only binary file over a remote object that is fetched in blocks of ``block_size`` bytes. The
+    ``cache_blocks`` most recently used blocks are kept in memory. When the file is read sequentially, the next
+    ``read_ahead`` blocks are fetched in the background.
+    """
+
+    def __init__(
+        self, size: int, read_range: RangeReader, block_size: int, cache_blocks: int = 8, read_ahead: int = 2
+    ):
+        """
+        :param int size: Size of the object in bytes
+        :param read_range: Returns the bytes in [start, end) of the object
+        :param int block_size: Number of bytes fetched at once
+        :param int cache_blocks: Number of blocks kept in memory
+        :param int read_ahead: Number of blocks fetched ahead of sequential reads
+        """
+        super().__init__()
+        if block_size <= 0:
+            raise ValueError("block_size must be positive")
+        self._size = size
+        self._read_range = read_range
+        self._block_size = block_size
+        self._cache_blocks = max(cache_blocks, 1)
+        self._read_ahead = max(read_ahead, 0)
+        self._nblocks = (size + block_size - 1) // block_size
+        self._blocks = _collections.OrderedDict()
+        self._last_block = None
+        self._pos = 0
+        self._executor = _futures.ThreadPoolExecutor(max_workers=1) if self._read_ahead else None
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = _io.SEEK_SET) -> int:
+        if whence == _io.SEEK_SET:
+            pos = offset
+        elif whence == _io.SEEK_CUR:
+            pos = self._pos + offset
+        elif whence == _io.SEEK_END:
+            pos = self._size + offset
+        else:
+            raise ValueError("Invalid whence ({}, should be 0, 1 or 2)".format(whence))
+        if pos < 0:
+            raise ValueError("Negative seek position {}".format(pos))
+        self._pos = pos
+        return pos
+
+    def _fetch(self, i: int) -> bytes:
+        start = i * self._block_size
+        return self._read_range(start, min(start + self._block_size, self._size))
+
+    def _block(self, i: int) -> bytes:
+        block = self._blocks.pop(i, None)
+        if block is None:
+            block = self._fetch(i)
+        elif isinstance(block, _futures.Future):
+            block = block.result()
+        self._blocks[i] = block
+
+        if self._executor is not None and self._last_block is not None and i - 1 <= self._last_block <= i:
+            for j in range(i + 1, min(i + 1 + self._read_ahead, self._nblocks)):
+                if j not in self._blocks:
+                    self._blocks[j] = self._executor.submit(self._fetch, j)
+        self._last_block = i
+
+        while len(self._blocks) > self._cache_blocks + self._read_ahead:
+            _, evicted = self._blocks.popitem(last=False)
+            if isinstance(evicted, _futures.Future):
+                evicted.cancel()
+        return block
+
+    def readinto(self, b) -> int:
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+        if self._pos >= self._size:
+            return 0
+        i = self._pos // self._block_size
+        block = self._block(i)
+        offset = self._pos - i * self._block_size
+        n = min(len(b), len(block) - offset)
+        b[:n] = block[offset : offset + n]
+        self._pos += n
+        return n
+
+    def close(self):
+        if self._executor is not None:
+            for block in self._blocks.values():
+                if isinstance(block, _futures.Future):
+                    block.cancel()
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        self._blocks.clear()
+        super().close()
+
+
+def open_ranged(
+    source: RangeSource, mode: str = "rb", block_size: int = 8 * 1024 * 1024, cache_blocks: int = 8, read_ahead: int = 2
+):
+    """
+    Opens a range source as a buffered, seekable file object.
+
+    :param source: The size of the object and a function to read byte ranges from it
+    :param Text mode: "rb" or "r"
+    :param int block_size: Number of bytes fetched at once
+    :param int cache_blocks: Number of blocks kept in memory
+    :param int read_ahead: Number of blocks fetched ahead of sequential reads
+    """
+    if set(mode) - {"r", "b", "t"} or "r" not in mode:
+        raise ValueError("Remote files can only be streamed for reading, got mode '{}'".format(mode))
+    size, read_range = source
+    f = _io.BufferedReader(RangedFile(size, read_range, block_size, cache_blocks, read_ahead))
+    if "b" in mode:
+        return f
+    return _io.TextIOWrapper(f)
@@ -1,7 +1,9 @@
+import contextlib as _contextlib
 import logging
 import os as _os
 import re as _re
 import string as _string
+import subprocess as _std_subprocess
 import sys as _sys
 import time
 import uuid as _uuid
@@ -14,6 +16,7 @@ from flytekit.common.exceptions.user import FlyteUserException as _FlyteUserExce
 from flytekit.configuration import aws as _aws_config
 from flytekit.interfaces import random as _flyte_random
 from flytekit.interfaces.data import common as _common_data
+from flytekit.interfaces.data import ranged as _ranged
 from flytekit.tools import subprocess as _subprocess
 
 if _sys.version_info >= (3,):
@@ -22,7 +25,10 @@ else:
     from distutils.spawn import find_executable as _which
 
 
-def _update_cmd_config_and_execute(cmd: List[str]):
+def _update_cmd_config(cmd: List[str]) -> Dict[str, str]:
+    """
+    Adds the configured endpoint and debug arguments to the aws cli command, and returns the environment to run it in.
+    """
     env = _os.environ.copy()
 
     if _aws_config.ENABLE_DEBUG.get():
@@ -38,6 +44,12 @@ def _update_cmd_config_and_execute(cmd: List[str]):
     if _aws_config.S3_SECRET_ACCESS_KEY.get() is not None:
         env[_aws_config.S3_SECRET_ACCESS_KEY_ENV_NAME] = _aws_config.S3_SECRET_ACCESS_KEY.get()
 
+    return env
+
+
+def _update_cmd_config_and_execute(cmd: List[str]):
+    env = _update_cmd_config(cmd)
+
     retry = 0
     while True:
         try:
@@ -132,6 +144,37 @@ class AwsS3Proxy(_common_data.DataProxy):
             else:
                 raise ex
 
+    def etag(self, remote_path):
+        """
+        :param Text remote_path: remote s3:// path
+        :rtype: Optional[Text]
+        """
+        AwsS3Proxy._check_binary()
+
+        if not remote_path.startswith("s3://"):
+            raise ValueError("Not an S3 ARN. Please use FQN (S3 ARN) of the format s3://...")
+
+        bucket, file_path = self._split_s3_path_to_bucket_and_key(remote_path)
+        cmd = [
+            AwsS3Proxy._AWS_CLI,
+            "s3api",
+            "head-object",
+            "--bucket",
+            bucket,
+            "--key",
+            file_path,
+            "--query",
+            "ETag",
+            "--output",
+            "text",
+        ]
+        env = _update_cmd_config(cmd)
+        try:
+            return _std_subprocess.check_output(cmd, env=env).decode("utf-8").strip()
+        except _std_subprocess.CalledProcessError:
+            # e.g. the object doesn't exist or can't be read, its version is unknown
+            return None
+
     def download_directory(self, remote_path, local_path):
         """
         :param Text remote_path: remote s3:// path
@@ -145,6 +188,35 @@ class AwsS3Proxy(_common_data.DataProxy):
         cmd = [AwsS3Proxy._AWS_CLI, "s3", "cp", "--recursive", remote_path, local_path]
         return _update_cmd_config_and_execute(cmd)
 
+    def list_directory(self, remote_path):
+        """
+        Lists the objects under the prefix with ``aws s3 ls --recursive``.
+
+        :param Text remote_path: remote s3:// path
+        """
+        if not remote_path.startswith("s3://"):
+            raise ValueError("Not an S3 ARN. Please use FQN (S3 ARN) of the format s3://...")
+
+        AwsS3Proxy._check_binary()
+        remote_path = remote_path.rstrip("/") + "/"
+        _, prefix = self._split_s3_path_to_bucket_and_key(remote_path)
+        cmd = [AwsS3Proxy._AWS_CLI, "s3", "ls", "--recursive", remote_path]
+        env = _update_cmd_config(cmd)
+        try:
+            out = _std_subprocess.check_output(cmd, env=env)
+        except _std_subprocess.CalledProcessError as e:
+            # aws s3 ls exits with 1 when nothing matches
+            if e.returncode == 1 and not e.output:
+                return []
+            raise
+        res = []
+        for line in out.decode("utf-8").splitlines():
+            # <date> <time> <size> <key>
+            parts = line.split(None, 3)
+            if len(parts) == 4 and parts[3].startswith(prefix) and not parts[3].endswith("/"):
+                res.append(parts[3][len(prefix) :])
+        return sorted(res)
+
     def download(self, remote_path, local_path):
         """
         :param Text remote_path: remote s3:// path
@@ -157,6 +229,47 @@ class AwsS3Proxy(_common_data.DataProxy):
         cmd = [AwsS3Proxy._AWS_CLI, "s3", "cp", remote_path, local_path]
         return _update_cmd_config_and_execute(cmd)
 
+    @_contextlib.contextmanager
+    def download_stream(self, remote_path):
+        """
+        Streams the object through ``aws s3 cp <remote_path> -``.
+
+        :param Text remote_path: remote s3:// path
+        """
+        if not remote_path.startswith("s3://"):
+            raise ValueError("Not an S3 ARN. Please use FQN (S3 ARN) of the format s3://...")
+
+        AwsS3Proxy._check_binary()
+        cmd = [AwsS3Proxy._AWS_CLI, "s3", "cp", remote_path, "-"]
+        env = _update_cmd_config(cmd)
+
+        proc = _std_subprocess.Popen(cmd, stdout=_std_subprocess.PIPE, env=env)
+        try:
+            yield proc.stdout
+        except BaseException:
+            proc.kill()
+            raise
+        finally:
+            proc.stdout.close()
+            ret_code = proc.wait()
+        if ret_code != 0:
+            raise _FlyteUserException(f"Streaming download of {remote_path} failed with exit code {ret_code}")
+
+    def open_ranges(self, remote_path):
+        """
+        Presigns the object with ``aws s3 presign`` and reads it with HTTP Range requests.
+
+        :param Text remote_path: remote s3:// path
+        """
+        if not remote_path.startswith("s3://"):
+            raise ValueError("Not an S3 ARN. Please use FQN (S3 ARN) of the format s3://...")
+
+        AwsS3Proxy._check_binary()
+        cmd = [AwsS3Proxy._AWS_CLI, "s3", "presign", remote_path, "--expires-in", "43200"]
+        env = _update_cmd_config(cmd)
+        url = _std_subprocess.check_output(cmd, env=env).decode("utf-8").strip()
+        return _ranged.http_ranges(url)
+
     def upload(self, file_path, to_path):
         """
         :param Text file_path:
@@ -174,6 +287,33 @@ class AwsS3Proxy(_common_data.DataProxy):
 
         return _update_cmd_config_and_execute(cmd)
 
+    @_contextlib.contextmanager
+    def upload_stream(self, to_path):
+        """
+        Streams the written bytes to ``aws s3 cp - <to_path>``. Unlike the other operations this is not retried,
+        since the stream cannot be replayed.
+
+        :param Text to_path:
+        """
+        AwsS3Proxy._check_binary()
+
+        cmd = [AwsS3Proxy._AWS_CLI, "s3", "cp"]
+        cmd.extend(_extra_args({"ACL": "bucket-owner-full-control"}))
+        cmd += ["-", to_path]
+        env = _update_cmd_config(cmd)
+
+        proc = _std_subprocess.Popen(cmd, stdin=_std_subprocess.PIPE, env=env)
+        try:
+            yield proc.stdin
+        except BaseException:
+            proc.kill()
+            raise
+        finally:
+            proc.stdin.close()
+            ret_code = proc.wait()
+        if ret_code != 0:
+            raise _FlyteUserException(f"Streaming upload to {to_path} failed with exit code {ret_code}")
+
     def upload_directory(self, local_path, remote_path):
         """
         :param Text local_path:
@@ -19,6 +19,9 @@ pandas = _lazy_loader.lazy_load_module("pandas")  # type: _lazy_loader._LazyLoad
 hmsclient = _lazy_loader.lazy_load_module("hmsclient")  # type: _lazy_loader._LazyLoadModule
 type(hmsclient).add_sub_module("genthrift.hive_metastore.ttypes")
 
+thrift = _lazy_loader.lazy_load_module("thrift")  # type: _lazy_loader._LazyLoadModule
+type(thrift).add_sub_module("transport.TTransport")
+
 sagemaker_training = _lazy_loader.lazy_load_module("sagemaker_training")  # type: _lazy_loader._LazyLoadModule
 
 papermill = _lazy_loader.lazy_load_module("papermill")  # type: _lazy_loader._LazyLoadModule
@@ -35,7 +38,7 @@ _lazy_loader.LazyLoadPlugin(
     [numpy, pandas],
 )
 
-_lazy_loader.LazyLoadPlugin("hive_sensor", ["hmsclient>=0.0.1,<1.0.0"], [hmsclient])
+_lazy_loader.LazyLoadPlugin("hive_sensor", ["hmsclient>=0.0.1,<1.0.0"], [hmsclient, thrift])
 
 _lazy_loader.LazyLoadPlugin("sagemaker", ["sagemaker-training>=3.6.2,<4.0.0"], [sagemaker_training])
 
@@ -1,24 +1,94 @@
+import collections as _collections
+import gzip as _gzip
+import hashlib as _hashlib
+import json as _json
 import os as _os
-import subprocess as _subprocess
+import shutil as _shutil
+import struct as _struct
 import tarfile as _tarfile
 import tempfile as _tempfile
+import typing as _typing
+import zlib as _zlib
+from concurrent.futures import ThreadPoolExecutor as _ThreadPoolExecutor
 from pathlib import Path as _Path
 
-import dirhash as _dirhash
-
-from flytekit.interfaces.data import data_proxy as _data_proxy
+from flytekit.configuration import sdk as _sdk_config
 from flytekit.interfaces.data.data_proxy import Data as _Data
+from flytekit.loggers import logger
 
 _tmp_versions_dir = "tmp/versions"
+_digest_cache_file = ".digest_cache.json"
+_DIGEST_CACHE_VERSION = 1
+
+# Size of the independently compressed blocks of a parallel gzip archive.
+_COMPRESSION_BLOCK_SIZE = 4 * 1024 * 1024
+_COMPRESSION_LEVEL = 6
+
+
+def _load_digest_cache(cache_path: str) -> dict:
+    try:
+        with open(cache_path, "r") as f:
+            cache = _json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if cache.get("version") != _DIGEST_CACHE_VERSION:
+        return {}
+    return cache.get("files", {})
+
 
+def _save_digest_cache(cache_path: str, files: dict):
+    try:
+        _os.makedirs(_os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = f"{cache_path}.tmp"
+        with open(tmp_path, "w") as f:
+            _json.dump({"version": _DIGEST_CACHE_VERSION, "files": files}, f)
+        _os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.warning(f"Failed to write fast registration digest cache {cache_path}: {e}")
+
+
+def _file_md5(path: str) -> str:
+    h = _hashlib.md5()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(chunk)
+    return h.hexdigest()
 
-def compute_digest(source_dir: _os.PathLike) -> str:
+
+def compute_digest(source_dir: _os.PathLike, use_cache: bool = True) -> str:
     """
-    Walks the entirety of the source dir to compute a deterministic hex digest of the dir contents.
+    Walks the entirety of the source dir to compute a deterministic hex digest of the contents of all python files in
+    it. Per-file hashes are cached next to the version markers, keyed by path, size and mtime, so only files that
+    changed since the last call are read again.
     :param _os.PathLike source_dir:
+    :param bool use_cache:
     :return Text:
     """
-    return f"fast{_dirhash.dirhash(source_dir, 'md5', match=['*.py'])}"
+    source_dir = _os.path.abspath(source_dir)
+    cache_path = _os.path.join(_os.getcwd(), _tmp_versions_dir, _digest_cache_file)
+    cached = _load_digest_cache(cache_path) if use_cache else {}
+    files = {}
+
+    h = _hashlib.md5()
+    for root, dirs, filenames in _os.walk(source_dir):
+        dirs.sort()
+        for filename in sorted(filenames):
+            if not filename.endswith(".py"):
+                continue
+            path = _os.path.join(root, filename)
+            st = _os.stat(path)
+            entry = cached.get(path)
+            if entry is None or entry[0] != st.st_size or entry[1] != st.st_mtime_ns:
+                entry = [st.st_size, st.st_mtime_ns, _file_md5(path)]
+            files[path] = entry
+            h.update(f"{_os.path.relpath(path, source_dir)}\0{entry[2]}\n".encode("utf-8"))
+
+    if use_cache:
+        # Keep entries for other source dirs so switching between projects does not invalidate the cache
+        cached = {k: v for k, v in cached.items() if not k.startswith(_os.path.join(source_dir, ""))}
+        cached.update(files)
+        _save_digest_cache(cache_path, cached)
+    return f"fast{h.hexdigest()}"
 
 
 def _write_marker(marker: _os.PathLike):
@@ -43,6 +113,84 @@ def filter_tar_file_fn(tarinfo: _tarfile.TarInfo) -> _tarfile.TarInfo:
     return tarinfo
 
 
+def _gzip_member(data: bytes, level: int) -> bytes:
+    """
+    Compresses data into a complete, standalone gzip member with a fixed header so the output is deterministic.
+    """
+    compressor = _zlib.compressobj(level, _zlib.DEFLATED, -_zlib.MAX_WBITS)
+    body = compressor.compress(data) + compressor.flush()
+    # magic, deflate, no flags, mtime 0, no extra flags, unknown OS
+    header = b"\x1f\x8b\x08\x00\x00\x00\x00\x00\x00\xff"
+    trailer = _struct.pack("<II", _zlib.crc32(data) & 0xFFFFFFFF, len(data) & 0xFFFFFFFF)
+    return header + body + trailer
+
+
+class ParallelGzipWriter(object):
+    """
+    A write-only file object that gzip-compresses what is written to it on a thread pool, pigz style. The input is cut
+    into fixed size blocks that are each compressed into their own gzip member; a concatenation of gzip members is a
+    valid gzip stream, so the output can be read by ``tarfile``, ``gzip`` or ``tar -xz`` as usual. zlib releases the
+    GIL while compressing, so the blocks are compressed concurrently.
+    """
+
+    def __init__(self, fileobj, workers: int = None, level: int = _COMPRESSION_LEVEL):
+        self._fileobj = fileobj
+        self._level = level
+        self._workers = workers or _os.cpu_count() or 1
+        self._executor = _ThreadPoolExecutor(max_workers=self._workers)
+        self._pending = _collections.deque()
+        self._buffer = bytearray()
+        self._closed = False
+
+    def _drain(self, max_pending: int):
+        while len(self._pending) > max_pending:
+            self._fileobj.write(self._pending.popleft().result())
+
+    def _submit(self, block: bytes):
+        self._pending.append(self._executor.submit(_gzip_member, block, self._level))
+        # Bound the memory held by in flight blocks
+        self._drain(2 * self._workers)
+
+    def write(self, data) -> int:
+        self._buffer += data
+        while len(self._buffer) >= _COMPRESSION_BLOCK_SIZE:
+            self._submit(bytes(self._buffer[:_COMPRESSION_BLOCK_SIZE]))
+            del self._buffer[:_COMPRESSION_BLOCK_SIZE]
+        return len(data)
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            if self._buffer:
+                self._submit(bytes(self._buffer))
+                self._buffer = bytearray()
+            self._drain(0)
+        finally:
+            self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def write_archive(source_dir: _os.PathLike, fileobj, workers: int = None):
+    """
+    Writes the filtered contents of the source dir as a gzipped tar archive to the given binary file object, compressing
+    on ``workers`` threads.
+    :param _os.PathLike source_dir:
+    :param fileobj: A writable binary file object
+    :param int workers: Number of compression threads, defaults to the number of CPUs
+    """
+    with ParallelGzipWriter(fileobj, workers=workers) as gz:
+        # Streaming mode, tarfile never seeks the underlying file object
+        with _tarfile.open(fileobj=gz, mode="w|") as tar:
+            tar.add(source_dir, arcname="", filter=filter_tar_file_fn)
+
+
 def get_additional_distribution_loc(remote_location: str, identifier: str) -> str:
     """
     :param Text remote_location:
@@ -52,7 +200,9 @@ def get_additional_distribution_loc(remote_location: str, identifier: str) -> st
     return _os.path.join(remote_location, "{}.{}".format(identifier, "tar.gz"))
 
 
-def upload_package(source_dir: _os.PathLike, identifier: str, remote_location: str, dry_run=False) -> str:
+def upload_package(
+    source_dir: _os.PathLike, identifier: str, remote_location: str, dry_run=False, stream: bool = None
+) -> str:
     """
     Uploads the contents of the source dir as a tar package to a destination specified by the unique identifier and
     remote_location.
@@ -60,6 +210,8 @@ def upload_package(source_dir: _os.PathLike, identifier: str, remote_location: s
     :param Text identifier:
     :param Text remote_location:
     :param bool dry_run:
+    :param bool stream: Upload the archive while it is being built instead of staging it in a temporary file. Defaults
+        to the sdk.fast_registration_stream_upload configuration.
     :return Text:
     """
     tmp_versions_dir = _os.path.join(_os.getcwd(), _tmp_versions_dir)
@@ -75,13 +227,20 @@ def upload_package(source_dir: _os.PathLike, identifier: str, remote_location: s
         _write_marker(marker)
         return full_remote_path
 
-    with _tempfile.NamedTemporaryFile() as fp:
-        # Write using gzip
-        with _tarfile.open(fp.name, "w:gz") as tar:
-            tar.add(source_dir, arcname="", filter=filter_tar_file_fn)
-        if dry_run:
-            print("Would upload {} to {}".format(fp.name, full_remote_path))
-        else:
+    if stream is None:
+        stream = _sdk_config.FAST_REGISTRATION_STREAM_UPLOAD.get()
+    workers = _sdk_config.FAST_REGISTRATION_COMPRESSION_WORKERS.get() or None
+
+    if dry_run:
+        print("Would upload {} to {}".format(source_dir, full_remote_path))
+    elif stream:
+        with _Data.upload_stream(full_remote_path) as fp:
+            write_archive(source_dir, fp, workers=workers)
+        print("Uploaded {} to {}".format(source_dir, full_remote_path))
+    else:
+        with _tempfile.NamedTemporaryFile() as fp:
+            write_archive(source_dir, fp, workers=workers)
+            fp.flush()
             _Data.put_data(fp.name, full_remote_path)
             print("Uploaded {} to {}".format(fp.name, full_remote_path))
 
@@ -91,21 +250,78 @@ def upload_package(source_dir: _os.PathLike, identifier: str, remote_location: s
     return full_remote_path
 
 
-def download_distribution(additional_distribution: str, destination: str):
+def _copy_tree(source: str, destination: str) -> _typing.List[str]:
+    """
+    Copies the contents of source over destination, overwriting existing files. Returns the paths of the copied files,
+    relative to destination.
     """
-    Downloads a remote code distribution and overwrites any local files.
+    copied = []
+    for root, _, files in _os.walk(source):
+        relative_root = _os.path.relpath(root, source)
+        target_root = _os.path.join(destination, relative_root)
+        _os.makedirs(target_root, exist_ok=True)
+        for name in files:
+            _shutil.copy2(_os.path.join(root, name), _os.path.join(target_root, name), follow_symlinks=False)
+            copied.append(_os.path.normpath(_os.path.join(relative_root, name)))
+    return copied
+
+
+def _extract_distribution(additional_distribution: str, destination: str) -> _typing.List[str]:
+    extracted = []
+
+    def members(tar):
+        for member in tar:
+            if member.isfile():
+                extracted.append(_os.path.normpath(member.name))
+            yield member
+
+    with _Data.download_stream(additional_distribution) as stream:
+        # Decompress and extract as the bytes arrive, without staging the archive on disk. Archives are written as one
+        # gzip member per compression block, tarfile's own gzip stream stops after the first one but GzipFile reads
+        # the members one after another.
+        with _gzip.GzipFile(fileobj=stream, mode="rb") as gz, _tarfile.open(fileobj=gz, mode="r|") as tar:
+            tar.extractall(destination, members=members(tar))
+        # Consume the end of archive padding so the producer sees a complete read
+        while stream.read(1024 * 1024):
+            pass
+    return extracted
+
+
+def download_distribution(additional_distribution: str, destination: str) -> _typing.List[str]:
+    """
+    Downloads a remote code distribution and overwrites any local files. If sdk.fast_distribution_cache_dir is
+    configured, extracted distributions are kept there, keyed by their digest, and reused by later calls.
     :param Text additional_distribution:
     :param _os.PathLike destination:
+    :return: The paths of the files of the distribution, relative to destination
     """
-    _data_proxy.Data.get_data(additional_distribution, destination)
     tarfile_name = _os.path.basename(additional_distribution)
     file_suffix = _Path(tarfile_name).suffixes
     if len(file_suffix) != 2 or file_suffix[0] != ".tar" or file_suffix[1] != ".gz":
         raise ValueError("Unrecognized additional distribution format for {}".format(additional_distribution))
 
-    # This will overwrite the existing user flyte workflow code in the current working code dir.
-    result = _subprocess.run(
-        ["tar", "-xvf", _os.path.join(destination, tarfile_name), "-C", destination],
-        stdout=_subprocess.PIPE,
-    )
-    result.check_returncode()
+    cache_dir = _sdk_config.FAST_DISTRIBUTION_CACHE_DIR.get()
+    if not cache_dir:
+        # This will overwrite the existing user flyte workflow code in the current working code dir.
+        return _extract_distribution(additional_distribution, destination)
+
+    digest = tarfile_name[: -len(".tar.gz")]
+    cached = _os.path.join(cache_dir, digest)
+    if _os.path.exists(cached):
+        logger.info(f"Using cached distribution {cached} for {additional_distribution}")
+    else:
+        # Extract next to the final location and rename, so concurrent tasks on the node never see a partial tree
+        _os.makedirs(cache_dir, exist_ok=True)
+        partial = _tempfile.mkdtemp(prefix=f"{digest}.", suffix=".partial", dir=cache_dir)
+        try:
+            _extract_distribution(additional_distribution, partial)
+            _os.rename(partial, cached)
+        except OSError:
+            if not _os.path.exists(cached):
+                raise
+            # Another task populated the cache first
+        finally:
+            if _os.path.exists(partial):
+                _shutil.rmtree(partial, ignore_errors=True)
+
+    return _copy_tree(cached, destination)
@@ -0,0 +1,258 @@
+"""
+Support for incremental serialization (``pyflyte serialize workflows --incremental``).
+
+Serialized entities are cached on disk, keyed by a digest of the module that defined them. The module digest covers
+the module's own source and the source of every local module it (transitively) imports, as well as the serialization
+settings in effect, so an entity is only re-serialized when something that could affect its protobuf has changed.
+"""
+import ast as _ast
+import hashlib as _hashlib
+import json as _json
+import logging as _logging
+import os as _os
+import sys as _sys
+import typing
+
+from flyteidl.admin.launch_plan_pb2 import LaunchPlan as _idl_admin_LaunchPlan
+from flyteidl.admin.task_pb2 import TaskSpec as _idl_admin_TaskSpec
+from flyteidl.admin.workflow_pb2 import WorkflowSpec as _idl_admin_WorkflowSpec
+from google.protobuf.message import DecodeError as _DecodeError
+
+_MANIFEST_FILE_NAME = "manifest.json"
+_OBJECTS_DIR_NAME = "objects"
+_CACHE_FORMAT_VERSION = 1
+
+_PROTO_KINDS = {
+    "task": _idl_admin_TaskSpec,
+    "workflow": _idl_admin_WorkflowSpec,
+    "launch_plan": _idl_admin_LaunchPlan,
+}
+
+
+def _proto_kind(proto) -> str:
+    for kind, proto_type in _PROTO_KINDS.items():
+        if isinstance(proto, proto_type):
+            return kind
+    raise ValueError(f"Cannot cache unrecognized entity type {type(proto)}")
+
+
+def _module_file(module_name: str) -> typing.Optional[str]:
+    module = _sys.modules.get(module_name)
+    path = getattr(module, "__file__", None)
+    if not path or not path.endswith(".py") or not _os.path.isfile(path):
+        return None
+    return _os.path.abspath(path)
+
+
+def _imported_module_names(module_name: str, source: bytes, is_package: bool) -> typing.Set[str]:
+    """
+    Returns every module name that the given source could import, including parent packages and the
+    ``from x import y`` candidates where ``y`` may be a submodule.
+    """
+    package = module_name if is_package else module_name.rpartition(".")[0]
+    names = set()
+    for node in _ast.walk(_ast.parse(source)):
+        if isinstance(node, _ast.Import):
+            bases = [alias.name for alias in node.names]
+        elif isinstance(node, _ast.ImportFrom):
+            if node.level:
+                parts = package.split(".") if package else []
+                parts = parts[: len(parts) - (node.level - 1)]
+                base = ".".join(parts + ([node.module] if node.module else []))
+            else:
+                base = node.module or ""
+            bases = [base] + [f"{base}.{alias.name}" if base else alias.name for alias in node.names]
+        else:
+            continue
+        for base in bases:
+            parts = base.split(".")
+            for i in range(1, len(parts) + 1):
+                names.add(".".join(parts[:i]))
+    names.discard("")
+    return names
+
+
+class ModuleDigests(object):
+    """
+    Computes content digests for already-imported modules. Only modules whose files live under one of the given roots
+    participate, everything else (the standard library, flytekit itself, third party packages) is assumed to be
+    pinned by the environment and is covered by the settings key of the cache instead.
+    """
+
+    def __init__(self, roots: typing.List[str]):
+        self._roots = [_os.path.join(_os.path.abspath(r), "") for r in roots]
+        self._own_digests: typing.Dict[str, typing.Optional[str]] = {}
+        self._direct_deps: typing.Dict[str, typing.Set[str]] = {}
+        self._digests: typing.Dict[str, typing.Optional[str]] = {}
+
+    def _is_local(self, path: str) -> bool:
+        return any(path.startswith(r) for r in self._roots)
+
+    def _load(self, module_name: str):
+        if module_name in self._own_digests:
+            return
+        path = _module_file(module_name)
+        if path is None or not self._is_local(path):
+            self._own_digests[module_name] = None
+            self._direct_deps[module_name] = set()
+            return
+        with open(path, "rb") as f:
+            source = f.read()
+        self._own_digests[module_name] = _hashlib.sha256(source).hexdigest()
+        try:
+            deps = _imported_module_names(module_name, source, _os.path.basename(path) == "__init__.py")
+        except SyntaxError:
+            deps = set()
+        deps.discard(module_name)
+        self._direct_deps[module_name] = deps
+
+    def digest(self, module_name: str) -> typing.Optional[str]:
+        """
+        Returns a digest over the source of the module and all local modules it transitively imports, or None if the
+        module is not a local source file (in which case results derived from it should never be cached).
+        """
+        if module_name in self._digests:
+            return self._digests[module_name]
+
+        self._load(module_name)
+        if self._own_digests[module_name] is None:
+            self._digests[module_name] = None
+            return None
+
+        closure = {}
+        stack = [module_name]
+        while stack:
+            name = stack.pop()
+            if name in closure:
+                continue
+            self._load(name)
+            own = self._own_digests[name]
+            if own is None:
+                continue
+            closure[name] = own
+            stack.extend(d for d in self._direct_deps[name] if d not in closure)
+
+        h = _hashlib.sha256()
+        for name in sorted(closure):
+            h.update(f"{name}={closure[name]}\n".encode("utf-8"))
+        self._digests[module_name] = h.hexdigest()
+        return self._digests[module_name]
+
+
+class SerializationCache(object):
+    """
+    An on-disk, content addressed store of serialized entities. The layout is ::
+
+        <cache_dir>/manifest.json
+        <cache_dir>/objects/<sha256>.pb
+
+    The manifest maps each top level entity key to the digest of its defining module and the ordered list of protobuf
+    objects that serializing it produced (i.e. including the tasks a workflow depends on).
+    """
+
+    def __init__(self, cache_dir: str, settings_key: str):
+        self._cache_dir = cache_dir
+        self._objects_dir = _os.path.join(cache_dir, _OBJECTS_DIR_NAME)
+        self._settings_key = settings_key
+        self._entities: typing.Dict[str, dict] = {}
+        self._outputs: typing.List[str] = []
+        self._seen: typing.Set[str] = set()
+        self.hits = 0
+        self.misses = 0
+        self._load()
+
+    @staticmethod
+    def settings_key(*parts: typing.Any) -> str:
+        h = _hashlib.sha256()
+        for p in parts:
+            h.update(repr(p).encode("utf-8"))
+            h.update(b"\0")
+        return h.hexdigest()
+
+    @property
+    def previous_outputs(self) -> typing.List[str]:
+        """
+        File names written to the output folder by the previous run that used this cache.
+        """
+        return list(self._outputs)
+
+    def _load(self):
+        manifest_path = _os.path.join(self._cache_dir, _MANIFEST_FILE_NAME)
+        if not _os.path.exists(manifest_path):
+            return
+        try:
+            with open(manifest_path, "r") as f:
+                manifest = _json.load(f)
+        except (OSError, ValueError) as e:
+            _logging.warning(f"Ignoring unreadable serialization cache manifest {manifest_path}: {e}")
+            return
+
+        self._outputs = manifest.get("outputs", [])
+        if manifest.get("version") != _CACHE_FORMAT_VERSION or manifest.get("settings") != self._settings_key:
+            _logging.info("Serialization settings changed, discarding cached entities")
+            return
+        self._entities = manifest.get("entities", {})
+
+    def get(self, key: str, digest: typing.Optional[str]) -> typing.Optional[typing.List]:
+        """
+        Returns the protobuf objects cached for the entity, or None if there is no entry for this exact digest.
+        """
+        self._seen.add(key)
+        entry = self._entities.get(key)
+        if digest is None or entry is None or entry["digest"] != digest:
+            self.misses += 1
+            return None
+
+        protos = []
+        for kind, sha in entry["objects"]:
+            try:
+                with open(_os.path.join(self._objects_dir, f"{sha}.pb"), "rb") as f:
+                    proto = _PROTO_KINDS[kind]()
+                    proto.ParseFromString(f.read())
+            except (OSError, KeyError, _DecodeError) as e:
+                _logging.warning(f"Serialization cache entry for {key} is unusable, re-serializing: {e}")
+                self.misses += 1
+                return None
+            protos.append(proto)
+        self.hits += 1
+        return protos
+
+    def put(self, key: str, digest: typing.Optional[str], protos: typing.List):
+        self._seen.add(key)
+        if digest is None:
+            self._entities.pop(key, None)
+            return
+        _os.makedirs(self._objects_dir, exist_ok=True)
+        objects = []
+        for proto in protos:
+            data = proto.SerializeToString(deterministic=True)
+            sha = _hashlib.sha256(data).hexdigest()
+            path = _os.path.join(self._objects_dir, f"{sha}.pb")
+            if not _os.path.exists(path):
+                with open(path, "wb") as f:
+                    f.write(data)
+            objects.append([_proto_kind(proto), sha])
+        self._entities[key] = {"digest": digest, "objects": objects}
+
+    def save(self, outputs: typing.List[str]):
+        """
+        Writes the manifest, dropping entities that were not looked up during this run and any objects no longer
+        referenced by a remaining entity.
+        """
+        self._entities = {k: v for k, v in self._entities.items() if k in self._seen}
+        _os.makedirs(self._objects_dir, exist_ok=True)
+        live = {sha for entry in self._entities.values() for _, sha in entry["objects"]}
+        for fname in _os.listdir(self._objects_dir):
+            if fname.endswith(".pb") and fname[: -len(".pb")] not in live:
+                _os.remove(_os.path.join(self._objects_dir, fname))
+
+        manifest = {
+            "version": _CACHE_FORMAT_VERSION,
+            "settings": self._settings_key,
+            "entities": self._entities,
+            "outputs": outputs,
+        }
+        tmp_path = _os.path.join(self._cache_dir, f"{_MANIFEST_FILE_NAME}.tmp")
+        with open(tmp_path, "w") as f:
+            _json.dump(manifest, f, sort_keys=True)
+        _os.replace(tmp_path, _os.path.join(self._cache_dir, _MANIFEST_FILE_NAME))
@@ -1,15 +1,18 @@
 from __future__ import annotations
 
+import fnmatch
 import os
 import typing
 from pathlib import Path
 
 from flytekit.core.context_manager import FlyteContext
 from flytekit.core.type_engine import TypeEngine, TypeTransformer
+from flytekit.interfaces.data.common import join_remote_path
 from flytekit.models import types as _type_models
 from flytekit.models.core import types as _core_types
 from flytekit.models.literals import Blob, BlobMetadata, Literal, Scalar
 from flytekit.models.types import LiteralType
+from flytekit.types.file.file import FlyteFile
 
 T = typing.TypeVar("T")
 
@@ -18,9 +21,9 @@ class FlyteDirectory(os.PathLike, typing.Generic[T]):
     """
     .. warning::
 
-        This class should not be used on very large datasets, as merely listing the dataset will cause
-        the entire dataset to be downloaded. Listing on S3 and other backend object stores is not consistent
-        and we should not need data to be downloaded to list.
+        Using the path of a remote directory (e.g. ``os.listdir(d)``) downloads the entire directory. For large
+        directories use :py:meth:`listdir`, :py:meth:`get_file` and :py:meth:`download` with ``include`` patterns, which
+        only list the remote directory and download the files that are asked for.
 
     Please first read through the comments on the :py:class:`flytekit.types.file.FlyteFile` class as the
     implementation here is similar.
@@ -76,6 +79,8 @@ class FlyteDirectory(os.PathLike, typing.Generic[T]):
         self._downloaded = False
         self._remote_directory = remote_directory
         self._remote_source = None
+        self._listing = None
+        self._fetched = set()
 
     def __fspath__(self):
         """
@@ -128,6 +133,63 @@ class FlyteDirectory(os.PathLike, typing.Generic[T]):
         """
         return self._remote_source
 
+    def _is_lazy(self) -> bool:
+        return self._remote_source is not None and not self._downloaded
+
+    def listdir(self) -> typing.List[str]:
+        """
+        Returns the paths of all files in the directory, relative to it. A remote directory is listed without
+        downloading it, if its store supports listing.
+        """
+        file_access = FlyteContext.current_context().file_access
+        if self._is_lazy():
+            if self._listing is None:
+                self._listing = file_access.list_directory(self._remote_source)
+            if self._listing is not None:
+                return list(self._listing)
+        return file_access.local_access.list_directory(self.__fspath__())
+
+    def _download_files(self, relative_paths: typing.List[str]):
+        missing = [p for p in relative_paths if p not in self._fetched]
+        if missing:
+            FlyteContext.current_context().file_access.download_files(self._remote_source, self._path, missing)
+            self._fetched.update(missing)
+
+    def get_file(self, relative_path: str) -> FlyteFile:
+        """
+        Returns a single file of the directory. If the directory is remote, only this file is downloaded, once it is
+        used, or it can be streamed with ``FlyteFile.open(streaming=True)``.
+
+        :param relative_path: Path of the file, relative to the directory
+        """
+        local_path = os.path.join(self._path, relative_path)
+        if not self._is_lazy():
+            return FlyteFile(local_path)
+
+        def _downloader():
+            if self._is_lazy():
+                self._download_files([relative_path])
+
+        ff = FlyteFile(local_path, _downloader)
+        ff._remote_source = join_remote_path(self._remote_source, relative_path)
+        return ff
+
+    def download(self, include: typing.Optional[typing.List[str]] = None) -> str:
+        """
+        Downloads the directory and returns its local path. With ``include``, only the files whose relative path
+        matches one of the glob patterns (as in ``fnmatch``, ``*`` also matches ``/``) are downloaded.
+
+        :param include: Glob patterns of the files to download, all files by default
+        """
+        if include is None or not self._is_lazy():
+            return self.__fspath__()
+        names = self.listdir()
+        if self._listing is None:
+            # The store can't list directories, listdir downloaded everything already
+            return self._path
+        self._download_files([n for n in names if any(fnmatch.fnmatchcase(n, pattern) for pattern in include)])
+        return self._path
+
     def __repr__(self):
         return self._path
 
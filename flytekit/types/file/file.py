@@ -184,6 +184,30 @@ class FlyteFile(os.PathLike, typing.Generic[T]):
         """
         return self._remote_source
 
+    def open(self, mode: str = "rb", streaming: bool = False, block_size: typing.Optional[int] = None) -> typing.IO:
+        """
+        Opens the file. By default the file is downloaded first, like for any other use of its path.
+
+        With ``streaming=True`` a remote file that hasn't been downloaded yet is opened for reading without
+        downloading it. It is seekable, and its contents are fetched with range reads of ``block_size`` bytes as they
+        are read, so e.g. reading the header of a large file only transfers the first blocks. Local files, and remote
+        files whose store can't serve byte ranges, are downloaded and opened as usual.
+
+        :param mode: The mode to open the file in, only "rb" and "r" can be streamed
+        :param streaming: Whether to read a remote file without downloading it first
+        :param block_size: Number of bytes fetched at once, defaults to sdk.streaming_block_size_bytes
+        """
+        if streaming and not self._downloaded:
+            ctx = FlyteContext.current_context()
+            remote = self._remote_source
+            if remote is None and ctx.file_access.is_remote(self._path):
+                remote = self._path
+            if remote is not None and not remote.startswith("file:/"):
+                f = ctx.file_access.open_ranged(remote, mode, block_size=block_size)
+                if f is not None:
+                    return f
+        return open(self, mode)
+
     def __repr__(self):
         return self._path
 
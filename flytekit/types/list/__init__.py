@@ -0,0 +1,12 @@
+"""
+Flytekit Offloaded List Type
+==========================================================
+.. currentmodule:: flytekit.types.list
+
+.. autosummary::
+   :toctree: generated/
+
+   FlyteList
+"""
+
+from .types import FlyteList, FlyteListTransformer
@@ -0,0 +1,363 @@
+from __future__ import annotations
+
+import collections
+import itertools
+import os
+import re
+import struct
+import typing
+
+from flyteidl.core import literals_pb2 as _literals_pb2
+from flyteidl.core import types_pb2 as _types_pb2
+from google.protobuf.json_format import MessageToDict as _MessageToDict
+from google.protobuf.json_format import ParseDict as _ParseDict
+
+from flytekit.core.context_manager import FlyteContext
+from flytekit.core.type_engine import TypeEngine, TypeTransformer
+from flytekit.interfaces.data.local.local_file_proxy import strip_file_header
+from flytekit.models import types as _type_models
+from flytekit.models.core import types as _core_types
+from flytekit.models.literals import Blob, BlobMetadata, Literal, LiteralCollection, Scalar
+from flytekit.models.types import LiteralType
+
+T = typing.TypeVar("T")
+
+# A list file is the magic, the chunks (serialized LiteralCollections), the index of the chunks and a footer.
+_MAGIC = b"FLYTELST"
+_FOOTER = struct.Struct("<QQQ8s")  # index offset, number of elements, chunk size, magic
+_INDEX_ENTRY = struct.Struct("<QQ")  # chunk offset, chunk length
+
+# Number of decoded chunks each list keeps in memory
+_CACHED_CHUNKS = 4
+
+# The range of a view of a list file, appended to the uri of the file. Only this exact suffix is stripped, so keys that
+# contain a '#' are left alone.
+_VIEW_SUFFIX = "#flytelist-range={}:{}"
+_VIEW_SUFFIX_RE = re.compile(r"#flytelist-range=(\d+):(\d+)$")
+
+
+class _ListFile(object):
+    """
+    Reads the chunks of a list file with range reads, only the footer and the index are read up front.
+    """
+
+    def __init__(self, size: int, read_range: typing.Callable[[int, int], bytes]):
+        if size < _FOOTER.size + len(_MAGIC):
+            raise ValueError("Not a FlyteList file, it is too small")
+        index_offset, self.length, self.chunk_size, magic = _FOOTER.unpack(read_range(size - _FOOTER.size, size))
+        if magic != _MAGIC:
+            raise ValueError("Not a FlyteList file, the magic number does not match")
+        index = read_range(index_offset, size - _FOOTER.size)
+        self._chunks = [x for x in _INDEX_ENTRY.iter_unpack(index)]
+        self._read_range = read_range
+
+    def read_chunk(self, i: int) -> LiteralCollection:
+        offset, length = self._chunks[i]
+        pb = _literals_pb2.LiteralCollection()
+        pb.ParseFromString(self._read_range(offset, offset + length))
+        return LiteralCollection.from_flyte_idl(pb)
+
+
+def _local_range_reader(path: str) -> typing.Callable[[int, int], bytes]:
+    def read_range(start: int, end: int) -> bytes:
+        with open(path, "rb") as f:
+            f.seek(start)
+            return f.read(end - start)
+
+    return read_range
+
+
+def _open_list_file(ctx: FlyteContext, uri: str) -> _ListFile:
+    if ctx.file_access.is_remote(uri) and not uri.startswith("file:/"):
+        source = ctx.file_access.open_ranges(uri)
+        if source is not None:
+            return _ListFile(*source)
+        # The store can't serve byte ranges
+        local_path = ctx.file_access.get_random_local_path(uri)
+        ctx.file_access.get_data(uri, local_path)
+        uri = local_path
+    path = strip_file_header(uri)
+    return _ListFile(os.path.getsize(path), _local_range_reader(path))
+
+
+def _write_list_file(
+    ctx: FlyteContext, values: typing.Iterable, element_type: typing.Type, chunk_size: int, path: str
+) -> int:
+    list_type = typing.List[element_type]
+    list_literal_type = TypeEngine.to_literal_type(list_type)
+    length = 0
+    index = []
+    with open(path, "wb") as f:
+        f.write(_MAGIC)
+        it = iter(values)
+        while True:
+            chunk = list(itertools.islice(it, chunk_size))
+            if not chunk:
+                break
+            data = TypeEngine.to_literal(ctx, chunk, list_type, list_literal_type).collection.to_flyte_idl()
+            data = data.SerializeToString()
+            index.append(_INDEX_ENTRY.pack(f.tell(), len(data)))
+            f.write(data)
+            length += len(chunk)
+        index_offset = f.tell()
+        f.write(b"".join(index))
+        f.write(_FOOTER.pack(index_offset, length, chunk_size, _MAGIC))
+    return length
+
+
+class FlyteList(collections.abc.Sequence, typing.Generic[T]):
+    """
+    A list that is stored as a file on the blob store instead of being inlined in the inputs and outputs of tasks.
+    Use it for very large lists, e.g. ::
+
+        @task
+        def t1() -> FlyteList[int]:
+            return FlyteList(range(10_000_000))
+
+        @task
+        def t2(l: FlyteList[int]) -> int:
+            return l[0] + l[-1]
+
+    Elements are written in chunks of ``chunk_size`` elements, each chunk is a serialized collection literal, and an
+    index of the chunks is written at the end of the file. A list that is read back only reads the index at first, and
+    then downloads the chunks of the elements that are accessed (with range reads where the store supports them).
+
+    A plain list can also be returned for a ``FlyteList[T]`` output.
+
+    :py:meth:`partition` splits a list into views that are passed to tasks without copying any elements, so map
+    tasks can consume a large list element-wise or chunk-wise ::
+
+        @task
+        def count(part: FlyteList[str]) -> int:
+            return sum(1 for x in part if x)
+
+        @workflow
+        def wf(l: FlyteList[str]) -> typing.List[int]:
+            return map_task(count)(part=partition(l=l))
+
+    where ``partition`` is a task returning ``l.partition()``.
+    """
+
+    DEFAULT_CHUNK_SIZE = 1024
+
+    @classmethod
+    def element_type(cls) -> typing.Optional[typing.Type]:
+        return None
+
+    def __class_getitem__(cls, item: typing.Type) -> typing.Type[FlyteList]:
+        if item is None or isinstance(item, typing.TypeVar):
+            return cls
+
+        class _TypedFlyteList(FlyteList):
+            # Get the type engine to see this as kind of a generic
+            __origin__ = FlyteList
+
+            @classmethod
+            def element_type(cls) -> typing.Type:
+                return item
+
+        _TypedFlyteList.__name__ = f"FlyteList[{getattr(item, '__name__', item)}]"
+        return _TypedFlyteList
+
+    def __init__(self, values: typing.Iterable[T] = (), chunk_size: typing.Optional[int] = None):
+        """
+        :param values: The elements of the list
+        :param chunk_size: Number of elements stored in each chunk of the list file
+        """
+        if not isinstance(values, collections.abc.Sequence):
+            values = list(values)
+        self._values = values
+        self._chunk_size = chunk_size or self.DEFAULT_CHUNK_SIZE
+        self._remote_source = None
+        self._file = None
+        self._start = 0
+        self._stop = len(values)
+        self._chunks = collections.OrderedDict()
+
+    @classmethod
+    def _from_file(cls, uri: str, list_file: _ListFile, start: int, stop: int) -> FlyteList:
+        res = cls(())
+        res._values = None
+        res._remote_source = uri
+        res._file = list_file
+        res._chunk_size = list_file.chunk_size
+        res._start = start
+        res._stop = stop
+        return res
+
+    @property
+    def remote_source(self) -> typing.Optional[str]:
+        """
+        The uri of the list file this list was read from, if any.
+        """
+        return self._remote_source
+
+    @property
+    def is_loaded(self) -> bool:
+        """
+        Whether the elements are held in memory. Lists read from a list file only fetch their chunks when accessed.
+        """
+        return self._values is not None
+
+    @property
+    def chunk_size(self) -> int:
+        return self._chunk_size
+
+    def _chunk(self, i: int) -> typing.List[T]:
+        chunk = self._chunks.pop(i, None)
+        if chunk is None:
+            ctx = FlyteContext.current_context()
+            lv = Literal(collection=self._file.read_chunk(i))
+            chunk = TypeEngine.to_python_value(ctx, lv, typing.List[self.element_type()])
+        self._chunks[i] = chunk
+        while len(self._chunks) > _CACHED_CHUNKS:
+            self._chunks.popitem(last=False)
+        return chunk
+
+    def _get(self, i: int) -> T:
+        if self._values is not None:
+            return self._values[i]
+        i += self._start
+        return self._chunk(i // self._chunk_size)[i % self._chunk_size]
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._get(i) for i in range(*index.indices(len(self)))]
+        n = len(self)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("FlyteList index out of range")
+        return self._get(index)
+
+    def __iter__(self) -> typing.Iterator[T]:
+        if self._values is not None:
+            yield from self._values
+            return
+        i = self._start
+        while i < self._stop:
+            chunk = self._chunk(i // self._chunk_size)
+            offset = i % self._chunk_size
+            part = chunk[offset : offset + self._stop - i]
+            yield from part
+            i += len(part)
+
+    def __eq__(self, other):
+        if not isinstance(other, collections.abc.Sequence) or isinstance(other, (str, bytes)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __repr__(self):
+        if self._values is None:
+            return f"FlyteList({self._remote_source}[{self._start}:{self._stop}])"
+        return f"FlyteList({self._values!r})"
+
+    def partition(self, size: typing.Optional[int] = None) -> typing.List[FlyteList[T]]:
+        """
+        Splits the list into consecutive parts of ``size`` elements, by default one chunk each. Parts of a list that
+        was read from a list file are views of the same file, passing them to other tasks copies nothing and each part
+        only reads its own chunks.
+
+        :param size: Number of elements in each part, use 1 to map over individual elements
+        """
+        size = size or self._chunk_size
+        if size <= 0:
+            raise ValueError("Partition size must be positive")
+        cls = type(self)
+        if self._values is not None:
+            return [cls(self._values[i : i + size], chunk_size=self._chunk_size) for i in range(0, len(self), size)]
+        return [
+            cls._from_file(self._remote_source, self._file, start, min(start + size, self._stop))
+            for start in range(self._start, self._stop, size)
+        ]
+
+
+class FlyteListTransformer(TypeTransformer[FlyteList]):
+    """
+    Stores a :py:class:`FlyteList` as a single blob. The range of a list that is a view of a larger list file is
+    appended to the uri of the file, e.g. ``s3://bucket/list.flst#flytelist-range=1024:2048``.
+    """
+
+    FLYTE_LIST_FORMAT = "FlyteList"
+    ELEMENT_TYPE_KEY = "element_type"
+
+    def __init__(self):
+        super().__init__(name="FlyteList", t=FlyteList)
+
+    @staticmethod
+    def _element_type(t: typing.Type[FlyteList]) -> typing.Type:
+        element_type = t.element_type() if hasattr(t, "element_type") else None
+        if element_type is None:
+            raise ValueError("FlyteList needs an element type, e.g. FlyteList[int]")
+        return element_type
+
+    def _blob_type(self) -> _core_types.BlobType:
+        return _core_types.BlobType(
+            format=self.FLYTE_LIST_FORMAT, dimensionality=_core_types.BlobType.BlobDimensionality.SINGLE
+        )
+
+    def get_literal_type(self, t: typing.Type[FlyteList]) -> LiteralType:
+        element_literal_type = TypeEngine.to_literal_type(self._element_type(t))
+        return _type_models.LiteralType(
+            blob=self._blob_type(),
+            metadata={self.ELEMENT_TYPE_KEY: _MessageToDict(element_literal_type.to_flyte_idl())},
+        )
+
+    def to_literal(
+        self,
+        ctx: FlyteContext,
+        python_val: typing.Union[FlyteList, typing.Sequence],
+        python_type: typing.Type[FlyteList],
+        expected: LiteralType,
+    ) -> Literal:
+        meta = BlobMetadata(type=self._blob_type())
+        if isinstance(python_val, FlyteList) and python_val.remote_source is not None:
+            uri = python_val.remote_source
+            if python_val._start != 0 or python_val._stop != python_val._file.length:
+                uri += _VIEW_SUFFIX.format(python_val._start, python_val._stop)
+            return Literal(scalar=Scalar(blob=Blob(metadata=meta, uri=uri)))
+
+        if not isinstance(python_val, collections.abc.Iterable) or isinstance(python_val, (str, bytes, dict)):
+            raise AssertionError(f"Expected a FlyteList or a list, received {type(python_val)}")
+        chunk_size = python_val.chunk_size if isinstance(python_val, FlyteList) else FlyteList.DEFAULT_CHUNK_SIZE
+        local_path = ctx.file_access.get_random_local_path("list.flst")
+        _write_list_file(ctx, python_val, self._element_type(python_type), chunk_size, local_path)
+        remote_path = ctx.file_access.get_random_remote_path(local_path)
+        ctx.file_access.put_data(local_path, remote_path, is_multipart=False)
+        return Literal(scalar=Scalar(blob=Blob(metadata=meta, uri=remote_path)))
+
+    def to_python_value(
+        self, ctx: FlyteContext, lv: Literal, expected_python_type: typing.Type[FlyteList]
+    ) -> FlyteList:
+        if not (lv and lv.scalar and lv.scalar.blob):
+            raise AssertionError(f"Cannot convert {lv} to a FlyteList")
+        if expected_python_type is FlyteList or not issubclass(expected_python_type, FlyteList):
+            raise ValueError("FlyteList needs an element type, e.g. FlyteList[int]")
+        uri = lv.scalar.blob.uri
+        view = _VIEW_SUFFIX_RE.search(uri)
+        if view is not None:
+            uri = uri[: view.start()]
+        list_file = _open_list_file(ctx, uri)
+        start, stop = 0, list_file.length
+        if view is not None:
+            start, stop = int(view.group(1)), int(view.group(2))
+        return expected_python_type._from_file(uri, list_file, start, stop)
+
+    def guess_python_type(self, literal_type: LiteralType) -> typing.Type[FlyteList]:
+        if (
+            literal_type.blob is not None
+            and literal_type.blob.format == self.FLYTE_LIST_FORMAT
+            and literal_type.blob.dimensionality == _core_types.BlobType.BlobDimensionality.SINGLE
+        ):
+            element_type = (literal_type.metadata or {}).get(self.ELEMENT_TYPE_KEY)
+            if element_type is None:
+                return FlyteList
+            pb = _ParseDict(element_type, _types_pb2.LiteralType())
+            return FlyteList[TypeEngine.guess_python_type(LiteralType.from_flyte_idl(pb))]
+        raise ValueError(f"Transformer {self} cannot reverse {literal_type}")
+
+
+TypeEngine.register(FlyteListTransformer())
@@ -0,0 +1,12 @@
+"""
+Flytekit Numpy Array Type
+==========================================================
+.. currentmodule:: flytekit.types.numpy
+
+.. autosummary::
+   :toctree: generated/
+
+   NumpyArrayTransformer
+"""
+
+from .ndarray import NumpyArrayTransformer
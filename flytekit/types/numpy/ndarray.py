@@ -0,0 +1,132 @@
+import typing
+from typing import Type
+
+import numpy as np
+
+from flytekit.core.context_manager import FlyteContext
+from flytekit.core.type_engine import TypeEngine, TypeTransformer
+from flytekit.models.core import types as _core_types
+from flytekit.models.literals import Blob, BlobMetadata, Literal, Scalar
+from flytekit.models.types import LiteralType
+
+
+class NumpyArrayTransformer(TypeTransformer[np.ndarray]):
+    """
+    Stores numpy arrays as ``.npy`` (or ``.npz``) blobs, keeping their dtype and shape. Arrays are read back as
+    read-only memory maps over the downloaded file, so large arrays are never copied into memory as a whole.
+
+    The dtype, shape and file format can be declared with ``typing.Annotated``, e.g.
+
+    .. code-block:: python
+
+        Annotated[np.ndarray, np.float32, (None, 3)]  # float32 arrays with 3 columns
+        Annotated[np.ndarray, "npz"]  # stored compressed, these are loaded into memory when read
+
+    ``np.ndarray[typing.Any, np.dtype[np.float32]]`` declares the dtype as well. Values are cast to the declared dtype
+    when written (only if no data is lost), read values must match the declared dtype and shape.
+    """
+
+    NUMPY_ARRAY_FORMAT = "NumpyArray"
+    _FORMATS = ("npy", "npz")
+
+    def __init__(self):
+        super().__init__(name="Numpy Array", t=np.ndarray)
+
+    @classmethod
+    def get_spec(
+        cls, t: Type[np.ndarray]
+    ) -> typing.Tuple[typing.Optional[np.dtype], typing.Optional[typing.Tuple[typing.Optional[int], ...]], str]:
+        """
+        Returns the dtype, shape (``None`` for any size along a dimension) and file format declared by the type.
+        """
+        dtype, shape, fmt = None, None, "npy"
+        for x in getattr(t, "__metadata__", ()):
+            if isinstance(x, str) and x in cls._FORMATS:
+                fmt = x
+            elif isinstance(x, tuple):
+                shape = x
+            elif isinstance(x, np.dtype) or (isinstance(x, type) and issubclass(x, np.generic)):
+                dtype = np.dtype(x)
+        origin = getattr(t, "__origin__", None)
+        if origin is not None and getattr(origin, "__origin__", None) is np.ndarray:
+            # Annotated[np.ndarray[...], ...]
+            origin_dtype, _, _ = cls.get_spec(origin)
+            dtype = dtype or origin_dtype
+        elif origin is np.ndarray and not hasattr(t, "__metadata__"):
+            # np.ndarray[typing.Any, np.dtype[...]]
+            args = getattr(t, "__args__", ())
+            if len(args) == 2 and getattr(args[1], "__args__", None):
+                dt = args[1].__args__[0]
+                if isinstance(dt, type) and issubclass(dt, np.generic):
+                    dtype = np.dtype(dt)
+        return dtype, shape, fmt
+
+    @staticmethod
+    def _check(arr: np.ndarray, dtype: typing.Optional[np.dtype], shape: typing.Optional[tuple]):
+        if dtype is not None and arr.dtype != dtype:
+            raise AssertionError(f"Expected an array of dtype {dtype}, got {arr.dtype}")
+        if shape is not None and (
+            len(shape) != arr.ndim or any(s is not None and s != a for s, a in zip(shape, arr.shape))
+        ):
+            raise AssertionError(f"Expected an array of shape {shape}, got {arr.shape}")
+
+    def get_literal_type(self, t: Type[np.ndarray]) -> LiteralType:
+        return LiteralType(
+            blob=_core_types.BlobType(
+                format=self.NUMPY_ARRAY_FORMAT, dimensionality=_core_types.BlobType.BlobDimensionality.SINGLE
+            )
+        )
+
+    def to_literal(
+        self, ctx: FlyteContext, python_val: np.ndarray, python_type: Type[np.ndarray], expected: LiteralType
+    ) -> Literal:
+        if not isinstance(python_val, np.ndarray):
+            raise AssertionError(f"Expected a numpy array, received {type(python_val)}")
+        dtype, shape, fmt = self.get_spec(python_type)
+        if dtype is not None and python_val.dtype != dtype:
+            python_val = python_val.astype(dtype, casting="safe", copy=False)
+        self._check(python_val, dtype, shape)
+
+        local_path = ctx.file_access.get_random_local_path(f"array.{fmt}")
+        if fmt == "npz":
+            np.savez_compressed(local_path, python_val)
+        else:
+            np.save(local_path, python_val, allow_pickle=False)
+
+        remote_path = ctx.file_access.get_random_remote_path(local_path)
+        ctx.file_access.put_data(local_path, remote_path, is_multipart=False)
+        meta = BlobMetadata(type=self.get_literal_type(python_type).blob)
+        return Literal(scalar=Scalar(blob=Blob(metadata=meta, uri=remote_path)))
+
+    def to_python_value(self, ctx: FlyteContext, lv: Literal, expected_python_type: Type[np.ndarray]) -> np.ndarray:
+        if not (lv and lv.scalar and lv.scalar.blob):
+            raise AssertionError(f"Cannot convert {lv} to a numpy array")
+        uri = lv.scalar.blob.uri
+        if ctx.file_access.is_remote(uri):
+            local_path = ctx.file_access.get_random_local_path(uri)
+            ctx.file_access.get_data(uri, local_path, is_multipart=False)
+        else:
+            # Local files are mapped in place
+            local_path = uri
+
+        arr = np.load(local_path, mmap_mode="r", allow_pickle=False)
+        if isinstance(arr, np.lib.npyio.NpzFile):
+            # Compressed arrays cannot be memory mapped
+            with arr:
+                arr = arr[arr.files[0]]
+            arr.flags.writeable = False
+        dtype, shape, _ = self.get_spec(expected_python_type)
+        self._check(arr, dtype, shape)
+        return arr
+
+    def guess_python_type(self, literal_type: LiteralType) -> Type[np.ndarray]:
+        if (
+            literal_type.blob is not None
+            and literal_type.blob.format == self.NUMPY_ARRAY_FORMAT
+            and literal_type.blob.dimensionality == _core_types.BlobType.BlobDimensionality.SINGLE
+        ):
+            return np.ndarray
+        raise ValueError(f"Transformer {self} cannot reverse {literal_type}")
+
+
+TypeEngine.register(NumpyArrayTransformer())
@@ -35,9 +35,16 @@ class SchemaOpenMode(Enum):
     WRITE = "w"
 
 
-def generate_ordered_files(directory: os.PathLike, n: int) -> typing.Generator[os.PathLike, None, None]:
-    for i in range(n):
+def generate_ordered_files(
+    directory: os.PathLike, n: typing.Optional[int] = None
+) -> typing.Generator[os.PathLike, None, None]:
+    """
+    Generates the names of the part files of a multipart schema, at most n of them or indefinitely if n is None
+    """
+    i = 0
+    while n is None or i < n:
         yield os.path.join(directory, f"{i:05}")
+        i += 1
 
 
 class SchemaReader(typing.Generic[T]):
@@ -75,8 +82,7 @@ class SchemaWriter(typing.Generic[T]):
         self._to_path = to_path
         self._fmt = fmt
         self._columns = cols
-        # TODO This should be change to send a stop instead of hardcoded to 1024
-        self._file_name_gen = generate_ordered_files(self._to_path, 1024)
+        self._file_name_gen = generate_ordered_files(self._to_path)
 
     @property
     def to_path(self) -> str:
@@ -125,9 +131,16 @@ class LocalIOSchemaWriter(SchemaWriter[T]):
     def _write(self, df: T, path: os.PathLike, **kwargs):
         pass
 
-    def write(self, *dfs, **kwargs):
+    def write(self, *dfs, **kwargs) -> typing.List[str]:
+        """
+        Writes every dataframe as its own part file and returns the paths of the files that were written
+        """
+        paths = []
         for df in dfs:
-            self._write(df, next(self._file_name_gen), **kwargs)
+            path = next(self._file_name_gen)
+            self._write(df, path, **kwargs)
+            paths.append(path)
+        return paths
 
 
 @dataclass
@@ -241,6 +254,8 @@ class FlyteSchema(object):
         self._supported_mode = supported_mode
         # This is a special attribute that indicates if the data was either downloaded or uploaded
         self._downloaded = False
+        # Set (with mark_uploaded) by writers that upload the parts to remote_path themselves
+        self._uploaded = False
         self._downloader = downloader
 
     @property
@@ -255,6 +270,16 @@ class FlyteSchema(object):
     def supported_mode(self) -> SchemaOpenMode:
         return self._supported_mode
 
+    def mark_uploaded(self):
+        """
+        Declares that all the parts of this schema are already at its remote_path, e.g. because a writer uploaded
+        each part as soon as it was written. The contents are then not uploaded again when this is converted to a
+        literal.
+        """
+        if not self._remote_path:
+            raise ValueError("Only a schema with a remote_path can be marked as uploaded")
+        self._uploaded = True
+
     def open(
         self, dataframe_fmt: type = pandas.DataFrame, override_mode: SchemaOpenMode = None
     ) -> typing.Union[SchemaReader, SchemaWriter]:
@@ -346,7 +371,8 @@ class FlyteSchemaTransformer(TypeTransformer[FlyteSchema]):
             remote_path = python_val.remote_path
             if remote_path is None or remote_path == "":
                 remote_path = ctx.file_access.get_random_remote_path()
-            ctx.file_access.put_data(python_val.local_path, remote_path, is_multipart=True)
+            if not (python_val._uploaded and remote_path == python_val.remote_path):
+                ctx.file_access.put_data(python_val.local_path, remote_path, is_multipart=True)
             return Literal(scalar=Scalar(schema=Schema(remote_path, self._get_schema_type(python_type))))
 
         schema = python_type(
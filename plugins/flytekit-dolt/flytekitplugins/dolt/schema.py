@@ -1,13 +1,16 @@
 import logging
+import numbers
+import os
 import tempfile
 import typing
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Type
 
 import dolt_integrations.core as dolt_int
 import doltcli as dolt
 import pandas
-from dataclasses_json import dataclass_json
+from dataclasses_json import config, dataclass_json
+from dolt_integrations.core.interface import parse_branch_conf
 from google.protobuf.json_format import MessageToDict
 from google.protobuf.struct_pb2 import Struct
 
@@ -19,10 +22,27 @@ from flytekit.models.types import LiteralType
 
 logger = logging.getLogger("flytekitplugins.dolt")
 
+CSV = "csv"
+PARQUET = "parquet"
+
+_NOT_SERIALIZED = config(exclude=lambda _: True)
+
 
 @dataclass_json
 @dataclass
 class DoltConfig:
+    """
+    Args:
+        file_format: the format tables are moved between dolt and pandas in, ``csv`` or ``parquet``. Parquet avoids
+            encoding every value as text and keeps the column types.
+        columns: only load these columns of the table or query
+        chunksize: don't load the data when the table is passed into a task, instead read it lazily in chunks of this
+            many rows with :py:meth:`DoltTable.iter_chunks`
+        diff_save: when saving into an existing table, only write the rows that were added or changed (and delete the
+            rows that were removed) relative to the table on the branch, instead of replacing the whole table. This
+            requires ``io_args["primary_key"]``.
+    """
+
     db_path: str
     tablename: typing.Optional[str] = None
     sql: typing.Optional[str] = None
@@ -30,6 +50,10 @@ class DoltConfig:
     branch_conf: typing.Optional[dolt_int.Branch] = None
     meta_conf: typing.Optional[dolt_int.Meta] = None
     remote_conf: typing.Optional[dolt_int.Remote] = None
+    file_format: str = CSV
+    columns: typing.Optional[typing.List[str]] = None
+    chunksize: typing.Optional[int] = None
+    diff_save: bool = False
 
 
 @dataclass_json
@@ -37,6 +61,216 @@ class DoltConfig:
 class DoltTable:
     config: DoltConfig
     data: typing.Optional[pandas.DataFrame] = None
+    # The file a table loaded with a chunksize was exported to, and its format. They are local to the task that loaded
+    # the table, so they are not part of its literal.
+    _export_path: typing.Optional[str] = field(
+        default=None, init=False, repr=False, compare=False, metadata=_NOT_SERIALIZED
+    )
+    _export_format: typing.Optional[str] = field(
+        default=None, init=False, repr=False, compare=False, metadata=_NOT_SERIALIZED
+    )
+
+    def iter_chunks(self, chunksize: typing.Optional[int] = None) -> typing.Generator[pandas.DataFrame, None, None]:
+        """
+        Yields the table in chunks of ``chunksize`` rows (``config.chunksize`` by default). Tables that were loaded
+        with a chunksize are streamed from the exported file, without ever being loaded as a whole.
+        """
+        chunksize = chunksize or self.config.chunksize
+        if not chunksize:
+            raise ValueError("A chunksize is required to iterate over a table in chunks")
+
+        if self.data is not None:
+            for i in range(0, len(self.data), chunksize):
+                yield self.data.iloc[i : i + chunksize]
+            return
+
+        path = self._export_path
+        if path is None:
+            raise ValueError("DoltTable has no data, it needs to be passed into a task before it can be read")
+        if (self._export_format or self.config.file_format) == PARQUET:
+            import pyarrow.parquet as pq
+
+            for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize, columns=self.config.columns):
+                yield batch.to_pandas()
+        else:
+            yield from pandas.read_csv(path, chunksize=chunksize, usecols=self.config.columns)
+
+
+def _quote_identifier(name: str) -> str:
+    return "`" + name.replace("`", "``") + "`"
+
+
+def _sql_literal(v: typing.Any) -> str:
+    if v is None or (isinstance(v, float) and v != v):
+        return "NULL"
+    if isinstance(v, bool):
+        return "TRUE" if v else "FALSE"
+    if isinstance(v, numbers.Number):
+        return str(v)
+    return "'" + str(v).replace("\\", "\\\\").replace("'", "''") + "'"
+
+
+def _read_file(path: str, file_format: str, columns: typing.Optional[typing.List[str]] = None) -> pandas.DataFrame:
+    if file_format == PARQUET:
+        return pandas.read_parquet(path, columns=columns)
+    return pandas.read_csv(path, usecols=columns)
+
+
+def _write_file(df: pandas.DataFrame, path: str, file_format: str):
+    if file_format == PARQUET:
+        df.to_parquet(path, index=False)
+    else:
+        df.to_csv(path, index=False)
+
+
+def _export(db: dolt.Dolt, conf: DoltConfig, filename: str) -> str:
+    """
+    Writes the configured table (or the result of the configured query) to filename. Only the selected columns are
+    exported from a table. Returns the format the file was written in: whole tables are exported in the configured
+    format, but doltcli always writes query results as csv.
+    """
+    load_args = conf.io_args or {}
+    sql = conf.sql
+    if conf.tablename is not None and conf.columns:
+        cols = ", ".join(_quote_identifier(c) for c in conf.columns)
+        sql = f"select {cols} from {_quote_identifier(conf.tablename)}"
+    if sql is None:
+        db.execute(["table", "export", "-f", "--file-type", conf.file_format, conf.tablename, filename])
+        return conf.file_format
+    db.sql(query=sql, result_file=filename, result_format=CSV, **load_args)
+    return CSV
+
+
+def changed_rows(
+    old: pandas.DataFrame, new: pandas.DataFrame, primary_key: typing.List[str]
+) -> typing.Tuple[pandas.DataFrame, pandas.DataFrame]:
+    """
+    Compares the new contents of a table to the old ones and returns the rows of new that were added or changed, and
+    the primary keys of the rows of old that no longer exist.
+    """
+    cols = list(new.columns)
+    rows = new.merge(old[cols].drop_duplicates(), on=cols, how="left", indicator=True)
+    upserts = rows.loc[rows["_merge"] == "left_only", cols]
+    keys = old[primary_key].merge(new[primary_key].drop_duplicates(), on=primary_key, how="left", indicator=True)
+    deleted = keys.loc[keys["_merge"] == "left_only", primary_key]
+    return upserts, deleted
+
+
+def _delete_rows(db: dolt.Dolt, tablename: str, keys: pandas.DataFrame, batch_size: int = 1000):
+    pk_cols = [_quote_identifier(c) for c in keys.columns]
+    for i in range(0, len(keys), batch_size):
+        conditions = [
+            "(" + " and ".join(f"{c} = {_sql_literal(v)}" for c, v in zip(pk_cols, row)) + ")"
+            for row in keys.iloc[i : i + batch_size].itertuples(index=False, name=None)
+        ]
+        db.sql(f"delete from {_quote_identifier(tablename)} where " + " or ".join(conditions), result_format="csv")
+
+
+def _import(db: dolt.Dolt, conf: DoltConfig, df: pandas.DataFrame, tmp_dir: str) -> str:
+    """
+    Writes the dataframe into the table. With diff_save, only the changes relative to the current contents of the
+    table are applied. Returns the file the data was written to.
+    """
+    tablename = conf.tablename
+    save_args = conf.io_args or {}
+    filename = os.path.join(tmp_dir, f"{tablename}.{conf.file_format}")
+    exists = any(t.name == tablename for t in db.ls())
+
+    mode = "-r" if exists else "-c"
+    if exists and conf.diff_save:
+        primary_key = save_args.get("primary_key")
+        if not primary_key:
+            raise ValueError("diff_save requires the primary key of the table in io_args['primary_key']")
+        current = os.path.join(tmp_dir, f"current.{conf.file_format}")
+        db.execute(["table", "export", "-f", "--file-type", conf.file_format, tablename, current])
+        old = _read_file(current, conf.file_format)
+        if set(old.columns) == set(df.columns):
+            df, deleted = changed_rows(old, df, primary_key)
+            logger.info(f"Saving {len(df)} changed and deleting {len(deleted)} removed rows of {tablename}")
+            if len(deleted):
+                _delete_rows(db, tablename, deleted)
+            mode = "-u"
+        else:
+            logger.info(f"Columns of {tablename} changed, replacing the whole table")
+
+    _write_file(df, filename, conf.file_format)
+    if mode == "-u" and df.empty:
+        return filename
+    imp = ["table", "import", "--file-type", conf.file_format, mode, tablename]
+    if mode == "-c" and "primary_key" in save_args:
+        imp += ["--pk", ",".join(save_args["primary_key"])]
+    imp.append(filename)
+    db.execute(imp)
+    return filename
+
+
+def _save(db: dolt.Dolt, conf: DoltConfig, df: pandas.DataFrame, commit_message: str):
+    """
+    Follows the steps of ``dolt_integrations.core.save``, but writes the data in the configured format and supports
+    diff based saves.
+    """
+    branch_conf = parse_branch_conf(conf.branch_conf)
+    if conf.remote_conf is not None:
+        conf.remote_conf.pull(db)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        with branch_conf(db) as chk_db:
+            from_commit = chk_db.head
+            filename = _import(db, conf, df, tmp_dir)
+
+            chk_db.sql("select dolt_add('.')", result_format="csv")
+            status = chk_db.sql("select * from dolt_status", result_format="csv")
+            if len(status) > 0:
+                chk_db.sql(f"select dolt_commit('-m', {_sql_literal(commit_message)})", result_format="csv")
+
+            to_commit = chk_db.head
+            branch = chk_db.active_branch
+
+        dolt_int.action_meta(
+            tablename=conf.tablename,
+            filename=filename,
+            from_commit=from_commit,
+            to_commit=to_commit,
+            branch=branch,
+            kind="save",
+            meta_conf=conf.meta_conf,
+        )
+
+    if conf.remote_conf is not None:
+        conf.remote_conf.push(db)
+
+
+def _load(db: dolt.Dolt, conf: DoltConfig, filename: str) -> str:
+    """
+    Follows the steps of ``dolt_integrations.core.load``, but exports the data in the configured format and only the
+    selected columns. Returns the format the data was exported in, see :py:func:`_export`.
+    """
+    if conf.tablename is not None and conf.sql is not None:
+        raise ValueError("Specify one of: tablename, sql")
+
+    branch_conf = parse_branch_conf(conf.branch_conf)
+    if conf.remote_conf is not None:
+        conf.remote_conf.pull(db)
+
+    with branch_conf(db) as chk_db:
+        file_format = _export(db, conf, filename)
+        commit = chk_db.head
+        branch = chk_db.active_branch
+
+    dolt_int.action_meta(
+        tablename=conf.tablename,
+        sql=conf.sql,
+        filename=filename,
+        from_commit=commit,
+        to_commit=commit,
+        branch=branch,
+        kind="load",
+        meta_conf=conf.meta_conf,
+    )
+
+    if conf.remote_conf is not None:
+        conf.remote_conf.push(db)
+    return file_format
 
 
 class DoltTableNameTransformer(TypeTransformer[DoltTable]):
@@ -60,19 +294,22 @@ class DoltTableNameTransformer(TypeTransformer[DoltTable]):
         conf = python_val.config
         if python_val.data is not None and python_val.config.tablename is not None:
             db = dolt.Dolt(conf.db_path)
-            with tempfile.NamedTemporaryFile() as f:
-                python_val.data.to_csv(f.name, index=False)
-                message = f"Generated by Flyte execution id: {ctx.user_space_params.execution_id}"
-                dolt_int.save(
-                    db=db,
-                    tablename=conf.tablename,
-                    filename=f.name,
-                    branch_conf=conf.branch_conf,
-                    meta_conf=conf.meta_conf,
-                    remote_conf=conf.remote_conf,
-                    save_args=conf.io_args,
-                    commit_message=message,
-                )
+            message = f"Generated by Flyte execution id: {ctx.user_space_params.execution_id}"
+            if conf.file_format == CSV and not conf.diff_save:
+                with tempfile.NamedTemporaryFile() as f:
+                    python_val.data.to_csv(f.name, index=False)
+                    dolt_int.save(
+                        db=db,
+                        tablename=conf.tablename,
+                        filename=f.name,
+                        branch_conf=conf.branch_conf,
+                        meta_conf=conf.meta_conf,
+                        remote_conf=conf.remote_conf,
+                        save_args=conf.io_args,
+                        commit_message=message,
+                    )
+            else:
+                _save(db, conf, python_val.data, message)
 
         s = Struct()
         s.update(python_val.to_dict())
@@ -92,21 +329,36 @@ class DoltTableNameTransformer(TypeTransformer[DoltTable]):
         conf = DoltConfig(**conf_dict)
         db = dolt.Dolt(conf.db_path)
 
-        with tempfile.NamedTemporaryFile() as f:
-            dolt_int.load(
-                db=db,
-                tablename=conf.tablename,
-                sql=conf.sql,
-                filename=f.name,
-                branch_conf=conf.branch_conf,
-                meta_conf=conf.meta_conf,
-                remote_conf=conf.remote_conf,
-                load_args=conf.io_args,
-            )
-            df = pandas.read_csv(f)
-            lv.data = df
-
-        return lv
+        if conf.file_format == CSV and not conf.columns and not conf.chunksize:
+            with tempfile.NamedTemporaryFile() as f:
+                dolt_int.load(
+                    db=db,
+                    tablename=conf.tablename,
+                    sql=conf.sql,
+                    filename=f.name,
+                    branch_conf=conf.branch_conf,
+                    meta_conf=conf.meta_conf,
+                    remote_conf=conf.remote_conf,
+                    load_args=conf.io_args,
+                )
+                df = pandas.read_csv(f)
+            return DoltTable(config=conf, data=df)
+
+        if conf.chunksize:
+            # The export is kept around for the table to be read lazily with iter_chunks
+            export_dir = ctx.file_access.get_random_local_directory() if ctx else tempfile.mkdtemp()
+            filename = os.path.join(export_dir, f"export.{conf.file_format}")
+            file_format = _load(db, conf, filename)
+            table = DoltTable(config=conf)
+            table._export_path = filename
+            table._export_format = file_format
+            return table
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filename = os.path.join(tmp_dir, f"export.{conf.file_format}")
+            file_format = _load(db, conf, filename)
+            df = _read_file(filename, file_format, conf.columns if conf.sql is not None else None)
+        return DoltTable(config=conf, data=df)
 
 
 TypeEngine.register(DoltTableNameTransformer())
@@ -1,7 +1,10 @@
+import collections
 import datetime
 import logging
 import os
 import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Type, Union
 
@@ -39,6 +42,42 @@ class BatchRequestConfig(object):
     batch_spec_passthrough: Optional[Dict[str, Any]] = None
 
 
+# Table expectations that hold for every part of a dataset if they hold for the whole dataset, the other table
+# expectations (e.g. row counts) can't be checked part by part
+_PART_WISE_TABLE_EXPECTATIONS = {
+    "expect_table_columns_to_match_ordered_list",
+    "expect_table_columns_to_match_set",
+    "expect_table_column_count_to_equal",
+    "expect_table_column_count_to_be_between",
+}
+
+
+def _merge_validation_results(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Merges the validation results of the parts of a dataset that were validated against the same expectation suite.
+    An expectation succeeds if it succeeded on every part, the result of the first part it failed on is kept so that
+    the observed values of the failure are reported.
+    """
+    merged = dict(results[0])
+    expectation_results = []
+    for i, first in enumerate(results[0]["results"]):
+        failed = next((r["results"][i] for r in results if r["results"][i]["success"] is False), None)
+        expectation_results.append(failed or first)
+
+    successful = sum(1 for r in expectation_results if r["success"])
+    evaluated = len(expectation_results)
+    merged["results"] = expectation_results
+    merged["success"] = all(r["success"] for r in results)
+    merged["statistics"] = {
+        "evaluated_expectations": evaluated,
+        "successful_expectations": successful,
+        "unsuccessful_expectations": evaluated - successful,
+        "success_percent": successful / evaluated * 100 if evaluated else None,
+    }
+    merged["meta"] = dict(merged.get("meta") or {}, validated_parts=len(results))
+    return merged
+
+
 class GreatExpectationsTask(PythonInstanceTask[BatchRequestConfig]):
     """
     This task can be used to validate your data.
@@ -56,6 +95,13 @@ class GreatExpectationsTask(PythonInstanceTask[BatchRequestConfig]):
         checkpoint_params: optional SimpleCheckpoint parameters
         task_config: batchrequest config
         context_root_dir: directory in which GreatExpectations' configuration resides
+        validate_parts: validate every part of a FlyteSchema separately and in parallel, and merge the results,
+            instead of loading the whole dataset into one batch (RuntimeBatchRequest only). Suites with table
+            expectations other than ones on the columns (e.g. row counts) are rejected, and expectations that
+            aggregate a column (e.g. its mean or uniqueness) are checked against every part on its own
+        sample_fraction: validate a random sample of this fraction of the rows instead of the whole dataset
+        sample_seed: seed of the sampling of FlyteSchema parts, so that the same rows are validated on every run
+        max_workers: maximum number of parts validated at a time
 
     TODO: Connect Data Docs to Flyte Console.
     """
@@ -76,8 +122,14 @@ class GreatExpectationsTask(PythonInstanceTask[BatchRequestConfig]):
         checkpoint_params: Optional[Dict[str, Union[str, List[str]]]] = None,
         task_config: BatchRequestConfig = None,
         context_root_dir: str = "./great_expectations",
+        validate_parts: bool = False,
+        sample_fraction: Optional[float] = None,
+        sample_seed: Optional[int] = None,
+        max_workers: Optional[int] = None,
         **kwargs,
     ):
+        if sample_fraction is not None and not 0 < sample_fraction <= 1:
+            raise ValueError(f"sample_fraction has to be in (0, 1], got {sample_fraction}")
         self._datasource_name = datasource_name
         self._data_connector_name = data_connector_name
         self._expectation_suite_name = expectation_suite_name
@@ -92,6 +144,10 @@ class GreatExpectationsTask(PythonInstanceTask[BatchRequestConfig]):
         """
         self._local_file_path = local_file_path
         self._checkpoint_params = checkpoint_params
+        self._validate_parts = validate_parts
+        self._sample_fraction = sample_fraction
+        self._sample_seed = sample_seed
+        self._max_workers = max_workers
 
         outputs = {"result": Dict[Any, Any]}
 
@@ -159,6 +215,91 @@ class GreatExpectationsTask(PythonInstanceTask[BatchRequestConfig]):
 
         return dataset
 
+    def _sample(self, df):
+        if self._sample_fraction is None or self._sample_fraction == 1:
+            return df
+        return df.sample(frac=self._sample_fraction, random_state=self._sample_seed)
+
+    def _schema_parts(self, dataset: FlyteSchema):
+        """
+        Yields the parts of the schema as pandas DataFrames, sampled if a sample fraction is configured. Sampling part
+        by part means that the whole dataset is never held in memory.
+        """
+        for part in dataset.open().iter():
+            yield self._sample(part)
+
+    def _read_schema(self, dataset: FlyteSchema):
+        if self._sample_fraction is None:
+            return dataset.open().all()
+        import pandas
+
+        return pandas.concat(list(self._schema_parts(dataset)), ignore_index=True)
+
+    def _run_checkpoint(self, context, batch_request: Dict[str, Any]) -> Dict[str, Any]:
+        checkpoint_config = {
+            "class_name": "SimpleCheckpoint",
+            "validations": [
+                {
+                    "batch_request": batch_request,
+                    "expectation_suite_name": self._expectation_suite_name,
+                }
+            ],
+        }
+
+        if self._checkpoint_params:
+            checkpoint = SimpleCheckpoint(
+                f"_tmp_checkpoint_{self._expectation_suite_name}",
+                context,
+                **checkpoint_config,
+                **self._checkpoint_params,
+            )
+        else:
+            checkpoint = SimpleCheckpoint(
+                f"_tmp_checkpoint_{self._expectation_suite_name}", context, **checkpoint_config
+            )
+
+        # identify every run uniquely
+        run_id = RunIdentifier(
+            **{
+                "run_name": self._datasource_name + "_run",
+                "run_time": datetime.datetime.utcnow(),
+            }
+        )
+
+        checkpoint_result = checkpoint.run(run_id=run_id)
+        return convert_to_json_serializable(checkpoint_result.list_validation_results())[0]
+
+    def _validate_schema_parts(self, dataset: FlyteSchema, batch_request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Validates every part of the schema in its own batch, on a pool of threads. Every thread uses its own data
+        context, as data contexts are not safe to share between threads.
+        """
+        local = threading.local()
+
+        def validate(i_part):
+            i, part = i_part
+            if not hasattr(local, "context"):
+                local.context = ge.data_context.DataContext(self._context_root_dir)
+            part_request = dict(batch_request)
+            part_request["runtime_parameters"] = dict(batch_request.get("runtime_parameters") or {}, batch_data=part)
+            logging.debug(f"Validating part {i} of {self._data_asset_name} with {len(part)} rows")
+            return self._run_checkpoint(local.context, part_request)
+
+        # Parts are loaded only as workers become free, so at most one part per worker is waiting in memory
+        workers = self._max_workers or min(32, (os.cpu_count() or 1) + 4)
+        results = []
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending = collections.deque()
+            for i_part in enumerate(self._schema_parts(dataset)):
+                if len(pending) >= workers:
+                    results.append(pending.popleft().result())
+                pending.append(executor.submit(validate, i_part))
+            results.extend(f.result() for f in pending)
+
+        if not results:
+            raise ValueError("The dataset has no parts to validate")
+        return _merge_validation_results(results)
+
     def execute(self, **kwargs) -> Any:
         context = ge.data_context.DataContext(self._context_root_dir)
 
@@ -191,6 +332,21 @@ class GreatExpectationsTask(PythonInstanceTask[BatchRequestConfig]):
             if not self._data_asset_name:
                 raise ValueError("data_asset_name has to be given in a RuntimeBatchRequest")
 
+        if self._validate_parts and not (is_runtime and issubclass(datatype, FlyteSchema)):
+            raise ValueError("validate_parts is only supported for FlyteSchema datasets in a RuntimeBatchRequest")
+        if self._validate_parts:
+            suite = context.get_expectation_suite(self._expectation_suite_name)
+            table_wide = sorted(
+                {
+                    e.expectation_type
+                    for e in suite.expectations
+                    if e.expectation_type.startswith("expect_table_")
+                    and e.expectation_type not in _PART_WISE_TABLE_EXPECTATIONS
+                }
+            )
+            if table_wide:
+                raise ValueError(f"{table_wide} can't be validated part by part, don't use validate_parts with them")
+
         # FlyteFile
         if issubclass(datatype, FlyteFile):
             dataset = self._flyte_file(dataset)
@@ -222,7 +378,8 @@ class GreatExpectationsTask(PythonInstanceTask[BatchRequestConfig]):
             if is_runtime and issubclass(datatype, str):
                 final_batch_request["runtime_parameters"]["query"] = dataset
             elif is_runtime and issubclass(datatype, FlyteSchema):
-                final_batch_request["runtime_parameters"]["batch_data"] = dataset.open().all()
+                if not self._validate_parts:
+                    final_batch_request["runtime_parameters"]["batch_data"] = self._read_schema(dataset)
             else:
                 raise AssertionError("Can only use runtime_parameters for query(str)/schema data")
 
@@ -235,38 +392,18 @@ class GreatExpectationsTask(PythonInstanceTask[BatchRequestConfig]):
                 }
             )
 
-        checkpoint_config = {
-            "class_name": "SimpleCheckpoint",
-            "validations": [
-                {
-                    "batch_request": final_batch_request,
-                    "expectation_suite_name": self._expectation_suite_name,
-                }
-            ],
-        }
-
-        if self._checkpoint_params:
-            checkpoint = SimpleCheckpoint(
-                f"_tmp_checkpoint_{self._expectation_suite_name}",
-                context,
-                **checkpoint_config,
-                **self._checkpoint_params,
-            )
-        else:
-            checkpoint = SimpleCheckpoint(
-                f"_tmp_checkpoint_{self._expectation_suite_name}", context, **checkpoint_config
+        # Sample everything that isn't read into memory by the task through the execution engine
+        if self._sample_fraction is not None and not (is_runtime and issubclass(datatype, FlyteSchema)):
+            final_batch_request["batch_spec_passthrough"] = dict(
+                final_batch_request.get("batch_spec_passthrough") or {},
+                sampling_method="_sample_using_random",
+                sampling_kwargs={"p": self._sample_fraction},
             )
 
-        # identify every run uniquely
-        run_id = RunIdentifier(
-            **{
-                "run_name": self._datasource_name + "_run",
-                "run_time": datetime.datetime.utcnow(),
-            }
-        )
-
-        checkpoint_result = checkpoint.run(run_id=run_id)
-        final_result = convert_to_json_serializable(checkpoint_result.list_validation_results())[0]
+        if is_runtime and issubclass(datatype, FlyteSchema) and self._validate_parts:
+            final_result = self._validate_schema_parts(dataset, final_batch_request)
+        else:
+            final_result = self._run_checkpoint(context, final_batch_request)
 
         result_string = ""
         if final_result["success"] is False:
@@ -1,16 +1,75 @@
+import collections
+import os
 import typing
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Type
 
 import pandas
 import pandera
 
 from flytekit import FlyteContext
+from flytekit.configuration import common as _config_common
 from flytekit.extend import TypeEngine, TypeTransformer
 from flytekit.models.literals import Literal, Scalar, Schema
 from flytekit.models.types import LiteralType, SchemaType
 from flytekit.types.schema import FlyteSchema, PandasSchemaWriter, SchemaFormat, SchemaOpenMode
 from flytekit.types.schema.types import FlyteSchemaTransformer
 
+CHUNK_ROWS = _config_common.FlyteIntegerConfigurationEntry("pandera", "chunk_rows", default=0)
+"""
+If non-zero, dataframes returned from tasks are split into parts of this many rows, every part is validated on its own
+and written as a separate part file of the schema. Inputs are always validated one part file at a time in this mode.
+Only use this with schemas whose checks are row-wise: checks across rows (uniqueness, dataframe-wide statistics) only
+see one chunk at a time.
+"""
+
+WORKERS = _config_common.FlyteIntegerConfigurationEntry("pandera", "workers", default=0)
+"""
+Number of threads used to validate chunks in parallel when chunk_rows is set. Zero means one per CPU.
+"""
+
+
+def _validate_chunks(
+    schema: pandera.DataFrameSchema, chunks: typing.Iterable[pandas.DataFrame]
+) -> typing.List[pandas.DataFrame]:
+    """
+    Validates every chunk on a thread pool and returns the validated chunks in order. If any of the chunks fail, a
+    single SchemaError that describes the failures of all of them is raised. At most one chunk per worker is taken from
+    ``chunks`` ahead of the validations that have finished, so lazily loaded chunks are not all read up front.
+    """
+    workers = WORKERS.get() or os.cpu_count() or 1
+    validated, errors = [], []
+
+    def collect(i: int, f: Future):
+        try:
+            validated.append(f.result())
+        except pandera.errors.SchemaError as e:
+            errors.append((i, e))
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = collections.deque()
+        for i, chunk in enumerate(chunks):
+            if len(pending) >= workers:
+                collect(*pending.popleft())
+            pending.append((i, executor.submit(schema, chunk)))
+        while pending:
+            collect(*pending.popleft())
+
+    if len(errors) == 1:
+        raise errors[0][1]
+    if errors:
+        message = f"{len(errors)} of {len(validated) + len(errors)} chunks failed validation:\n" + "\n".join(
+            f"chunk {i}: {e}" for i, e in errors
+        )
+        failure_cases = [e.failure_cases for _, e in errors if e.failure_cases is not None]
+        raise pandera.errors.SchemaError(
+            schema,
+            None,
+            message,
+            failure_cases=pandas.concat(failure_cases, ignore_index=True) if failure_cases else None,
+        )
+    return validated
+
 
 class PanderaTransformer(TypeTransformer[pandera.typing.DataFrame]):
     _SUPPORTED_TYPES: typing.Dict[
@@ -65,7 +124,13 @@ class PanderaTransformer(TypeTransformer[pandera.typing.DataFrame]):
             w = PandasSchemaWriter(
                 local_dir=local_dir, cols=self._get_col_dtypes(python_type), fmt=SchemaFormat.PARQUET
             )
-            w.write(self._pandera_schema(python_type)(python_val))
+            schema = self._pandera_schema(python_type)
+            chunk_rows = CHUNK_ROWS.get()
+            if chunk_rows and len(python_val) > chunk_rows:
+                chunks = (python_val.iloc[i : i + chunk_rows] for i in range(0, len(python_val), chunk_rows))
+                w.write(*_validate_chunks(schema, chunks))
+            else:
+                w.write(schema(python_val))
             remote_path = ctx.file_access.get_random_remote_directory()
             ctx.file_access.put_data(local_dir, remote_path, is_multipart=True)
             return Literal(scalar=Scalar(schema=Schema(remote_path, self._get_schema_type(python_type))))
@@ -89,7 +154,14 @@ class PanderaTransformer(TypeTransformer[pandera.typing.DataFrame]):
             downloader=downloader,
             supported_mode=SchemaOpenMode.READ,
         )
-        return self._pandera_schema(expected_python_type)(df.open().all())
+        schema = self._pandera_schema(expected_python_type)
+        if CHUNK_ROWS.get():
+            # Validate every part file as it's read, instead of validating a concatenated copy of all of them
+            parts = _validate_chunks(schema, df.open().iter())
+            if not parts:
+                return schema(pandas.DataFrame())
+            return parts[0] if len(parts) == 1 else pandas.concat(parts, copy=False)
+        return schema(df.open().all())
 
 
 TypeEngine.register(PanderaTransformer())
@@ -1,9 +1,13 @@
-import json
+import contextlib
+import functools
 import logging
 import os
+import shutil
+import tempfile
 import typing
 from typing import Any
 
+import ijson
 import nbformat
 import papermill as pm
 from flyteidl.core.literals_pb2 import LiteralMap as _pb2_LiteralMap
@@ -11,6 +15,7 @@ from google.protobuf import text_format as _text_format
 from nbconvert import HTMLExporter
 
 from flytekit import FlyteContext, PythonInstanceTask
+from flytekit.common import utils as common_utils
 from flytekit.common.tasks.sdk_runnable import ExecutionParameters
 from flytekit.extend import Interface, TaskPlugins, TypeEngine
 from flytekit.models.literals import LiteralMap
@@ -23,6 +28,60 @@ def _dummy_task_func():
     return None
 
 
+# record_outputs writes the outputs as a binary LiteralMap to the file named by this variable, if it is set
+_OUTPUTS_PATH_ENV_VAR = "FLYTE_NOTEBOOK_OUTPUTS_PATH"
+
+
+@functools.lru_cache()
+def _html_exporter() -> HTMLExporter:
+    # Loading the templates is a large part of rendering a small notebook, the exporter is reused across executions
+    html_exporter = HTMLExporter()
+    html_exporter.template_name = "classic"
+    return html_exporter
+
+
+@contextlib.contextmanager
+def _outputs_sidecar() -> typing.Generator[str, None, None]:
+    """
+    Points record_outputs at a fresh file for the duration of one execution. The kernel inherits the variable when it is
+    started, warm kernels have it set when they are reset.
+    """
+    directory = tempfile.mkdtemp(prefix="flyte-nb-outputs-")
+    path = os.path.join(directory, "outputs.pb")
+    previous = os.environ.get(_OUTPUTS_PATH_ENV_VAR)
+    os.environ[_OUTPUTS_PATH_ENV_VAR] = path
+    try:
+        yield path
+    finally:
+        if previous is None:
+            os.environ.pop(_OUTPUTS_PATH_ENV_VAR, None)
+        else:
+            os.environ[_OUTPUTS_PATH_ENV_VAR] = previous
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def _scan_outputs_cell(f: typing.BinaryIO) -> typing.Optional[str]:
+    """
+    Finds the text of the first output of the cell tagged "outputs" with a streaming scan of the notebook json. Only
+    that text is kept, so other outputs (e.g. embedded plots) are never materialized as python objects.
+    """
+    tagged = False
+    output_index = -1
+    text = []
+    for prefix, event, value in ijson.parse(f):
+        if prefix == "cells.item" and event == "start_map":
+            tagged, output_index, text = False, -1, []
+        elif prefix == "cells.item.metadata.tags.item" and value == "outputs":
+            tagged = True
+        elif prefix == "cells.item.outputs.item" and event == "start_map":
+            output_index += 1
+        elif output_index == 0 and event == "string" and prefix.startswith("cells.item.outputs.item.data.text/plain"):
+            text.append(value)
+        elif prefix == "cells.item" and event == "end_map" and tagged and text:
+            return " ".join(text)
+    return None
+
+
 class NotebookTask(PythonInstanceTask[T]):
     """
     Simple Papermill based input output handling for a Python Jupyter notebook. This task should be used to wrap
@@ -73,7 +132,16 @@ class NotebookTask(PythonInstanceTask[T]):
 
     #. It captures the executed notebook in its entirety and is available from Flyte with the name ``out_nb``.
     #. It also converts the captured notebook into an ``html`` page, which the FlyteConsole will render called -
-       ``out_rendered_nb``
+       ``out_rendered_nb``. Pass ``render_html=False`` to skip rendering (the output is then not part of the
+       interface).
+
+    Kernel reuse
+    ------------
+    By default every execution starts a new Jupyter kernel. With ``reuse_kernel=True`` the kernel is kept alive for
+    the lifetime of the process and reused by every ``NotebookTask`` that runs in it. The namespace of the kernel is
+    reset before each execution, but imported modules stay loaded and any other global state of the kernel process
+    (e.g. environment variables) carries over between executions. Reusing kernels requires ``papermill>=2.0``,
+    ``jupyter_client>=6`` and ``jupyter_core>=5.0``.
 
     .. note:
 
@@ -109,6 +177,8 @@ class NotebookTask(PythonInstanceTask[T]):
         task_config: T = None,
         inputs: typing.Optional[typing.Dict[str, typing.Type]] = None,
         outputs: typing.Optional[typing.Dict[str, typing.Type]] = None,
+        reuse_kernel: bool = False,
+        render_html: bool = True,
         **kwargs,
     ):
         plugin_class = TaskPlugins.find_pythontask_plugin(type(task_config))
@@ -119,12 +189,16 @@ class NotebookTask(PythonInstanceTask[T]):
         if not os.path.exists(self._notebook_path):
             raise ValueError(f"Illegal notebook path passed in {self._notebook_path}")
 
-        outputs.update(
-            {
-                self._IMPLICIT_OP_NOTEBOOK: self._IMPLICIT_OP_NOTEBOOK_TYPE,
-                self._IMPLICIT_RENDERED_NOTEBOOK: self._IMPLICIT_RENDERED_NOTEBOOK_TYPE,
-            }
-        )
+        self._engine_name = None
+        if reuse_kernel:
+            from .warm_kernel import WARM_KERNEL_ENGINE
+
+            self._engine_name = WARM_KERNEL_ENGINE
+        self._render_html = render_html
+
+        outputs.update({self._IMPLICIT_OP_NOTEBOOK: self._IMPLICIT_OP_NOTEBOOK_TYPE})
+        if render_html:
+            outputs[self._IMPLICIT_RENDERED_NOTEBOOK] = self._IMPLICIT_RENDERED_NOTEBOOK_TYPE
         super().__init__(
             name, task_config, task_type=task_type, interface=Interface(inputs=inputs, outputs=outputs), **kwargs
         )
@@ -150,15 +224,24 @@ class NotebookTask(PythonInstanceTask[T]):
         Parse Outputs from Notebook.
         This looks for a cell, with the tag "outputs" to be present.
         """
-        with open(nb) as json_file:
-            data = json.load(json_file)
-            for p in data["cells"]:
-                meta = p["metadata"]
-                if "outputs" in meta["tags"]:
-                    outputs = " ".join(p["outputs"][0]["data"]["text/plain"])
-                    m = _pb2_LiteralMap()
-                    _text_format.Parse(outputs, m)
-                    return LiteralMap.from_flyte_idl(m)
+        with open(nb, "rb") as json_file:
+            outputs = _scan_outputs_cell(json_file)
+        if outputs is None:
+            return None
+        m = _pb2_LiteralMap()
+        _text_format.Parse(outputs, m)
+        return LiteralMap.from_flyte_idl(m)
+
+    @staticmethod
+    def _extract_outputs_from_cells(cells: typing.List[dict]) -> typing.Optional[LiteralMap]:
+        for p in cells:
+            if "outputs" in p["metadata"].get("tags", []):
+                outputs = p["outputs"][0]["data"]["text/plain"]
+                if not isinstance(outputs, str):
+                    outputs = " ".join(outputs)
+                m = _pb2_LiteralMap()
+                _text_format.Parse(outputs, m)
+                return LiteralMap.from_flyte_idl(m)
         return None
 
     @staticmethod
@@ -168,10 +251,12 @@ class NotebookTask(PythonInstanceTask[T]):
         We are using nbconvert htmlexporter and its classic template
         later about how to customize the exporter further.
         """
-        html_exporter = HTMLExporter()
-        html_exporter.template_name = "classic"
         nb = nbformat.read(from_nb, as_version=4)
-        (body, resources) = html_exporter.from_notebook_node(nb)
+        NotebookTask._render_nb_node_html(nb, to)
+
+    @staticmethod
+    def _render_nb_node_html(nb: nbformat.NotebookNode, to: str):
+        (body, resources) = _html_exporter().from_notebook_node(nb)
 
         with open(to, "w+") as f:
             f.write(body)
@@ -184,11 +269,22 @@ class NotebookTask(PythonInstanceTask[T]):
         singleton
         """
         logging.info(f"Hijacking the call for task-type {self.task_type}, to call notebook.")
-        # Execute Notebook via Papermill.
-        pm.execute_notebook(self._notebook_path, self.output_notebook_path, parameters=kwargs)
-
-        outputs = self.extract_outputs(self.output_notebook_path)
-        self.render_nb_html(self.output_notebook_path, self.rendered_output_path)
+        with _outputs_sidecar() as sidecar:
+            # Execute Notebook via Papermill.
+            out_nb = pm.execute_notebook(
+                self._notebook_path,
+                self.output_notebook_path,
+                parameters=kwargs,
+                engine_name=self._engine_name,
+            )
+
+            if os.path.exists(sidecar):
+                outputs = LiteralMap.from_flyte_idl(common_utils.load_proto_from_file(_pb2_LiteralMap, sidecar))
+            else:
+                # The executed notebook is returned by papermill, there is no need to read it back from disk
+                outputs = self._extract_outputs_from_cells(out_nb.cells)
+        if self._render_html:
+            self._render_nb_node_html(out_nb, self.rendered_output_path)
 
         m = {}
         if outputs:
@@ -226,4 +322,10 @@ def record_outputs(**kwargs) -> str:
         expected = TypeEngine.to_literal_type(type(v))
         lit = TypeEngine.to_literal(ctx, python_type=type(v), python_val=v, expected=expected)
         m[k] = lit
-    return LiteralMap(literals=m).to_flyte_idl()
+    lm = LiteralMap(literals=m).to_flyte_idl()
+
+    # The task reads the binary sidecar, the text form in the cell output is kept for notebooks run outside of a task
+    sidecar = os.environ.get(_OUTPUTS_PATH_ENV_VAR)
+    if sidecar:
+        common_utils.write_proto_to_file(lm, sidecar)
+    return lm
@@ -0,0 +1,105 @@
+"""
+The papermill engine behind ``NotebookTask(reuse_kernel=True)``. It relies on ``papermill>=2.0``, ``jupyter_client>=6``
+and ``jupyter_core>=5.0``, newer than what the plugin otherwise requires, so it is only imported when a task reuses
+kernels.
+"""
+import atexit
+import logging
+import os
+import threading
+import typing
+
+from jupyter_client import AsyncKernelManager
+from jupyter_core.utils import run_sync
+from papermill.clientwrap import PapermillNotebookClient
+from papermill.engines import NBClientEngine, papermill_engines
+
+from .task import _OUTPUTS_PATH_ENV_VAR
+
+WARM_KERNEL_ENGINE = "flyte_warm_kernel"
+_warm_kernels: typing.Dict[str, AsyncKernelManager] = {}
+_warm_kernels_lock = threading.Lock()
+
+# Clears everything the previous notebook left in the kernel, imported modules stay loaded which is what makes reusing
+# the kernel fast. The working directory is set to the one papermill would have started a fresh kernel in.
+_RESET_KERNEL = "get_ipython().run_line_magic('reset', '-f')\n__import__('os').chdir({cwd!r})"
+
+_SET_OUTPUTS_PATH = "__import__('os').environ[{var!r}] = {path!r}"
+
+
+def _warm_kernel_manager(kernel_name: str) -> AsyncKernelManager:
+    """
+    Returns the kernel manager of the kernel that is kept alive for kernel_name. The kernel itself is started by the
+    notebook client on first use, and again if it died.
+    """
+    with _warm_kernels_lock:
+        km = _warm_kernels.get(kernel_name)
+        if km is None or (km.has_kernel and not run_sync(km.is_alive)()):
+            km = AsyncKernelManager(kernel_name=kernel_name)
+            _warm_kernels[kernel_name] = km
+        return km
+
+
+@atexit.register
+def _shutdown_warm_kernels():
+    for km in _warm_kernels.values():
+        if km.has_kernel:
+            run_sync(km.shutdown_kernel)(now=True)
+    _warm_kernels.clear()
+
+
+class _WarmKernelClient(PapermillNotebookClient):
+    """
+    A notebook client that runs on a kernel which outlives the execution, the kernel is reset before the first cell
+    instead of being restarted.
+    """
+
+    def papermill_execute_cells(self):
+        code = _RESET_KERNEL.format(cwd=os.getcwd())
+        # The kernel was started with the environment of an earlier execution
+        if _OUTPUTS_PATH_ENV_VAR in os.environ:
+            code += "\n" + _SET_OUTPUTS_PATH.format(var=_OUTPUTS_PATH_ENV_VAR, path=os.environ[_OUTPUTS_PATH_ENV_VAR])
+        self.wait_for_reply(self.kc.execute(code, silent=True, store_history=False))
+        super().papermill_execute_cells()
+
+    def execute(self, **kwargs):
+        try:
+            return super().execute(**kwargs)
+        finally:
+            # The client does not clean up after itself when it doesn't own the kernel
+            if self.kc is not None:
+                self.kc.stop_channels()
+                self.kc = None
+
+
+class _WarmKernelEngine(NBClientEngine):
+    @classmethod
+    def execute_managed_notebook(
+        cls,
+        nb_man,
+        kernel_name,
+        log_output=False,
+        stdout_file=None,
+        stderr_file=None,
+        start_timeout=60,
+        execution_timeout=None,
+        **kwargs,
+    ):
+        kwargs.pop("input_path", None)
+        kwargs.pop("startup_timeout", None)
+        timeout = execution_timeout or kwargs.pop("timeout", None)
+        return _WarmKernelClient(
+            nb_man,
+            km=_warm_kernel_manager(kernel_name),
+            timeout=timeout,
+            startup_timeout=start_timeout,
+            kernel_name=kernel_name,
+            log=logging.getLogger("papermill"),
+            log_output=log_output,
+            stdout_file=stdout_file,
+            stderr_file=stderr_file,
+            **kwargs,
+        ).execute()
+
+
+papermill_engines.register(WARM_KERNEL_ENGINE, _WarmKernelEngine)
@@ -4,7 +4,13 @@ PLUGIN_NAME = "papermill"
 
 microlib_name = f"flytekitplugins-{PLUGIN_NAME}"
 
-plugin_requires = ["flytekit>=0.16.0b0,<1.0.0", "papermill>=1.2.0", "nbconvert>=6.0.7", "ipykernel>=5.0.0"]
+plugin_requires = [
+    "flytekit>=0.16.0b0,<1.0.0",
+    "papermill>=1.2.0",
+    "nbconvert>=6.0.7",
+    "ipykernel>=5.0.0",
+    "ijson>=3.0",
+]
 
 __version__ = "0.0.0+develop"
 
@@ -1,2 +1,8 @@
-from .schema import SparkDataFrameSchemaReader, SparkDataFrameSchemaWriter, SparkDataFrameTransformer
+from .schema import (
+    SparkDataFrameHints,
+    SparkDataFrameSchemaReader,
+    SparkDataFrameSchemaWriter,
+    SparkDataFrameTransformer,
+    spark_dataframe,
+)
 from .task import Spark, new_spark_session
@@ -1,4 +1,5 @@
 import typing
+from dataclasses import dataclass
 from typing import Type
 
 import pyspark
@@ -10,6 +11,52 @@ from flytekit.models.types import LiteralType, SchemaType
 from flytekit.types.schema import SchemaEngine, SchemaFormat, SchemaHandler, SchemaReader, SchemaWriter
 
 
+@dataclass
+class SparkDataFrameHints(object):
+    """
+    Hints on how a Spark DataFrame is read and written.
+
+    Args:
+        columns: only these columns are read, spark only reads them from the parquet files
+        partition_filter: a SQL expression that is applied when the DataFrame is read, expressions on the partition
+            columns prune the partitions that are read
+        partition_by: the DataFrame is written partitioned by these columns, so that readers filtering on them only
+            read the matching files
+    """
+
+    columns: typing.Optional[typing.List[str]] = None
+    partition_filter: typing.Optional[str] = None
+    partition_by: typing.Optional[typing.List[str]] = None
+
+
+def spark_dataframe(
+    columns: typing.Optional[typing.List[str]] = None,
+    partition_filter: typing.Optional[str] = None,
+    partition_by: typing.Optional[typing.List[str]] = None,
+) -> Type[pyspark.sql.DataFrame]:
+    """
+    Returns a pyspark DataFrame type that carries read and write hints, to be used in the signature of a task.
+
+    .. code-block:: python
+
+        @task(task_config=Spark())
+        def daily(df: spark_dataframe(columns=["ds", "value"], partition_filter="ds = '2021-06-01'")) -> int:
+            ...
+
+        @task(task_config=Spark())
+        def produce() -> spark_dataframe(partition_by=["ds"]):
+            ...
+
+    Partitioned outputs are laid out in hive style directories, which only spark readers understand.
+    """
+    hints = SparkDataFrameHints(columns=columns, partition_filter=partition_filter, partition_by=partition_by)
+    return type("SparkDataFrame", (pyspark.sql.DataFrame,), {"__flyte_spark_hints__": hints})
+
+
+def _hints(t: Type) -> SparkDataFrameHints:
+    return getattr(t, "__flyte_spark_hints__", None) or SparkDataFrameHints()
+
+
 class SparkDataFrameSchemaReader(SchemaReader[pyspark.sql.DataFrame]):
     """
     Implements how SparkDataFrame should be read using the ``open`` method of FlyteSchema
@@ -21,10 +68,26 @@ class SparkDataFrameSchemaReader(SchemaReader[pyspark.sql.DataFrame]):
     def iter(self, **kwargs) -> typing.Generator[T, None, None]:
         raise NotImplementedError("Spark DataFrame reader cannot iterate over individual chunks in spark dataframe")
 
-    def all(self, **kwargs) -> pyspark.sql.DataFrame:
+    def all(
+        self,
+        columns: typing.Optional[typing.List[str]] = None,
+        partition_filter: typing.Optional[str] = None,
+        **kwargs,
+    ) -> pyspark.sql.DataFrame:
+        """
+        Reads the schema lazily. Only the given columns (by default the columns of a typed schema) are read, and the
+        partition filter is pushed down to the scan so that only the matching partitions are listed and read.
+        """
         if self._fmt == SchemaFormat.PARQUET:
             ctx = FlyteContext.current_context().user_space_params
-            return ctx.spark_session.read.parquet(self.from_path)
+            df = ctx.spark_session.read.parquet(self.from_path)
+            if partition_filter:
+                df = df.where(partition_filter)
+            if columns is None:
+                columns = self.column_names
+            if columns:
+                df = df.select(*columns)
+            return df
         raise AssertionError("Only Parquet type files are supported for spark dataframe currently")
 
 
@@ -36,13 +99,16 @@ class SparkDataFrameSchemaWriter(SchemaWriter[pyspark.sql.DataFrame]):
     def __init__(self, to_path: str, cols: typing.Optional[typing.Dict[str, type]], fmt: SchemaFormat):
         super().__init__(to_path, cols, fmt)
 
-    def write(self, *dfs: pyspark.sql.DataFrame, **kwargs):
+    def write(self, *dfs: pyspark.sql.DataFrame, partition_by: typing.Optional[typing.List[str]] = None, **kwargs):
         if dfs is None or len(dfs) == 0:
             return
         if len(dfs) > 1:
             raise AssertionError("Only a single Spark.DataFrame can be written per variable currently")
         if self._fmt == SchemaFormat.PARQUET:
-            dfs[0].write.mode("overwrite").parquet(self.to_path)
+            writer = dfs[0].write.mode("overwrite")
+            if partition_by:
+                writer = writer.partitionBy(*partition_by)
+            writer.parquet(self.to_path)
             return
         raise AssertionError("Only Parquet type files are supported for spark dataframe currently")
 
@@ -71,14 +137,15 @@ class SparkDataFrameTransformer(TypeTransformer[pyspark.sql.DataFrame]):
     ) -> Literal:
         remote_path = ctx.file_access.get_random_remote_directory()
         w = SparkDataFrameSchemaWriter(to_path=remote_path, cols=None, fmt=SchemaFormat.PARQUET)
-        w.write(python_val)
+        w.write(python_val, partition_by=_hints(python_type).partition_by)
         return Literal(scalar=Scalar(schema=Schema(remote_path, self._get_schema_type())))
 
     def to_python_value(self, ctx: FlyteContext, lv: Literal, expected_python_type: Type[pyspark.sql.DataFrame]) -> T:
         if not (lv and lv.scalar and lv.scalar.schema):
             return pyspark.sql.DataFrame()
         r = SparkDataFrameSchemaReader(from_path=lv.scalar.schema.uri, cols=None, fmt=SchemaFormat.PARQUET)
-        return r.all()
+        hints = _hints(expected_python_type)
+        return r.all(columns=hints.columns, partition_filter=hints.partition_filter)
 
 
 # %%
@@ -1,12 +1,17 @@
+import json
+import os
+import threading
 import typing
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
 import pandas as pd
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
 
 from flytekit import current_context, kwtypes
 from flytekit.core.base_sql_task import SQLTask
-from flytekit.core.context_manager import SerializationSettings
+from flytekit.core.context_manager import FlyteContextManager, SerializationSettings
 from flytekit.core.python_customized_container_task import PythonCustomizedContainerTask
 from flytekit.core.shim_task import ShimTaskExecutor
 from flytekit.models import task as task_models
@@ -29,11 +34,15 @@ class SQLAlchemyConfig(object):
         connect_args: sqlalchemy kwarg overrides -- ex: host
         secret_connect_args: flyte secrets loaded into sqlalchemy connect args
             -- ex: {"password": {"name": SECRET_NAME, "group": SECRET_GROUP}}
+        chunksize: if set, the results are streamed from a server side cursor this many rows at a time, and every
+            chunk is written (and uploaded in the background) as its own part of the output schema. This keeps the
+            memory used by the task bounded by the chunk size instead of the size of the result set.
     """
 
     uri: str
     connect_args: typing.Optional[typing.Dict[str, typing.Any]] = None
     secret_connect_args: typing.Optional[typing.Dict[str, Secret]] = None
+    chunksize: typing.Optional[int] = None
 
 
 class SQLAlchemyTask(PythonCustomizedContainerTask[SQLAlchemyConfig], SQLTask[SQLAlchemyConfig]):
@@ -81,9 +90,61 @@ class SQLAlchemyTask(PythonCustomizedContainerTask[SQLAlchemyConfig], SQLTask[SQ
             "uri": self.task_config.uri,
             "connect_args": self.task_config.connect_args or {},
             "secret_connect_args": self.task_config.secret_connect_args,
+            "chunksize": self.task_config.chunksize,
         }
 
 
+# Engines (and with them their connection pools) are shared by all executions within a process
+_ENGINES: typing.Dict[typing.Tuple[str, str], Engine] = {}
+_ENGINES_LOCK = threading.Lock()
+
+# The number of part files that may be waiting to be uploaded while the next chunk is being fetched
+_MAX_PENDING_UPLOADS = 4
+
+
+def _get_engine(uri: str, connect_args: typing.Dict[str, typing.Any]) -> Engine:
+    key = (uri, json.dumps(connect_args, sort_keys=True, default=str))
+    with _ENGINES_LOCK:
+        engine = _ENGINES.get(key)
+        if engine is None:
+            engine = _ENGINES[key] = create_engine(uri, connect_args=connect_args, echo=False)
+        return engine
+
+
+def _upload_part(file_access, local_path: str, remote_path: str):
+    file_access.put_data(local_path, remote_path)
+    # The part is no longer needed locally, so the disk used is bounded by the chunks in flight too
+    os.remove(local_path)
+
+
+def _stream_query_to_schema(connection, query: str, chunksize: int) -> FlyteSchema:
+    """
+    Writes the results of the query into a multipart schema, one part file per chunk of rows. Each part is uploaded
+    as soon as it has been written, while the next chunk is fetched.
+    """
+    ctx = FlyteContextManager.current_context()
+    schema = FlyteSchema(
+        local_path=ctx.file_access.get_random_local_directory(),
+        remote_path=ctx.file_access.get_random_remote_directory(),
+    )
+    writer = schema.open(pd.DataFrame)
+    remote_dir = schema.remote_path.rstrip("/")
+
+    pending = []
+    with ThreadPoolExecutor(max_workers=_MAX_PENDING_UPLOADS) as uploader:
+        for chunk in pd.read_sql_query(query, connection, chunksize=chunksize):
+            for path in writer.write(chunk):
+                if len(pending) >= _MAX_PENDING_UPLOADS:
+                    pending.pop(0).result()
+                remote_part = f"{remote_dir}/{os.path.basename(path)}"
+                pending.append(uploader.submit(_upload_part, ctx.file_access, path, remote_part))
+        for f in pending:
+            f.result()
+
+    schema.mark_uploaded()
+    return schema
+
+
 class SQLAlchemyTaskExecutor(ShimTaskExecutor[SQLAlchemyTask]):
     def execute_from_model(self, tt: task_models.TaskTemplate, **kwargs) -> typing.Any:
         if tt.custom["secret_connect_args"] is not None:
@@ -91,11 +152,16 @@ class SQLAlchemyTaskExecutor(ShimTaskExecutor[SQLAlchemyTask]):
                 value = current_context().secrets.get(secret.group, secret.key)
                 tt.custom["connect_args"][key] = value
 
-        engine = create_engine(tt.custom["uri"], connect_args=tt.custom["connect_args"], echo=False)
+        engine = _get_engine(tt.custom["uri"], tt.custom["connect_args"])
         print(f"Connecting to db {tt.custom['uri']}")
 
         interpolated_query = SQLAlchemyTask.interpolate_query(tt.custom["query_template"], **kwargs)
         print(f"Interpolated query {interpolated_query}")
+        chunksize = tt.custom.get("chunksize")
         with engine.begin() as connection:
+            if chunksize:
+                # stream_results asks the driver for a server side cursor, where it supports one
+                connection = connection.execution_options(stream_results=True)
+                return _stream_query_to_schema(connection, interpolated_query, chunksize)
             df = pd.read_sql_query(interpolated_query, connection)
         return df
@@ -1,6 +1,18 @@
+import contextlib
+import os
+
+import mock
 import pandas
 import pytest
-from flytekitplugins.dolt.schema import DoltConfig, DoltTable, DoltTableNameTransformer
+from flytekitplugins.dolt.schema import (
+    DoltConfig,
+    DoltTable,
+    DoltTableNameTransformer,
+    _load,
+    _save,
+    _sql_literal,
+    changed_rows,
+)
 from google.protobuf.struct_pb2 import Struct
 
 from flytekit.models.literals import Literal, Scalar
@@ -64,3 +76,105 @@ def test_dolt_table_to_literal_error():
             lv=lv,
             expected_python_type=DoltTable,
         )
+
+
+def test_changed_rows():
+    old = pandas.DataFrame({"id": [1, 2, 3], "v": ["a", "b", "c"]})
+    new = pandas.DataFrame({"id": [1, 3, 4], "v": ["a", "x", "d"]})
+
+    upserts, deleted = changed_rows(old, new, ["id"])
+
+    assert upserts.to_dict("list") == {"id": [3, 4], "v": ["x", "d"]}
+    assert deleted.to_dict("list") == {"id": [2]}
+
+
+def test_sql_literal():
+    assert _sql_literal(None) == "NULL"
+    assert _sql_literal(float("nan")) == "NULL"
+    assert _sql_literal(True) == "TRUE"
+    assert _sql_literal(3) == "3"
+    assert _sql_literal("it's") == "'it''s'"
+
+
+def test_iter_chunks(tmp_path):
+    df = pandas.DataFrame({"a": range(5), "b": list("vwxyz")})
+    chunks = list(DoltTable(config=DoltConfig(db_path="p"), data=df).iter_chunks(2))
+    assert [len(c) for c in chunks] == [2, 2, 1]
+
+    path = str(tmp_path / "export.parquet")
+    df.to_parquet(path, index=False)
+    table = DoltTable(config=DoltConfig(db_path="p", file_format="parquet", columns=["b"], chunksize=3))
+    table._export_path = path
+    assert table.to_dict() == {"config": table.config.to_dict(), "data": None}
+    assert path not in repr(table)
+    chunks = list(table.iter_chunks())
+    assert [list(c.columns) for c in chunks] == [["b"], ["b"]]
+    assert pandas.concat(chunks)["b"].tolist() == list("vwxyz")
+
+    with pytest.raises(ValueError):
+        next(DoltTable(config=DoltConfig(db_path="p")).iter_chunks(2))
+
+
+@pytest.fixture
+def fake_dolt(mocker):
+    """
+    A dolt database that exports its table as parquet with ``dolt table export`` and, like doltcli, writes query
+    results as csv regardless of the requested format.
+    """
+    df = pandas.DataFrame({"id": [1, 2], "v": ["a", "b"]})
+    db = mock.MagicMock()
+    db.head = "c0"
+    db.active_branch = "master"
+    db.ls.return_value = []
+
+    def execute(args):
+        if args[:2] == ["table", "export"]:
+            assert args[args.index("--file-type") + 1] == "parquet"
+            df.to_parquet(args[-1], index=False)
+
+    def sql(query=None, result_file=None, result_format=None, **kwargs):
+        if result_file is not None:
+            df[["v"]].to_csv(result_file, index=False)
+            return None
+        if "dolt_status" in query:
+            return [{"table_name": "t"}]
+        return []
+
+    db.execute.side_effect = execute
+    db.sql.side_effect = sql
+    mocker.patch("flytekitplugins.dolt.schema.parse_branch_conf", return_value=contextlib.nullcontext)
+    mocker.patch("flytekitplugins.dolt.schema.dolt_int.action_meta")
+    return db, df
+
+
+def test_load_parquet(fake_dolt, tmp_path):
+    db, df = fake_dolt
+    filename = str(tmp_path / "export.parquet")
+    assert _load(db, DoltConfig(db_path="p", tablename="t", file_format="parquet"), filename) == "parquet"
+    assert pandas.read_parquet(filename).equals(df)
+
+    # Projected columns are exported with a query, which doltcli always writes as csv
+    conf = DoltConfig(db_path="p", tablename="t", file_format="parquet", columns=["v"])
+    assert _load(db, conf, filename) == "csv"
+    assert pandas.read_csv(filename)["v"].tolist() == ["a", "b"]
+
+
+def test_load_parquet_projected_chunks(fake_dolt, mocker):
+    db, _ = fake_dolt
+    mocker.patch("doltcli.Dolt", return_value=db)
+    s = Struct()
+    s.update({"config": {"db_path": "p", "tablename": "t", "file_format": "parquet", "columns": ["v"], "chunksize": 1}})
+    lv = Literal(Scalar(generic=s))
+
+    table = DoltTableNameTransformer.to_python_value(self=None, ctx=None, lv=lv, expected_python_type=DoltTable)
+    assert [c["v"].tolist() for c in table.iter_chunks()] == [["a"], ["b"]]
+
+
+def test_save_parquet(fake_dolt):
+    db, df = fake_dolt
+    _save(db, DoltConfig(db_path="p", tablename="t", file_format="parquet"), df, "it's a 'message'")
+
+    imp = db.execute.call_args[0][0]
+    assert imp[:6] == ["table", "import", "--file-type", "parquet", "-c", "t"]
+    queries = [c[0][0] for c in db.sql.call_args_list if c[0]]
+    assert "select dolt_commit('-m', 'it''s a ''message''')" in queries
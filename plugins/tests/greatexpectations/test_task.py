@@ -407,3 +407,61 @@ def test_ge_flyteschema_workflow():
 
     df = pd.read_csv("data/yellow_tripdata_sample_2019-01.csv")
     my_wf(dataframe=df)
+
+
+def test_ge_runtimebatchrequest_validate_parts():
+    task_object = GreatExpectationsTask(
+        name="test20",
+        datasource_name="my_pandas_datasource",
+        inputs=kwtypes(dataset=FlyteSchema),
+        expectation_suite_name="test.parts",
+        data_connector_name="my_runtime_data_connector",
+        data_asset_name="pandas_data",
+        task_config=BatchRequestConfig(
+            batch_identifiers={
+                "pipeline_stage": "validation",
+            },
+        ),
+        validate_parts=True,
+        sample_fraction=0.5,
+        sample_seed=42,
+        max_workers=1,
+    )
+
+    schema = FlyteSchema()
+    writer = schema.open()
+    df = pd.read_csv("data/yellow_tripdata_sample_2019-01.csv")
+    writer.write(df.iloc[:5000], df.iloc[5000:])
+
+    result = task_object(dataset=schema)
+    assert result["success"] is True
+    assert result["meta"]["validated_parts"] == 2
+    assert result["statistics"]["evaluated_expectations"] == result["statistics"]["successful_expectations"]
+
+    # The row count of the whole dataset can't be checked part by part
+    row_count_task = GreatExpectationsTask(
+        name="test22",
+        datasource_name="my_pandas_datasource",
+        inputs=kwtypes(dataset=FlyteSchema),
+        expectation_suite_name="test.demo",
+        data_connector_name="my_runtime_data_connector",
+        data_asset_name="pandas_data",
+        task_config=BatchRequestConfig(
+            batch_identifiers={
+                "pipeline_stage": "validation",
+            },
+        ),
+        validate_parts=True,
+    )
+    with pytest.raises(ValueError, match="expect_table_row_count_to_be_between"):
+        row_count_task(dataset=schema)
+
+    with pytest.raises(ValueError):
+        GreatExpectationsTask(
+            name="test21",
+            datasource_name="data",
+            inputs=kwtypes(dataset=str),
+            expectation_suite_name="test.demo",
+            data_connector_name="data_example_data_connector",
+            sample_fraction=2,
+        )
@@ -1,3 +1,8 @@
+import os
+import time
+import typing
+
+import mock
 import pandas
 import pandera
 import pytest
@@ -90,3 +95,68 @@ def test_pandera_dataframe_no_schema_model(data):
 
     result = my_wf(df=data)
     assert isinstance(result, pandas.DataFrame)
+
+
+def test_pandera_chunked_validation():
+    class Schema(pandera.SchemaModel):
+        col1: pandera.typing.Series[int] = pandera.Field(ge=0)
+
+    @task
+    def make(data: typing.List[int]) -> pandera.typing.DataFrame[Schema]:
+        return pandas.DataFrame({"col1": data})
+
+    @task
+    def count(df: pandera.typing.DataFrame[Schema]) -> int:
+        return len(df)
+
+    @workflow
+    def my_wf(data: typing.List[int]) -> int:
+        return count(df=make(data=data))
+
+    with mock.patch.dict(os.environ, {"FLYTE_PANDERA_CHUNK_ROWS": "2", "FLYTE_PANDERA_WORKERS": "2"}):
+        # Every chunk is written as its own part file
+        df = make(data=[1, 2, 3, 4, 5])
+        assert len(df) == 5
+        assert my_wf(data=[1, 2, 3, 4, 5]) == 5
+
+        # Failures from all chunks are reported together
+        with pytest.raises(AssertionError, match="^failed to convert return value .+: 2 of 3 chunks failed validation"):
+            make(data=[-1, 2, 3, 4, -5])
+
+        # A single failing chunk raises its own error
+        with pytest.raises(AssertionError, match="^failed to convert return value .+: <Schema Column"):
+            make(data=[1, 2, -3])
+
+
+def test_pandera_chunked_validation_of_parts():
+    from flytekitplugins.pandera.schema import _validate_chunks
+
+    class Schema(pandera.SchemaModel):
+        col1: pandera.typing.Series[int] = pandera.Field(ge=0)
+
+    schema = Schema.to_schema()
+    parts = [pandas.DataFrame({"col1": [i, i + 1]}) for i in range(0, 10, 2)]
+    assert [len(p) for p in _validate_chunks(schema, iter(parts))] == [2] * 5
+
+    parts[1].loc[0, "col1"] = -1
+    parts[3].loc[1, "col1"] = -1
+    with pytest.raises(pandera.errors.SchemaError, match="^2 of 5 chunks failed validation") as e:
+        _validate_chunks(schema, parts)
+    assert len(e.value.failure_cases) == 2
+
+    # Chunks are taken from the iterator only as validations finish
+    validated = []
+
+    def validate(df):
+        time.sleep(0.01)
+        validated.append(df)
+        return df
+
+    def lazy_parts():
+        for i in range(10):
+            # Besides this one, at most one chunk per worker is waiting for its validation
+            assert i - len(validated) <= 2
+            yield pandas.DataFrame({"col1": [i]})
+
+    with mock.patch.dict(os.environ, {"FLYTE_PANDERA_WORKERS": "2"}):
+        assert len(_validate_chunks(validate, lazy_parts())) == 10
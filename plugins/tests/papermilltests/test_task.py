@@ -1,6 +1,7 @@
 import datetime
 import os
 
+import mock
 from flytekitplugins.papermill import NotebookTask
 
 from flytekit import kwtypes
@@ -68,3 +69,55 @@ def test_notebook_task_complex():
     assert nb.python_interface.outputs.keys() == {"h", "w", "x", "out_nb", "out_rendered_nb"}
     assert nb.output_notebook_path == out == _get_nb_path(nb_name, suffix="-out")
     assert nb.rendered_output_path == render == _get_nb_path(nb_name, suffix="-out", ext=".html")
+
+
+def test_notebook_task_reuse_kernel():
+    nb_name = "nb-simple"
+    nb = NotebookTask(
+        name="test",
+        notebook_path=_get_nb_path(nb_name, abs=False),
+        inputs=kwtypes(pi=float),
+        outputs=kwtypes(square=float),
+        reuse_kernel=True,
+    )
+    sqr, out, render = nb.execute(pi=4)
+    assert sqr == 16.0
+    assert os.path.getsize(render) > 0
+
+    sqr, _, _ = nb.execute(pi=3)
+    assert sqr == 9.0
+
+
+def test_notebook_task_without_rendering():
+    nb_name = "nb-simple"
+    nb = NotebookTask(
+        name="test",
+        notebook_path=_get_nb_path(nb_name, abs=False),
+        inputs=kwtypes(pi=float),
+        outputs=kwtypes(square=float),
+        render_html=False,
+    )
+    sqr, out = nb.execute(pi=4)
+    assert sqr == 16.0
+    assert nb.python_interface.outputs.keys() == {"square", "out_nb"}
+
+
+def test_notebook_task_outputs_sidecar():
+    nb_name = "nb-simple"
+    nb = NotebookTask(
+        name="test",
+        notebook_path=_get_nb_path(nb_name, abs=False),
+        inputs=kwtypes(pi=float),
+        outputs=kwtypes(square=float),
+        render_html=False,
+    )
+    # The outputs are read from the binary file written by record_outputs, not from the notebook
+    with mock.patch.object(NotebookTask, "_extract_outputs_from_cells") as from_cells:
+        sqr, out = nb.execute(pi=4)
+        assert sqr == 16.0
+        from_cells.assert_not_called()
+    assert "FLYTE_NOTEBOOK_OUTPUTS_PATH" not in os.environ
+
+    # The streaming scan of the written notebook finds the same outputs
+    outputs = NotebookTask.extract_outputs(out)
+    assert outputs.literals["square"].scalar.primitive.value == 16
@@ -1,5 +1,6 @@
 import pandas
 import pyspark
+from flytekitplugins.spark import spark_dataframe
 from flytekitplugins.spark.task import Spark
 
 import flytekit
@@ -74,3 +75,23 @@ def test_spark_dataframe_return():
         drop=True
     )
     assert result_df.all().all()
+
+
+def test_spark_dataframe_partitioned_projection():
+    @task(task_config=Spark())
+    def produce() -> spark_dataframe(partition_by=["ds"]):
+        session = flytekit.current_context().spark_session
+        return session.createDataFrame(
+            [("a", 1, "2021-06-01"), ("b", 2, "2021-06-01"), ("c", 3, "2021-06-02")], ["name", "value", "ds"]
+        )
+
+    @task(task_config=Spark())
+    def consume(df: spark_dataframe(columns=["value"], partition_filter="ds = '2021-06-01'")) -> int:
+        assert df.columns == ["value"]
+        return df.groupBy().sum("value").collect()[0][0]
+
+    @workflow
+    def my_wf() -> int:
+        return consume(df=produce())
+
+    assert my_wf() == 3
@@ -115,3 +115,31 @@ def test_task_serialization():
 
     assert tt.custom["query_template"] == "select TrackId, Name from tracks limit {{.inputs.limit}}"
     assert tt.container.image != ""
+
+
+def test_task_chunked(sql_server):
+    sql_task = SQLAlchemyTask(
+        "test",
+        query_template="select * from tracks",
+        task_config=SQLAlchemyConfig(uri=sql_server, chunksize=2),
+    )
+
+    @task
+    def my_task(df: FlyteSchema) -> int:
+        # Every chunk of rows is written as its own part file
+        assert len(os.listdir(df.remote_path)) == 3
+        return len(df.open().all())
+
+    @workflow
+    def wf() -> int:
+        return my_task(df=sql_task())
+
+    assert wf() == 5
+    assert sql_task.get_custom(sql_task.SERIALIZE_SETTINGS)["chunksize"] == 2
+
+
+def test_engine_reuse(sql_server):
+    from flytekitplugins.sqlalchemy.task import _get_engine
+
+    assert _get_engine(sql_server, {}) is _get_engine(sql_server, {})
+    assert _get_engine(sql_server, {}) is not _get_engine(sql_server, {"timeout": 1})
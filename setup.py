@@ -28,8 +28,9 @@ schema = ["numpy>=1.14.0,<2.0.0", "pandas>=0.22.0,<2.0.0"]
 hive_sensor = ["hmsclient>=0.0.1,<1.0.0"]
 notebook = ["papermill>=1.2.0", "nbconvert>=6.0.7", "ipykernel>=5.0.0,<6.0.0"]
 sagemaker = ["sagemaker-training>=3.6.2,<4.0.0"]
+msgpack = ["msgpack>=1.0.0,<2.0.0"]
 
-all_but_spark = sidecar + schema + hive_sensor + notebook + sagemaker
+all_but_spark = sidecar + schema + hive_sensor + notebook + sagemaker + msgpack
 
 extras_require = {
     "spark": spark,
@@ -39,6 +40,7 @@ extras_require = {
     "hive_sensor": hive_sensor,
     "notebook": notebook,
     "sagemaker": sagemaker,
+    "msgpack": msgpack,
     "all-spark2.4": spark + all_but_spark,
     "all": spark3 + all_but_spark,
 }
@@ -89,7 +91,6 @@ setup(
         "dataclasses-json>=0.5.2",
         "marshmallow-jsonschema>=0.12.0",
         "natsort>=7.0.1",
-        "dirhash>=0.2.1",
         "docker-image-py>=0.1.10",
         "singledispatchmethod; python_version < '3.8.0'",
         "docstring-parser>=0.9.0",
@@ -0,0 +1,47 @@
+"""
+Measures the per-invocation overhead of calling a small task in a tight local loop, e.g.
+
+    python -m tests.flytekit.loadtests.dispatch_overhead 20000
+"""
+import sys
+import time
+
+from flytekit import task
+from flytekit.core.context_manager import FlyteContextManager
+from flytekit.core.type_engine import TypeEngine
+
+
+@task
+def add(a: int, b: int) -> int:
+    return a + b
+
+
+def measure(n: int):
+    ctx = FlyteContextManager.current_context()
+    lm = TypeEngine.dict_to_literal_map(ctx, {"a": 1, "b": 2})
+    python_types = add.python_interface.inputs
+
+    start = time.perf_counter()
+    for _ in range(n):
+        TypeEngine.literal_map_to_kwargs(ctx, lm, python_types)
+    lookup = time.perf_counter() - start
+
+    plan = add._input_plan
+    start = time.perf_counter()
+    for _ in range(n):
+        plan.literal_map_to_kwargs(ctx, lm)
+    planned = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(n):
+        assert add(a=i, b=1) == i + 1
+    call = time.perf_counter() - start
+
+    print(
+        f"per invocation: input conversion {lookup / n * 1e6:.1f}us with lookups, {planned / n * 1e6:.1f}us with the"
+        f" plan, local task call {call / n * 1e6:.1f}us"
+    )
+
+
+if __name__ == "__main__":
+    measure(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
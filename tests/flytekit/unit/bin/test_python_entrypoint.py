@@ -1,4 +1,6 @@
 import os
+import sys
+import types
 import typing
 from collections import OrderedDict
 
@@ -8,7 +10,14 @@ from click.testing import CliRunner
 from flyteidl.core import literals_pb2 as _literals_pb2
 from flyteidl.core.errors_pb2 import ErrorDocument
 
-from flytekit.bin.entrypoint import _dispatch_execute, _legacy_execute_task, execute_task_cmd
+from flytekit.bin.entrypoint import (
+    _dispatch_execute,
+    _dynamic_job_spec_outputs,
+    _legacy_execute_task,
+    _prepare_in_process_execution,
+    execute_task_cmd,
+    fast_execute_task_cmd,
+)
 from flytekit.common import constants as _constants
 from flytekit.common import utils as _utils
 from flytekit.common.exceptions import user as user_exceptions
@@ -21,6 +30,7 @@ from flytekit.core.dynamic_workflow_task import dynamic
 from flytekit.core.promise import VoidPromise
 from flytekit.core.task import task
 from flytekit.core.type_engine import TypeEngine
+from flytekit.models import dynamic_job as _dynamic_job
 from flytekit.models import literals as _literal_models
 from flytekit.models.core import errors as error_models
 from flytekit.models.core import execution as execution_models
@@ -436,3 +446,71 @@ def test_dispatch_execute_system_error(mock_write_to_file, mock_upload_dir, mock
         assert ed.error.kind == error_models.ContainerError.Kind.RECOVERABLE
         assert "some system exception" in ed.error.message
         assert ed.error.origin == execution_models.ExecutionError.ErrorKind.SYSTEM
+
+
+@mock.patch.dict(os.environ, {"FLYTE_SDK_FAST_EXECUTE_IN_PROCESS": "True"})
+@mock.patch("flytekit.bin.entrypoint._download_distribution", return_value=["task-module.py"])
+@mock.patch("flytekit.bin.entrypoint._execute_task")
+def test_fast_execute_in_process(mock_execute_task, mock_download):
+    cmd = [
+        "--additional-distribution",
+        "s3://my-s3-bucket/fast/123.tar.gz",
+        "--dest-dir",
+        "/tmp/dest",
+        "--",
+        "pyflyte-execute",
+        "--inputs",
+        "in",
+        "--output-prefix",
+        "out",
+        "--resolver",
+        "my.resolver",
+        "task-module",
+        "app",
+    ]
+    result = CliRunner().invoke(fast_execute_task_cmd, cmd)
+    assert result.exit_code == 0, result.output
+    mock_download.assert_called_once_with("s3://my-s3-bucket/fast/123.tar.gz", "/tmp/dest")
+    args = mock_execute_task.call_args[0]
+    assert args[4] == "my.resolver"
+    assert list(args[5]) == ["task-module", "app"]
+    assert args[6:] == ("s3://my-s3-bucket/fast/123.tar.gz", "/tmp/dest")
+
+
+def test_prepare_in_process_execution(tmp_path):
+    dest = str(tmp_path)
+    user_module = types.ModuleType("fast_user_module")
+    user_module.__file__ = os.path.join(dest, "workflows", "fast_user_module.py")
+    # e.g. a virtualenv in the working directory, which is not part of the distribution
+    other_module = types.ModuleType("fast_other_module")
+    other_module.__file__ = os.path.join(dest, "venv", "fast_other_module.py")
+
+    with mock.patch.dict(sys.modules, {"fast_user_module": user_module, "fast_other_module": other_module}):
+        _prepare_in_process_execution(dest, [os.path.join("workflows", "fast_user_module.py")])
+        assert "fast_user_module" not in sys.modules
+        assert sys.modules["fast_other_module"] is other_module
+
+
+def test_dynamic_job_spec_outputs(monkeypatch):
+    @task
+    def t1(a: int) -> str:
+        return f"string is: {a}"
+
+    spec = _dynamic_job.DynamicJobSpec(tasks=[], nodes=[], min_successes=0, outputs=[], subworkflows=[])
+    files = _dynamic_job_spec_outputs(t1, spec)
+    assert list(files.keys()) == [_constants.FUTURES_FILE_NAME]
+    assert files[_constants.FUTURES_FILE_NAME] == spec.to_flyte_idl()
+
+    binding = _literal_models.Binding(
+        var="o0",
+        binding=_literal_models.BindingData(
+            scalar=_literal_models.Scalar(primitive=_literal_models.Primitive(string_value="x" * 100))
+        ),
+    )
+    spec = _dynamic_job.DynamicJobSpec(tasks=[], nodes=[], min_successes=0, outputs=[binding], subworkflows=[])
+    monkeypatch.setenv("FLYTE_SDK_DYNAMIC_JOB_SPEC_MAX_SIZE_BYTES", "50")
+    files = _dynamic_job_spec_outputs(t1, spec)
+    assert list(files.keys()) == [_constants.ERROR_FILE_NAME]
+    err = files[_constants.ERROR_FILE_NAME].error
+    assert err.code == "USER:DynamicJobSpecTooLarge"
+    assert err.kind == error_models.ContainerError.Kind.NON_RECOVERABLE
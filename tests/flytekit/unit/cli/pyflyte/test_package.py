@@ -1,3 +1,5 @@
+import os
+
 import click
 import pytest
 from click.testing import CliRunner
@@ -97,3 +99,36 @@ def test_package():
         )
         assert result.exit_code == 1
         assert result.output is not None
+
+
+def test_get_registrable_entities_incremental(tmp_path):
+    ctx = context_manager.FlyteContextManager.current_context().with_serialization_settings(
+        context_manager.SerializationSettings(
+            project="p",
+            domain="d",
+            version="v",
+            image_config=context_manager.ImageConfig(
+                default_image=context_manager.Image("def", "docker.io/def", "latest")
+            ),
+        )
+    )
+    context_manager.FlyteEntities.entities = [foo, wf]
+    tests_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.realpath(__file__)))))
+    settings_key = serialize.SerializationCache.settings_key(ctx.serialization_settings)
+
+    cache = serialize.SerializationCache(str(tmp_path), settings_key)
+    entities = serialize.get_registrable_entities(
+        ctx, cache=cache, module_digests=serialize.ModuleDigests([tests_root])
+    )
+    outputs = serialize.persist_registrable_entities(entities, str(tmp_path))
+    cache.save(outputs)
+    assert len(entities) == 3
+    assert cache.hits == 0
+
+    cache = serialize.SerializationCache(str(tmp_path), settings_key)
+    cached = serialize.get_registrable_entities(
+        ctx, cache=cache, module_digests=serialize.ModuleDigests([tests_root])
+    )
+    assert cache.hits == 2
+    assert cached == entities
+    assert serialize.persist_registrable_entities(cached, str(tmp_path)) == outputs
@@ -1,6 +1,8 @@
 import mock
+import pytest
 from hmsclient import HMSClient
 from hmsclient.genthrift.hive_metastore import ttypes as _ttypes
+from thrift.transport.TTransport import TTransportException
 
 from flytekit.contrib.sensors.impl import HiveFilteredPartitionSensor, HiveNamedPartitionSensor, HiveTableSensor
 
@@ -26,14 +28,20 @@ def test_HiveNamedPartitionSensor():
     )
     assert hive_named_partition_sensor._schema == "default"
     with mock.patch.object(HMSClient, "open"):
-        with mock.patch.object(HMSClient, "get_partition_by_name"):
+        with mock.patch.object(HMSClient, "get_partitions_by_names", return_value=["p1", "p2"]) as get_partitions:
             success, interval = hive_named_partition_sensor._do_poll()
             assert success
             assert interval is None
+            get_partitions.assert_called_once_with("default", "mocked_table", ["ds=2019-10-10", "ds=2019-10-11"])
+
+        with mock.patch.object(HMSClient, "get_partitions_by_names", return_value=["p1"]):
+            success, interval = hive_named_partition_sensor._do_poll()
+            assert not success
+            assert interval is None
 
         with mock.patch.object(
             HMSClient,
-            "get_partition_by_name",
+            "get_partitions_by_names",
             side_effect=_ttypes.NoSuchObjectException(),
         ):
             success, interval = hive_named_partition_sensor._do_poll()
@@ -56,3 +64,37 @@ def test_HiveFilteredPartitionSensor():
             success, interval = hive_filtered_partition_sensor._do_poll()
             assert not success
             assert interval is None
+
+
+def test_hive_sensors_share_one_connection():
+    a = HiveTableSensor(table_name="a", host="sharedhost", port=1234)
+    b = HiveTableSensor(table_name="b", host="sharedhost", port=1234)
+    assert a._hive_metastore_client is b._hive_metastore_client
+
+    with mock.patch.object(HMSClient, "open") as open_mock, mock.patch.object(HMSClient, "get_table"):
+        a._do_poll()
+        b._do_poll()
+        a._do_poll()
+        assert open_mock.call_count == 1
+
+
+def test_hive_sensor_reconnects_dropped_connection():
+    a = HiveTableSensor(table_name="a", host="reconnecthost", port=1234)
+    b = HiveTableSensor(table_name="b", host="reconnecthost", port=1234)
+
+    with mock.patch.object(HMSClient, "open") as open_mock, mock.patch.object(HMSClient, "close"):
+        with mock.patch.object(HMSClient, "get_table"):
+            assert a._do_poll() == (True, None)
+        # The metastore dropped the idle connection, the poll reconnects instead of failing
+        with mock.patch.object(HMSClient, "get_table", side_effect=[TTransportException(), None]) as get_table:
+            assert a._do_poll() == (True, None)
+            assert get_table.call_count == 2
+        assert open_mock.call_count == 2
+        with mock.patch.object(HMSClient, "get_table"):
+            assert b._do_poll() == (True, None)
+        assert open_mock.call_count == 2
+
+        # An error on the new connection as well is raised
+        with mock.patch.object(HMSClient, "get_table", side_effect=TTransportException()):
+            with pytest.raises(TTransportException):
+                a._do_poll()
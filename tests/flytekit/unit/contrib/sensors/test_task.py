@@ -1,4 +1,7 @@
+import datetime
+
 from flytekit.contrib.sensors.base_sensor import Sensor as _Sensor
+from flytekit.contrib.sensors.base_sensor import sense_all
 from flytekit.contrib.sensors.task import sensor_task
 
 
@@ -20,3 +23,47 @@ def test_sensor_works():
 
     out = my_test_task.unit_test()
     assert len(out) == 0
+
+
+class CountingSensor(_Sensor):
+    def __init__(self, polls_needed, **kwargs):
+        super(CountingSensor, self).__init__(**kwargs)
+        self.polls = 0
+        self._polls_needed = polls_needed
+
+    def _do_poll(self):
+        self.polls += 1
+        return self.polls >= self._polls_needed, None
+
+
+def test_sense_all():
+    interval = datetime.timedelta(milliseconds=10)
+    sensors = [CountingSensor(n, evaluation_interval=interval) for n in (1, 3, 5)]
+    assert sense_all(sensors)
+    assert [s.polls for s in sensors] == [1, 3, 5]
+
+    never = CountingSensor(1000, evaluation_interval=interval)
+    assert not sense_all([never], timeout=datetime.timedelta(milliseconds=50))
+
+
+def test_sensor_backoff():
+    sensor = CountingSensor(
+        1000,
+        evaluation_interval=datetime.timedelta(seconds=1),
+        backoff_factor=2.0,
+        max_evaluation_interval=datetime.timedelta(seconds=5),
+    )
+    waits = []
+    for _ in range(4):
+        sensor._last_executed_time = datetime.datetime(year=1990, month=6, day=30)
+        waits.append(sensor.sense_with_wait_hint()[1].total_seconds())
+    assert waits == [2, 4, 5, 5]
+
+
+def test_sensor_task_with_many_sensors():
+    @sensor_task
+    def my_test_task(wf_params):
+        return [MyMockSensor(), MyMockSensor()]
+
+    out = my_test_task.unit_test()
+    assert len(out) == 0
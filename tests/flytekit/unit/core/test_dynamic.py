@@ -106,3 +106,37 @@ def test_nested_dynamic_local():
 
     res = wf(a=2, b=3)
     assert res == ["fast-2", "fast-3", "fast-4", "fast-5", "fast-6"]
+
+
+def test_dynamic_deduplicates_task_templates():
+    def to_str(a: int) -> str:
+        return str(a)
+
+    t1 = task(to_str)
+    # A distinct task object, but it serializes to the same template as t1
+    t2 = task(to_str)
+
+    @dynamic
+    def my_subwf(a: int):
+        for i in range(a):
+            t1(a=i)
+        t2(a=a)
+
+    with context_manager.FlyteContextManager.with_context(
+        context_manager.FlyteContextManager.current_context().with_serialization_settings(
+            context_manager.SerializationSettings(
+                project="test_proj",
+                domain="test_domain",
+                version="abc",
+                image_config=ImageConfig(Image(name="name", fqn="image", tag="name")),
+                env={},
+            )
+        )
+    ) as ctx:
+        with context_manager.FlyteContextManager.with_context(
+            ctx.with_execution_state(ctx.execution_state.with_params(mode=ExecutionState.Mode.TASK_EXECUTION))
+        ) as ctx:
+            input_literal_map = TypeEngine.dict_to_literal_map(ctx, {"a": 2})
+            dynamic_job_spec = my_subwf.dispatch_execute(ctx, input_literal_map)
+            assert len(dynamic_job_spec.nodes) == 3
+            assert len(dynamic_job_spec.tasks) == 1
@@ -185,3 +185,30 @@ def test_download_caching():
     for _ in range(10):
         os.fspath(f)
     assert mock_downloader.call_count == 1
+
+
+def test_lazy_member_access(tmp_path):
+    remote = tmp_path / "shards"
+    for name in ("chr1.bam", "chr2.bam", "chrX.bam", "index/chr1.bai"):
+        p = remote / name
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_text(name)
+
+    ctx = context_manager.FlyteContext.current_context()
+    lv = TypeEngine.to_literal(ctx, f"file://{remote}", FlyteDirectory, TypeEngine.to_literal_type(FlyteDirectory))
+    fd = TypeEngine.to_python_value(ctx, lv, FlyteDirectory)
+    assert fd.listdir() == ["chr1.bam", "chr2.bam", "chrX.bam", "index/chr1.bai"]
+    assert os.listdir(fd.path) == []
+
+    f = fd.get_file("chrX.bam")
+    assert os.listdir(fd.path) == []
+    with open(f) as fh:
+        assert fh.read() == "chrX.bam"
+    assert os.listdir(fd.path) == ["chrX.bam"]
+
+    local = fd.download(include=["chr1*", "index/*"])
+    assert sorted(os.listdir(local)) == ["chr1.bam", "chrX.bam", "index"]
+    assert not fd.downloaded
+
+    assert sorted(os.listdir(fd)) == ["chr1.bam", "chr2.bam", "chrX.bam", "index"]
+    assert fd.downloaded
@@ -1,6 +1,8 @@
 import os
 from unittest.mock import MagicMock
 
+import responses
+
 import flytekit
 from flytekit.core import context_manager
 from flytekit.core.context_manager import ExecutionState, Image, ImageConfig
@@ -67,10 +69,12 @@ def test_file_handling_local_file_gets_copied():
     ctx = context_manager.FlyteContext.current_context()
     with context_manager.FlyteContextManager.with_context(ctx.with_file_access(fs)) as ctx:
         top_level_files = os.listdir(random_dir)
-        assert len(top_level_files) == 2  # the mock_remote folder and the local folder
+        assert len(top_level_files) == 0  # the mock_remote and local folders are only created when first used
 
+        # Creating the mock remote folder leaves it empty
+        assert fs.remote.sandbox == os.path.join(random_dir, "mock_remote")
         mock_remote_files = os.listdir(os.path.join(random_dir, "mock_remote"))
-        assert len(mock_remote_files) == 0  # the mock_remote folder itself is empty
+        assert len(mock_remote_files) == 0
 
         x = my_wf()
 
@@ -96,10 +100,12 @@ def test_file_handling_local_file_gets_force_no_copy():
     ctx = context_manager.FlyteContext.current_context()
     with context_manager.FlyteContextManager.with_context(ctx.with_file_access(fs)) as ctx:
         top_level_files = os.listdir(random_dir)
-        assert len(top_level_files) == 2  # the mock_remote folder and the local folder
+        assert len(top_level_files) == 0  # the mock_remote and local folders are only created when first used
 
+        # Creating the mock remote folder leaves it empty
+        assert fs.remote.sandbox == os.path.join(random_dir, "mock_remote")
         mock_remote_files = os.listdir(os.path.join(random_dir, "mock_remote"))
-        assert len(mock_remote_files) == 0  # the mock_remote folder itself is empty
+        assert len(mock_remote_files) == 0
 
         workflow_output = my_wf()
 
@@ -263,3 +269,32 @@ def test_download_caching():
     for _ in range(10):
         os.fspath(f)
     assert mock_downloader.call_count == 1
+
+
+@responses.activate
+def test_open_streaming():
+    data = b"header\n" + b"x" * 10000
+    url = "https://data.example.com/reads.fastq"
+
+    def callback(request):
+        start, end = (int(x) for x in request.headers["Range"][len("bytes=") :].split("-"))
+        chunk = data[start : end + 1]
+        return 206, {"Content-Range": f"bytes {start}-{start + len(chunk) - 1}/{len(data)}"}, chunk
+
+    responses.add_callback(responses.GET, url, callback=callback)
+
+    downloader = MagicMock()
+    ff = FlyteFile(path="/tmp/reads.fastq", downloader=downloader)
+    ff._remote_source = url
+    with ff.open("r", streaming=True, block_size=1024) as f:
+        assert f.readline() == "header\n"
+    downloader.assert_not_called()
+    assert len(responses.calls) == 2
+
+
+def test_open_local(tmp_path):
+    p = tmp_path / "local.txt"
+    p.write_text("hello")
+    ff = FlyteFile(path=str(p))
+    with ff.open("r", streaming=True) as f:
+        assert f.read() == "hello"
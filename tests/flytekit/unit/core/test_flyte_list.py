@@ -0,0 +1,105 @@
+import typing
+from dataclasses import dataclass
+
+import mock
+import pytest
+
+from flytekit.core.context_manager import FlyteContext
+from flytekit.core.map_task import map_task
+from flytekit.core.task import task
+from flytekit.core.type_engine import TypeEngine
+from flytekit.core.value_summary import summarize
+from flytekit.core.workflow import workflow
+from flytekit.models.literals import Blob, Literal, Scalar
+from flytekit.types.list import FlyteList
+from flytekit.types.list.types import _ListFile
+
+
+@dataclass
+class Read(object):
+    name: str
+    length: int
+
+
+def test_flyte_list_roundtrip():
+    ctx = FlyteContext.current_context()
+    t = FlyteList[Read]
+    lt = TypeEngine.to_literal_type(t)
+    assert lt.blob.format == "FlyteList"
+    assert TypeEngine.guess_python_type(TypeEngine.to_literal_type(FlyteList[int])).element_type() is int
+
+    values = [Read(name=f"r{i}", length=i) for i in range(25)]
+    lv = TypeEngine.to_literal(ctx, FlyteList(values, chunk_size=10), t, lt)
+    assert lv.scalar.blob.uri.endswith("list.flst")
+
+    with mock.patch.object(_ListFile, "read_chunk", autospec=True, side_effect=_ListFile.read_chunk) as read_chunk:
+        pv = TypeEngine.to_python_value(ctx, lv, t)
+        assert len(pv) == 25
+        assert not pv.is_loaded
+        assert summarize(pv) == f"FlyteList({lv.scalar.blob.uri}[0:25])"
+        assert read_chunk.call_count == 0
+        assert pv[-1] == values[-1]
+        assert pv[21] == values[21]
+        assert read_chunk.call_count == 1
+        assert pv[3:12] == values[3:12]
+        assert list(pv) == values
+    with pytest.raises(IndexError):
+        pv[25]
+
+    # Untyped lists cannot be stored
+    with pytest.raises(ValueError):
+        TypeEngine.to_literal_type(FlyteList)
+
+
+def test_flyte_list_partition():
+    ctx = FlyteContext.current_context()
+    t = FlyteList[int]
+    lt = TypeEngine.to_literal_type(t)
+    lv = TypeEngine.to_literal(ctx, list(range(10)), t, lt)
+    pv = TypeEngine.to_python_value(ctx, lv, t)
+
+    parts = pv.partition(4)
+    assert [len(p) for p in parts] == [4, 4, 2]
+    part_lv = TypeEngine.to_literal(ctx, parts[1], t, lt)
+    assert part_lv.scalar.blob.uri == f"{lv.scalar.blob.uri}#flytelist-range=4:8"
+    part = TypeEngine.to_python_value(ctx, part_lv, t)
+    assert part == [4, 5, 6, 7]
+    assert part.remote_source == lv.scalar.blob.uri
+    assert TypeEngine.to_literal(ctx, pv, t, lt).scalar.blob.uri == lv.scalar.blob.uri
+
+
+def test_flyte_list_uri_with_hash(tmp_path):
+    ctx = FlyteContext.current_context()
+    t = FlyteList[int]
+    lt = TypeEngine.to_literal_type(t)
+    lv = TypeEngine.to_literal(ctx, list(range(10)), t, lt)
+    path = str(tmp_path / "run#1.flst")
+    ctx.file_access.get_data(lv.scalar.blob.uri, path)
+
+    lv = Literal(scalar=Scalar(blob=Blob(metadata=lv.scalar.blob.metadata, uri=path)))
+    pv = TypeEngine.to_python_value(ctx, lv, t)
+    assert pv.remote_source == path
+    assert list(pv) == list(range(10))
+    part = TypeEngine.to_python_value(ctx, TypeEngine.to_literal(ctx, pv.partition(4)[2], t, lt), t)
+    assert part.remote_source == path
+    assert part == [8, 9]
+
+
+def test_flyte_list_in_map_task():
+    @task
+    def make(n: int) -> FlyteList[int]:
+        return FlyteList(range(n), chunk_size=3)
+
+    @task
+    def partition(l: FlyteList[int]) -> typing.List[FlyteList[int]]:
+        return l.partition()
+
+    @task
+    def total(part: FlyteList[int]) -> int:
+        return sum(part)
+
+    @workflow
+    def wf(n: int) -> typing.List[int]:
+        return map_task(total)(part=partition(l=make(n=n)))
+
+    assert wf(n=10) == [3, 12, 21, 9]
@@ -0,0 +1,67 @@
+import typing
+
+import numpy as np
+import pytest
+
+from flytekit.core.context_manager import FlyteContext
+from flytekit.core.task import task
+from flytekit.core.type_engine import TypeEngine
+from flytekit.core.workflow import workflow
+from flytekit.types.numpy import NumpyArrayTransformer
+
+
+def test_ndarray_transformer():
+    assert isinstance(TypeEngine.get_transformer(np.ndarray), NumpyArrayTransformer)
+    assert isinstance(TypeEngine.get_transformer(typing.Annotated[np.ndarray, np.float32]), NumpyArrayTransformer)
+
+    lt = TypeEngine.to_literal_type(np.ndarray)
+    assert lt.blob.format == NumpyArrayTransformer.NUMPY_ARRAY_FORMAT
+    assert TypeEngine.guess_python_type(lt) is np.ndarray
+
+    ctx = FlyteContext.current_context()
+    arr = np.arange(12, dtype=np.int64).reshape(3, 4)
+    lv = TypeEngine.to_literal(ctx, arr, np.ndarray, lt)
+    assert lv.scalar.blob.uri.endswith(".npy")
+    pv = TypeEngine.to_python_value(ctx, lv, np.ndarray)
+    assert isinstance(pv, np.memmap)
+    assert not pv.flags.writeable
+    assert pv.dtype == np.int64
+    np.testing.assert_array_equal(pv, arr)
+
+
+def test_ndarray_spec():
+    ctx = FlyteContext.current_context()
+    t = typing.Annotated[np.ndarray, np.float32, (None, 2), "npz"]
+    assert NumpyArrayTransformer.get_spec(t) == (np.dtype(np.float32), (None, 2), "npz")
+    assert NumpyArrayTransformer.get_spec(np.ndarray[typing.Any, np.dtype[np.int8]])[0] == np.dtype(np.int8)
+
+    lv = TypeEngine.to_literal(ctx, np.ones((5, 2), dtype=np.float16), t, TypeEngine.to_literal_type(t))
+    assert lv.scalar.blob.uri.endswith(".npz")
+    pv = TypeEngine.to_python_value(ctx, lv, t)
+    assert pv.dtype == np.float32 and pv.shape == (5, 2)
+
+    with pytest.raises(AssertionError):
+        TypeEngine.to_literal(ctx, np.ones((5, 3), dtype=np.float32), t, TypeEngine.to_literal_type(t))
+    with pytest.raises(TypeError):
+        TypeEngine.to_literal(ctx, np.array(["a"]), t, TypeEngine.to_literal_type(t))
+    # float64 doesn't fit into float32 without losing precision
+    with pytest.raises(TypeError):
+        TypeEngine.to_literal(ctx, np.ones((5, 2), dtype=np.float64), t, TypeEngine.to_literal_type(t))
+    with pytest.raises(AssertionError):
+        TypeEngine.to_python_value(ctx, lv, typing.Annotated[np.ndarray, np.int64])
+
+
+def test_ndarray_in_workflow():
+    @task
+    def t1(n: int) -> np.ndarray:
+        return np.arange(n)
+
+    @task
+    def t2(a: np.ndarray) -> int:
+        return int(a.sum())
+
+    @workflow
+    def wf(n: int) -> int:
+        return t2(a=t1(n=n))
+
+    assert wf(n=5) == 10
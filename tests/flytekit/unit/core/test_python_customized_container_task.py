@@ -0,0 +1,48 @@
+import os
+
+import mock
+
+from flytekit import kwtypes
+from flytekit.core.context_manager import FlyteContextManager
+from flytekit.core.python_customized_container_task import TaskTemplateResolver, _load_executor_class
+from flytekit.extras.sqlite3.task import SQLite3Config, SQLite3Task, SQLite3TaskExecutor
+
+
+def test_task_template_cache(tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    sql_task = SQLite3Task(
+        "test",
+        query_template="select * from tracks limit {{.inputs.limit}}",
+        inputs=kwtypes(limit=int),
+        task_config=SQLite3Config(uri="s3://bucket/tracks.zip", compressed=True),
+    )
+    template_path = str(tmp_path / "task_template.pb")
+    with open(template_path, "wb") as f:
+        f.write(sql_task.serialize_to_model(sql_task.SERIALIZE_SETTINGS).to_flyte_idl().SerializeToString())
+    loader_args = [template_path, "flytekit.extras.sqlite3.task.SQLite3TaskExecutor"]
+
+    file_access = FlyteContextManager.current_context().file_access
+    with mock.patch.dict(os.environ, {"FLYTE_SDK_TASK_TEMPLATE_CACHE_DIR": cache_dir}):
+        with mock.patch.object(file_access, "get_data", wraps=file_access.get_data) as get_data:
+            shim = TaskTemplateResolver().load_task(loader_args)
+            assert shim.task_template.custom["query_template"] == "select * from tracks limit {{.inputs.limit}}"
+            assert len(os.listdir(cache_dir)) == 1
+
+            # Parsed templates are reused within the process
+            again = TaskTemplateResolver()
+            first = again.load_task(loader_args)
+            first.task_template.custom["query_template"] = "select 1"
+            # every task gets its own copy of the template, which it may modify
+            assert again.load_task(loader_args).task_template.custom["query_template"].startswith("select * from")
+            # and the downloaded file by every other process on the node
+            assert get_data.call_count == 1
+
+
+def test_load_executor_class_cache():
+    path = "flytekit.extras.sqlite3.task.SQLite3TaskExecutor"
+    assert _load_executor_class(path) is SQLite3TaskExecutor
+
+    with mock.patch("flytekit.core.python_customized_container_task.load_object_from_module") as load:
+        # The executor class is only imported once per process
+        assert _load_executor_class(path) is SQLite3TaskExecutor
+        load.assert_not_called()
@@ -1,10 +1,14 @@
+import typing
+
+import mock
 import pytest
 
-from flytekit import task
+from flytekit import task, workflow
 from flytekit.core.context_manager import Image, ImageConfig, SerializationSettings
 from flytekit.core.python_auto_container import get_registerable_container_image
 from flytekit.core.python_function_task import PythonFunctionTask
 from flytekit.core.tracker import isnested, istestfunction
+from flytekit.core.type_engine import TypeEngine
 from tests.flytekit.unit.core import tasks
 
 
@@ -96,3 +100,27 @@ def test_metadata():
     metadata = foo.metadata
     assert metadata.cache is True
     assert metadata.cache_version == "1.0"
+
+
+def test_conversion_plans_are_reused():
+    @task
+    def t1(a: int, b: typing.List[str]) -> typing.NamedTuple("OP", c=str, d=float):
+        return ",".join(b * a), float(a)
+
+    @workflow
+    def wf(a: int) -> str:
+        c, _ = t1(a=a, b=["x"])
+        return c
+
+    assert wf(a=2) == "x,x"
+    assert t1._input_plan is t1._input_plan
+    assert t1._input_plan.names == ("a", "b")
+    assert t1._input_plan["b"].python_type == typing.List[str]
+    assert t1._output_plan.names == ("c", "d")
+    assert t1._output_plan["d"].literal_type == t1.interface.outputs["d"].type
+
+    # Once the plans exist, only the list transformer looks up a transformer, for its element type once per list
+    with mock.patch.object(TypeEngine, "get_transformer", wraps=TypeEngine.get_transformer) as get_transformer:
+        assert wf(a=3) == "x,x,x"
+        assert t1(a=1, b=["y"]) == ("y", 1.0)
+    assert get_transformer.call_args_list == [mock.call(str)] * 4
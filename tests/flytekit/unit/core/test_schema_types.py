@@ -1,8 +1,10 @@
 from datetime import datetime, timedelta
 
+import mock
 import pytest
 
 from flytekit import kwtypes
+from flytekit.core.context_manager import FlyteContextManager
 from flytekit.core.type_engine import TypeEngine
 from flytekit.types.schema import FlyteSchema, SchemaFormat
 
@@ -36,3 +38,20 @@ def test_bad_conversion():
     lt.schema.columns[0]._type = 15
     with pytest.raises(ValueError):
         TypeEngine.guess_python_type(lt)
+
+
+def test_mark_uploaded():
+    ctx = FlyteContextManager.current_context()
+    t = FlyteSchema[kwtypes(x=int)]
+    schema = FlyteSchema(
+        local_path=ctx.file_access.get_random_local_directory(),
+        remote_path=ctx.file_access.get_random_remote_directory(),
+    )
+    schema.mark_uploaded()
+    with mock.patch.object(ctx.file_access, "put_data") as put_data:
+        lv = TypeEngine.to_literal(ctx, schema, t, TypeEngine.to_literal_type(t))
+    assert lv.scalar.schema.uri == schema.remote_path
+    put_data.assert_not_called()
+
+    with pytest.raises(ValueError):
+        FlyteSchema(local_path=ctx.file_access.get_random_local_directory()).mark_uploaded()
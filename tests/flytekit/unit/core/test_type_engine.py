@@ -1,15 +1,20 @@
 import datetime
 import os
+import sys
 import typing
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import timedelta
 from enum import Enum
 
+import mock
 import pytest
 from dataclasses_json import dataclass_json
 from flyteidl.core import errors_pb2
 
-from flytekit.core.context_manager import FlyteContext, FlyteContextManager
+from flytekit import task, workflow
+from flytekit.common.translator import get_serializable
+from flytekit.core.context_manager import FlyteContext, FlyteContextManager, Image, ImageConfig, SerializationSettings
 from flytekit.core.type_engine import (
     DataclassTransformer,
     DictTransformer,
@@ -21,9 +26,18 @@ from flytekit.core.type_engine import (
 from flytekit.models import types as model_types
 from flytekit.models.core.types import BlobType
 from flytekit.models.literals import Blob, BlobMetadata, Literal, LiteralCollection, LiteralMap, Primitive, Scalar, Void
-from flytekit.models.types import LiteralType, SimpleType
+from flytekit.models.types import LiteralType, SimpleType, SumType
 from flytekit.types.file.file import FlyteFile
 
+default_img = Image(name="default", fqn="test", tag="tag")
+serialization_settings = SerializationSettings(
+    project="project",
+    domain="domain",
+    version="version",
+    env=None,
+    image_config=ImageConfig(default_image=default_img, images=[default_img]),
+)
+
 
 def test_type_engine():
     t = int
@@ -188,13 +202,21 @@ def test_protos():
     ctx = FlyteContext.current_context()
 
     pb = errors_pb2.ContainerError(code="code", message="message")
-    lt = TypeEngine.to_literal_type(errors_pb2.ContainerError)
-    assert lt.simple == SimpleType.STRUCT
+    assert TypeEngine.to_literal_type(errors_pb2.ContainerError).simple == SimpleType.STRUCT
+    with mock.patch.dict(os.environ, {"FLYTE_SDK_PROTOBUF_AS_BINARY": "True"}):
+        lt = TypeEngine.to_literal_type(errors_pb2.ContainerError)
+    assert lt.simple == SimpleType.BINARY
     assert lt.metadata["pb_type"] == "flyteidl.core.errors_pb2.ContainerError"
 
     lit = TypeEngine.to_literal(ctx, pb, errors_pb2.ContainerError, lt)
+    assert lit.scalar.binary.tag == "pb_type=flyteidl.core.errors_pb2.ContainerError"
     new_python_val = TypeEngine.to_python_value(ctx, lit, errors_pb2.ContainerError)
     assert new_python_val == pb
+    with pytest.raises(AssertionError):
+        TypeEngine.to_python_value(ctx, lit, errors_pb2.ErrorDocument)
+
+    # Interfaces that declare messages as generic literals
+    lt = LiteralType(simple=SimpleType.STRUCT, metadata=lt.metadata)
 
     # Test error
     l0 = Literal(scalar=Scalar(primitive=Primitive(integer=4)))
@@ -208,6 +230,30 @@ def test_protos():
     new_python_val = TypeEngine.to_python_value(ctx, lit, errors_pb2.ContainerError)
     assert new_python_val == default_proto
 
+    # Without an interface the default literal type is used
+    assert TypeEngine.to_literal(ctx, pb, errors_pb2.ContainerError, None).scalar.generic is not None
+
+
+def test_protos_struct_interface():
+    @task
+    def t1(e: errors_pb2.ContainerError) -> errors_pb2.ContainerError:
+        return errors_pb2.ContainerError(code=e.code, message=e.message + "!")
+
+    # Tasks registered with struct interfaces keep compiling and running once the setting is turned on
+    with mock.patch.dict(os.environ, {"FLYTE_SDK_PROTOBUF_AS_BINARY": "True"}):
+
+        @workflow
+        def wf(e: errors_pb2.ContainerError) -> errors_pb2.ContainerError:
+            return t1(e=e)
+
+        task_spec = get_serializable(OrderedDict(), serialization_settings, t1)
+        assert task_spec.template.interface.inputs["e"].type.simple == SimpleType.STRUCT
+        assert task_spec.template.interface.outputs["o0"].type.simple == SimpleType.STRUCT
+        get_serializable(OrderedDict(), serialization_settings, wf)
+
+        res = wf(e=errors_pb2.ContainerError(code="code", message="message"))
+    assert res == errors_pb2.ContainerError(code="code", message="message!")
+
 
 def test_guessing_basic():
     b = model_types.LiteralType(simple=model_types.SimpleType.BOOLEAN)
@@ -404,3 +450,149 @@ def test_optional_file():
 
     pv = TypeEngine.to_python_value(ctx, lv, expected_python_type=typing.Optional[FlyteFile])
     assert pv is None
+
+
+def test_union_dispatch():
+    ctx = FlyteContext.current_context()
+    t = typing.Union[int, str, typing.List[int], None]
+    lt = TypeEngine.to_literal_type(t)
+    assert lt is TypeEngine.to_literal_type(t)
+
+    for v in (3, "three", [3], None):
+        lv = TypeEngine.to_literal(ctx, v, t, lt)
+        assert TypeEngine.to_python_value(ctx, lv, t) == v
+    with pytest.raises(ValueError):
+        TypeEngine.to_literal(ctx, 1.5, typing.Union[int, str], TypeEngine.to_literal_type(typing.Union[int, str]))
+
+
+def test_union_plan_matches_reordered_summands():
+    t = typing.Union[int, typing.List[int]]
+    plan = TypeEngine.get_transformer(t).plan(t)
+    int_lt, list_lt = TypeEngine.to_literal_type(int), TypeEngine.to_literal_type(typing.List[int])
+    reordered = LiteralType(sum=SumType(summands=[list_lt, int_lt]))
+    assert plan.summands(reordered) == [int_lt, list_lt]
+    assert plan.summands(LiteralType(sum=SumType(summands=[int_lt]))) == [int_lt, None]
+
+    # Promoting a variant replaces the cached order instead of changing the list callers may be iterating
+    order = plan.for_value([1])
+    before = list(order)
+    plan.succeeded([1], order[-1])
+    assert order == before
+    assert plan.for_value([1])[0] == before[-1]
+
+
+def test_optional_file_converted_once(tmp_path):
+    ctx = FlyteContext.current_context()
+    path = str(tmp_path / "f.txt")
+    with open(path, "w") as f:
+        f.write("hello")
+
+    t = typing.Optional[FlyteFile]
+    transformer = TypeEngine.get_transformer(FlyteFile)
+    with mock.patch.object(transformer, "to_literal", wraps=transformer.to_literal) as to_literal:
+        lv = TypeEngine.to_literal(ctx, FlyteFile(path), t, TypeEngine.to_literal_type(t))
+        assert to_literal.call_count == 1
+    assert lv.scalar.blob is not None
+    assert isinstance(TypeEngine.to_python_value(ctx, lv, t), FlyteFile)
+
+
+@dataclass
+class CodecInner(object):
+    a: int
+    b: typing.Optional[str]
+    c: typing.List[int]
+
+
+@dataclass
+class CodecOuter(object):
+    s: CodecInner
+    m: typing.Dict[str, str]
+
+
+def test_dataclass_codec():
+    ctx = FlyteContext.current_context()
+    transformer = TypeEngine.get_transformer(CodecOuter)
+    codec = transformer.codec(CodecOuter)
+    assert transformer.codec(CodecOuter) is codec
+    assert TypeEngine.to_literal_type(CodecOuter) is codec.literal_type
+
+    v = CodecOuter(s=CodecInner(a=1, b=None, c=[1, 2]), m={"a": "b"})
+    lv = TypeEngine.to_literal(ctx, v, CodecOuter, codec.literal_type)
+    assert TypeEngine.to_python_value(ctx, lv, CodecOuter) == v
+
+    t = typing.List[CodecOuter]
+    vals = [v, CodecOuter(s=CodecInner(a=2, b="x", c=[]), m={})]
+    lv = TypeEngine.to_literal(ctx, vals, t, TypeEngine.to_literal_type(t))
+    assert len(lv.collection.literals) == 2
+    assert TypeEngine.to_python_value(ctx, lv, t) == vals
+
+    del lv.collection.literals[0].record.fields["m"]
+    with pytest.raises(AssertionError, match="Literal is missing a field"):
+        TypeEngine.to_python_value(ctx, lv, t)
+
+
+def test_untyped_dict_struct():
+    ctx = FlyteContext.current_context()
+    v = {"a": 1, "b": [1, 2.5, None, True], "c": {"d": "e", 1: ("f",)}, "lr": 1.0}
+    lv = TypeEngine.to_literal(ctx, v, dict, TypeEngine.to_literal_type(dict))
+    assert lv.scalar.generic is not None
+    pv = TypeEngine.to_python_value(ctx, lv, dict)
+    assert pv == {
+        "a": 1,
+        "b": [1, 2.5, None, True],
+        "c": {"d": "e", "1": ["f"]},
+        "lr": 1.0,
+    }
+    # Struct numbers are doubles, they are read back as floats like the json round trip did
+    assert type(pv["a"]) is float and type(pv["lr"]) is float
+    with pytest.raises(TypeError):
+        TypeEngine.to_literal(ctx, {"a": object()}, dict, TypeEngine.to_literal_type(dict))
+
+
+def test_untyped_dict_msgpack():
+    ctx = FlyteContext.current_context()
+    with mock.patch.dict(os.environ, {"FLYTE_SDK_UNTYPED_DICT_AS_MSGPACK": "True"}):
+        lt = TypeEngine.to_literal_type(dict)
+    assert lt.simple == SimpleType.BINARY
+    assert lt.metadata == {"format": "msgpack"}
+    assert TypeEngine.guess_python_type(lt) is dict
+    assert TypeEngine.to_literal_type(dict).simple == SimpleType.STRUCT
+
+    v = {"a": 2 ** 60, "b": b"\x00\x01", "c": {1: [1.5, None]}}
+    lv = TypeEngine.to_literal(ctx, v, dict, lt)
+    assert lv.scalar.binary.tag == "msgpack"
+    assert TypeEngine.to_python_value(ctx, lv, dict) == v
+
+    # Large dictionaries are offloaded like other binary literals
+    big = {"x": "y" * 100}
+    with mock.patch.dict(os.environ, {"FLYTE_SDK_BINARY_OFFLOAD_THRESHOLD_BYTES": "50"}):
+        lv = TypeEngine.to_literal(ctx, big, dict, lt)
+    assert lv.scalar.binary.tag == "offloaded:msgpack"
+    assert TypeEngine.to_python_value(ctx, lv, dict) == big
+
+    # The setting fails right away, with a clear message, if msgpack is not installed
+    with mock.patch.dict(os.environ, {"FLYTE_SDK_UNTYPED_DICT_AS_MSGPACK": "True"}):
+        with mock.patch.dict(sys.modules, {"msgpack": None}):
+            with pytest.raises(ImportError, match="flytekit\\[msgpack\\]"):
+                TypeEngine.to_literal_type(dict)
+
+
+def test_bytes_and_offloaded_binary():
+    ctx = FlyteContext.current_context()
+    lt = TypeEngine.to_literal_type(bytes)
+    assert lt.simple == SimpleType.BINARY
+    assert TypeEngine.guess_python_type(lt) is bytes
+
+    lit = TypeEngine.to_literal(ctx, b"\x00\x01", bytes, lt)
+    assert lit.scalar.binary.value == b"\x00\x01"
+    assert TypeEngine.to_python_value(ctx, lit, bytes) == b"\x00\x01"
+
+    pb = errors_pb2.ContainerError(code="code", message="x" * 100)
+    env = {"FLYTE_SDK_BINARY_OFFLOAD_THRESHOLD_BYTES": "50", "FLYTE_SDK_PROTOBUF_AS_BINARY": "True"}
+    with mock.patch.dict(os.environ, env):
+        lit = TypeEngine.to_literal(ctx, pb, errors_pb2.ContainerError, TypeEngine.to_literal_type(type(pb)))
+        blit = TypeEngine.to_literal(ctx, b"small", bytes, lt)
+    assert lit.scalar.binary.tag == "offloaded:pb_type=flyteidl.core.errors_pb2.ContainerError"
+    assert len(lit.scalar.binary.value) < 100
+    assert TypeEngine.to_python_value(ctx, lit, errors_pb2.ContainerError) == pb
+    assert blit.scalar.binary.value == b"small"
@@ -0,0 +1,98 @@
+import logging
+import os
+import typing
+from dataclasses import dataclass
+
+import mock
+import numpy as np
+import pandas as pd
+
+from flytekit import task
+from flytekit.core.value_summary import LazySummary, SummaryLimits, register_summarizer, summarize
+from flytekit.loggers import logger
+from flytekit.types.file import FlyteFile
+from flytekit.types.list import FlyteList
+
+
+@dataclass
+class Leaf(object):
+    name: str
+    values: typing.List[int]
+
+
+@dataclass
+class Tree(object):
+    leaves: typing.List[Leaf]
+    extra: typing.Dict[str, float]
+
+
+def test_summarize():
+    limits = SummaryLimits(max_items=3, max_length=40)
+    assert summarize(1, limits) == "1"
+    assert summarize("abc", limits) == "'abc'"
+    assert summarize("x" * 1000, limits) == "str(len=1000)'" + "x" * 26 + "..."
+    assert summarize(b"\0" * 1000, limits) == "bytes(len=1000)"
+    assert summarize(list(range(1000)), limits) == "list(len=1000)[0, 1, 2, ...]"
+    assert summarize({"a": 1}, limits) == "dict(len=1){'a': 1}"
+    assert summarize(Leaf("l", [1]), limits) == "Leaf(name='l', values=list(len=1)[1])"
+
+    df = pd.DataFrame({"a": [1, 2], "b": [3, 4], "c": [5, 6], "d": [7, 8]})
+    limits = SummaryLimits(max_items=2, max_length=100)
+    assert summarize(df, limits) == "DataFrame(shape=(2, 4), columns=['a', 'b', ...])"
+    assert summarize(np.zeros((3, 4), dtype=np.float32), limits) == "ndarray(shape=(3, 4), dtype=float32)"
+    assert summarize(FlyteFile("s3://bucket/key"), limits) == "FlyteFile(s3://bucket/key)"
+    assert summarize(FlyteList(range(5)), limits) == "FlyteList(len=5)[0, 1, ...]"
+
+    # Deeply nested values are cut off, and every level is bounded
+    tree = Tree(leaves=[Leaf(str(i), list(range(100))) for i in range(100)], extra={})
+    s = summarize(tree, SummaryLimits(max_items=2, max_length=1000))
+    leaf = "Leaf(name='{}', values=list(len=100)[...])"
+    assert s == f"Tree(leaves=list(len=100)[{leaf.format(0)}, {leaf.format(1)}, ...], extra=dict(len=0){{}})"
+
+
+def test_register_summarizer():
+    class Model(object):
+        def __init__(self, n):
+            self.n = n
+
+    register_summarizer(Model, lambda v, limits: f"Model({v.n} params)")
+    assert summarize([Model(3)]) == "list(len=1)[Model(3 params)]"
+
+
+def test_lazy_summary():
+    assert str(LazySummary({"a": "x" * 1000, "b": [1] * 1000})).startswith("{a: str(len=1000)'xxx")
+    assert str(LazySummary((1, [2, 3]))) == "(1, list(len=2)[2, 3])"
+    with mock.patch.dict(os.environ, {"FLYTE_SDK_LOGGING_SUMMARIZE_VALUES": "false"}):
+        assert str(LazySummary({"a": [1] * 10})) == str({"a": [1] * 10})
+
+
+def test_task_logging_is_lazy():
+    @task
+    def t1(a: typing.List[int]) -> typing.List[int]:
+        return a
+
+    class Value(object):
+        str_calls = 0
+
+    def count(v, limits):
+        Value.str_calls += 1
+        return "counted"
+
+    register_summarizer(list, count)
+    try:
+        logger.setLevel(logging.WARNING)
+        try:
+            t1(a=[1, 2])
+        finally:
+            logger.setLevel(logging.DEBUG)
+        assert Value.str_calls == 0
+
+        with mock.patch.object(logger, "info") as info:
+            t1(a=[1, 2])
+        messages = [c[0][0] % c[0][1:] for c in info.call_args_list]
+        assert "Invoking" in messages[0] and "counted" in messages[0]
+        assert Value.str_calls == 2
+    finally:
+        from flytekit.core.value_summary import _summarize_sequence
+
+        register_summarizer(list, _summarize_sequence)
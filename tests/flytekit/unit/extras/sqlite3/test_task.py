@@ -1,6 +1,14 @@
+import contextlib
+import os
+import sqlite3
+import zipfile
+
+import mock
 import pandas
+import pytest
 
 from flytekit import kwtypes, task, workflow
+from flytekit.core.context_manager import FlyteContextManager
 from flytekit.extras.sqlite3.task import SQLite3Config, SQLite3Task
 
 # https://www.sqlitetutorial.net/sqlite-sample-database/
@@ -100,3 +108,65 @@ def test_task_serialization():
 
     assert tt.custom["query_template"] == "select TrackId, Name from tracks limit {{.inputs.limit}}"
     assert tt.container.image != ""
+
+
+@pytest.fixture
+def local_db(tmp_path):
+    db_path = str(tmp_path / "tracks.db")
+    with contextlib.closing(sqlite3.connect(db_path)) as con:
+        con.execute("create table tracks (TrackId bigint, Name text)")
+        con.execute("insert into tracks values (0, 'Sue'), (1, 'L'), (2, 'M'), (3, 'Ji'), (4, 'Po')")
+        con.commit()
+    zip_path = str(tmp_path / "tracks.zip")
+    with zipfile.ZipFile(zip_path, "w") as z:
+        z.write(db_path, "tracks.db")
+    return zip_path
+
+
+def test_task_cached_db(local_db, tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    sql_task = SQLite3Task(
+        "test",
+        query_template="select * from tracks limit {{.inputs.limit}}",
+        inputs=kwtypes(limit=int),
+        task_config=SQLite3Config(uri=local_db, compressed=True),
+    )
+
+    file_access = FlyteContextManager.current_context().file_access
+    with mock.patch.dict(os.environ, {"FLYTE_SDK_SQLITE3_DB_CACHE_DIR": cache_dir}):
+        with mock.patch.object(file_access, "download", wraps=file_access.download) as download:
+            assert len(sql_task(limit=3).open().all()) == 3
+            assert len(sql_task(limit=5).open().all()) == 5
+            # The second execution is served from the cache
+            assert download.call_count == 1
+            assert len(os.listdir(cache_dir)) == 1
+            # The archive and the directory it was unpacked to are removed once the database is extracted
+            (entry,) = os.listdir(cache_dir)
+            assert os.listdir(os.path.join(cache_dir, entry)) == ["database"]
+
+            # A new version of the db gets a new cache entry
+            st = os.stat(local_db)
+            os.utime(local_db, ns=(st.st_atime_ns, st.st_mtime_ns + 1000))
+            assert len(sql_task(limit=2).open().all()) == 2
+            assert download.call_count == 2
+            assert len(os.listdir(cache_dir)) == 2
+
+
+def test_task_chunked(local_db):
+    sql_task = SQLite3Task(
+        "test",
+        query_template="select * from tracks",
+        task_config=SQLite3Config(uri=local_db, compressed=True, chunksize=2),
+    )
+
+    @task
+    def my_task(df: FlyteSchema) -> int:
+        # Every chunk of rows is written as its own part file
+        assert len(os.listdir(df.remote_path)) == 3
+        return len(df.open().all())
+
+    @workflow
+    def wf() -> int:
+        return my_task(df=sql_task())
+
+    assert wf() == 5
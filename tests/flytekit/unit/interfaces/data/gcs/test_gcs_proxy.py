@@ -1,4 +1,5 @@
 import os as _os
+import subprocess as _subprocess
 
 import mock as _mock
 import pytest as _pytest
@@ -78,3 +79,14 @@ def test_random_path(mock_update_cmd_config_and_execute, gsutil_parallelism, gcs
     gcs_with_raw_prefix = _gcs_proxy.GCSProxy("gcs://stuff")
     result = gcs_with_raw_prefix.get_random_path()
     assert result.startswith("gcs://stuff")
+
+
+@_mock.patch("flytekit.interfaces.data.gcs.gcs_proxy.GCSProxy._check_binary")
+@_mock.patch("flytekit.interfaces.data.gcs.gcs_proxy._std_subprocess.check_output")
+def test_etag(mock_check_output, mock_check):
+    mock_check_output.return_value = b"gs://bar/tracks.db:\n    Content-Length:         5\n    ETag:  CJLd6ZCD8/ICEAE=\n"
+    gcs_proxy = _gcs_proxy.GCSProxy()
+    assert gcs_proxy.etag("gs://bar/tracks.db") == "CJLd6ZCD8/ICEAE="
+
+    mock_check_output.side_effect = _subprocess.CalledProcessError(1, "gsutil")
+    assert gcs_proxy.etag("gs://bar/missing.db") is None
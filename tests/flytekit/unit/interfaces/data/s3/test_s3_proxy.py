@@ -1,3 +1,5 @@
+import subprocess as _subprocess
+
 import mock as _mock
 
 from flytekit.interfaces.data.s3.s3proxy import AwsS3Proxy as _AwsS3Proxy
@@ -34,3 +36,27 @@ def test_retries(mock_subprocess, mock_delay, mock_check):
     proxy = _AwsS3Proxy()
     assert proxy.exists("s3://test/fdsa/fdsa") is False
     assert mock_subprocess.check_call.call_count == 4
+
+
+@_mock.patch("flytekit.interfaces.data.s3.s3proxy.AwsS3Proxy._check_binary")
+@_mock.patch("flytekit.interfaces.data.s3.s3proxy._std_subprocess.check_output")
+def test_list_directory(mock_check_output, mock_check):
+    mock_check_output.return_value = (
+        b"2021-06-01 10:00:00       1234 data/shards/chr1.bam\n"
+        b"2021-06-01 10:00:00          0 data/shards/sub/\n"
+        b"2021-06-01 10:00:00         10 data/shards/sub/my file.txt\n"
+    )
+    aws = _AwsS3Proxy()
+    assert aws.list_directory("s3://bucket/data/shards") == ["chr1.bam", "sub/my file.txt"]
+    assert mock_check_output.call_args[0][0][-3:] == ["ls", "--recursive", "s3://bucket/data/shards/"]
+
+
+@_mock.patch("flytekit.interfaces.data.s3.s3proxy.AwsS3Proxy._check_binary")
+@_mock.patch("flytekit.interfaces.data.s3.s3proxy._std_subprocess.check_output")
+def test_etag(mock_check_output, mock_check):
+    mock_check_output.return_value = b'"9b2cf535f27731c974343645a3985328"\n'
+    aws = _AwsS3Proxy()
+    assert aws.etag("s3://bucket/tracks.db") == '"9b2cf535f27731c974343645a3985328"'
+
+    mock_check_output.side_effect = _subprocess.CalledProcessError(255, "aws")
+    assert aws.etag("s3://bucket/missing.db") is None
@@ -0,0 +1,73 @@
+import io
+
+import mock
+import pytest
+import requests
+import responses
+
+from flytekit.interfaces.data import ranged
+
+_DATA = bytes(range(256)) * 40
+
+
+def _range_callback(request):
+    start, end = request.headers["Range"][len("bytes=") :].split("-")
+    start, end = int(start), int(end)
+    if start >= len(_DATA):
+        return 416, {"Content-Range": f"bytes */{len(_DATA)}"}, b""
+    chunk = _DATA[start : end + 1]
+    return 206, {"Content-Range": f"bytes {start}-{start + len(chunk) - 1}/{len(_DATA)}"}, chunk
+
+
+def test_ranged_file():
+    calls = []
+
+    def read_range(start, end):
+        calls.append((start, end))
+        return _DATA[start:end]
+
+    with ranged.open_ranged((len(_DATA), read_range), block_size=1000, cache_blocks=2, read_ahead=0) as f:
+        assert f.read(10) == _DATA[:10]
+        assert calls == [(0, 1000)]
+        f.seek(-5, io.SEEK_END)
+        assert f.read() == _DATA[-5:]
+        assert calls[-1] == (10000, 10240)
+        f.seek(995)
+        assert f.read(10) == _DATA[995:1005]
+        assert f.tell() == 1005
+        # The first block is still cached
+        f.seek(0)
+        assert f.read(1) == _DATA[:1]
+        assert calls.count((0, 1000)) == 1
+
+    with ranged.open_ranged((len(_DATA), read_range), block_size=1000, read_ahead=2) as f:
+        assert f.read() == _DATA
+
+    with pytest.raises(ValueError):
+        ranged.open_ranged((len(_DATA), read_range), mode="wb")
+
+
+@responses.activate
+def test_http_ranges():
+    url = "https://data.example.com/file.bin"
+    responses.add_callback(responses.GET, url, callback=_range_callback)
+    size, read_range = ranged.http_ranges(url)
+    assert size == len(_DATA)
+    assert read_range(100, 200) == _DATA[100:200]
+
+    with ranged.open_ranged((size, read_range), block_size=4096) as f:
+        f.seek(5000)
+        assert f.read(100) == _DATA[5000:5100]
+    # Only the size probe, the explicit read and one block were requested
+    assert len(responses.calls) == 3
+
+
+@responses.activate
+def test_http_ranges_unsupported():
+    url = "https://data.example.com/file.bin"
+    responses.add(responses.GET, url, body=_DATA, status=200)
+    with mock.patch.object(requests.Response, "close", autospec=True) as close:
+        assert ranged.http_ranges(url) is None
+    # The body, i.e. the whole object, is not downloaded
+    close.assert_called_once()
+    assert not responses.calls[0].response._content_consumed
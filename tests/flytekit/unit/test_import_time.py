@@ -0,0 +1,61 @@
+import os
+import subprocess
+import sys
+
+# Modules that must not be loaded by a bare ``import flytekit``, they are only needed once the corresponding
+# functionality is used.
+_DEFERRED_MODULES = [
+    "pandas",
+    "numpy",
+    "joblib",
+    "distutils",
+    "flytekit.types.schema.types",
+]
+
+
+def _import_times(tmp_path, statement="import flytekit"):
+    """
+    Runs ``statement`` in a fresh interpreter with ``-X importtime`` and returns the cumulative import time in
+    microseconds of every module it loaded.
+    """
+    env = dict(os.environ)
+    env["FLYTE_SDK_LOCAL_SANDBOX"] = str(tmp_path / "sandbox")
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        env=env,
+        stderr=subprocess.PIPE,
+        check=True,
+        universal_newlines=True,
+    ).stderr
+
+    times = {}
+    for line in out.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        try:
+            times[name.strip()] = int(cumulative)
+        except ValueError:
+            continue  # the header line
+    return times
+
+
+def test_import_flytekit_is_lazy(tmp_path):
+    times = _import_times(tmp_path)
+    assert "flytekit" in times
+    loaded = [m for m in _DEFERRED_MODULES if m in times]
+    assert loaded == []
+    # The default file access provider doesn't create its sandbox folders until they're used
+    assert list((tmp_path / "sandbox").glob("*/mock_remote")) == []
+
+
+def test_lazy_attributes_still_resolve(tmp_path):
+    times = _import_times(
+        tmp_path,
+        "import flytekit, pandas; "
+        "from flytekit.core.type_engine import TypeEngine; "
+        "assert flytekit.schema.FlyteSchema; "
+        "assert flytekit.plugins.pandas.DataFrame is pandas.DataFrame; "
+        "assert TypeEngine.get_transformer(pandas.DataFrame).name",
+    )
+    assert "flytekit.types.schema.types_pandas" in times
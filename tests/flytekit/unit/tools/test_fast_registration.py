@@ -1,6 +1,19 @@
+import gzip
+import io
+import os
 import tarfile
 
-from flytekit.tools.fast_registration import filter_tar_file_fn, get_additional_distribution_loc
+import pytest
+
+from flytekit.tools import fast_registration
+from flytekit.tools.fast_registration import (
+    compute_digest,
+    download_distribution,
+    filter_tar_file_fn,
+    get_additional_distribution_loc,
+    upload_package,
+    write_archive,
+)
 
 
 def testfilter_tar_file_fn():
@@ -19,3 +32,130 @@ def testfilter_tar_file_fn():
 
 def test_get_additional_distribution_loc():
     assert get_additional_distribution_loc("s3://my-s3-bucket/dir", "123abc") == "s3://my-s3-bucket/dir/123abc.tar.gz"
+
+
+def _write(path, contents):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(contents)
+
+
+def test_compute_digest(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    source = str(tmp_path / "src")
+    _write(os.path.join(source, "a.py"), "a = 1\n")
+    _write(os.path.join(source, "pkg", "b.py"), "b = 1\n")
+    _write(os.path.join(source, "data.txt"), "ignored\n")
+
+    digest = compute_digest(source)
+    assert digest.startswith("fast")
+    assert os.path.exists(os.path.join(str(tmp_path), "tmp", "versions", ".digest_cache.json"))
+    assert compute_digest(source) == digest
+    assert compute_digest(source, use_cache=False) == digest
+
+    _write(os.path.join(source, "data.txt"), "still ignored\n")
+    assert compute_digest(source) == digest
+
+    _write(os.path.join(source, "pkg", "b.py"), "b = 2\n")
+    assert compute_digest(source) != digest
+
+
+def test_compute_digest_uses_cached_file_hashes(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    source = str(tmp_path / "src")
+    path = os.path.join(source, "a.py")
+    _write(path, "a = 1\n")
+    digest = compute_digest(source)
+
+    # Same size and mtime, so the stale cached hash is used rather than re-reading the file
+    st = os.stat(path)
+    _write(path, "a = 2\n")
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert compute_digest(source) == digest
+    assert compute_digest(source, use_cache=False) != digest
+
+
+def test_write_archive(tmp_path, monkeypatch):
+    monkeypatch.setattr(fast_registration, "_COMPRESSION_BLOCK_SIZE", 1024)
+    source = str(tmp_path / "src")
+    big = "".join(f"line {i}\n" for i in range(5000))
+    _write(os.path.join(source, "a.py"), big)
+    _write(os.path.join(source, "pkg", "b.py"), "b = 1\n")
+    _write(os.path.join(source, "a.pyc"), "")
+
+    archive = io.BytesIO()
+    write_archive(source, archive, workers=4)
+    archive.seek(0)
+    with tarfile.open(fileobj=archive, mode="r:gz") as tar:
+        assert sorted(m.name for m in tar.getmembers() if m.isfile()) == ["a.py", "pkg/b.py"]
+        assert tar.extractfile("a.py").read().decode("utf-8") == big
+
+    # Independent gzip members still form a valid gzip stream
+    assert gzip.decompress(archive.getvalue())
+
+
+def test_upload_package_stream(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    source = str(tmp_path / "src")
+    _write(os.path.join(source, "a.py"), "a = 1\n")
+    remote = str(tmp_path / "remote")
+
+    path = upload_package(source, "fastabc", remote, stream=True)
+    assert path == os.path.join(remote, "fastabc.tar.gz")
+    with tarfile.open(path, mode="r:gz") as tar:
+        assert [m.name for m in tar.getmembers() if m.isfile()] == ["a.py"]
+    assert os.listdir(remote) == ["fastabc.tar.gz"]
+
+
+def test_download_distribution(tmp_path, monkeypatch):
+    source = str(tmp_path / "src")
+    _write(os.path.join(source, "a.py"), "a = 1\n")
+    _write(os.path.join(source, "pkg", "b.py"), "b = 1\n")
+    archive = str(tmp_path / "fastabc.tar.gz")
+    with open(archive, "wb") as fp:
+        write_archive(source, fp)
+
+    dest = str(tmp_path / "dest")
+    assert sorted(download_distribution(archive, dest)) == ["a.py", os.path.join("pkg", "b.py")]
+    with open(os.path.join(dest, "pkg", "b.py")) as f:
+        assert f.read() == "b = 1\n"
+
+    with pytest.raises(ValueError):
+        download_distribution(str(tmp_path / "fastabc.zip"), dest)
+
+
+def test_download_distribution_multiple_blocks(tmp_path, monkeypatch):
+    monkeypatch.setattr(fast_registration, "_COMPRESSION_BLOCK_SIZE", 1024)
+    source = str(tmp_path / "src")
+    big = "".join(f"line {i}\n" for i in range(5000))
+    _write(os.path.join(source, "a.py"), big)
+    _write(os.path.join(source, "pkg", "b.py"), "b = 1\n")
+    archive = str(tmp_path / "fastabc.tar.gz")
+    with open(archive, "wb") as fp:
+        write_archive(source, fp, workers=4)
+
+    dest = str(tmp_path / "dest")
+    download_distribution(archive, dest)
+    with open(os.path.join(dest, "a.py")) as f:
+        assert f.read() == big
+    with open(os.path.join(dest, "pkg", "b.py")) as f:
+        assert f.read() == "b = 1\n"
+
+
+def test_download_distribution_cached(tmp_path, monkeypatch):
+    cache_dir = str(tmp_path / "cache")
+    monkeypatch.setenv("FLYTE_SDK_FAST_DISTRIBUTION_CACHE_DIR", cache_dir)
+    source = str(tmp_path / "src")
+    _write(os.path.join(source, "a.py"), "a = 1\n")
+    archive = str(tmp_path / "fastabc.tar.gz")
+    with open(archive, "wb") as fp:
+        write_archive(source, fp)
+
+    download_distribution(archive, str(tmp_path / "dest1"))
+    assert os.listdir(cache_dir) == ["fastabc"]
+
+    # The cached copy is used, the archive is not read again
+    os.remove(archive)
+    assert download_distribution(archive, str(tmp_path / "dest2")) == ["a.py"]
+    with open(os.path.join(str(tmp_path / "dest2"), "a.py")) as f:
+        assert f.read() == "a = 1\n"
@@ -0,0 +1,83 @@
+import importlib
+import os
+import sys
+
+from flyteidl.admin.launch_plan_pb2 import LaunchPlan
+from flyteidl.admin.task_pb2 import TaskSpec
+
+from flytekit.tools.module_loader import add_sys_path
+from flytekit.tools.serialize_cache import ModuleDigests, SerializationCache, _imported_module_names
+
+
+def _write(path, contents):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(contents)
+
+
+def test_imported_module_names():
+    src = b"import a.b\nfrom . import c\nfrom ..d import e\nfrom f import g\n"
+    names = _imported_module_names("pkg.sub.mod", src, is_package=False)
+    assert {"a", "a.b", "pkg.sub", "pkg.sub.c", "pkg.d", "pkg.d.e", "f", "f.g"} <= names
+
+    names = _imported_module_names("pkg", b"from .x import y\n", is_package=True)
+    assert {"pkg.x", "pkg.x.y"} <= names
+
+
+def test_module_digests_follow_local_imports(tmp_path):
+    root = str(tmp_path)
+    _write(os.path.join(root, "digestpkg", "__init__.py"), "")
+    _write(os.path.join(root, "digestpkg", "a.py"), "X = 1\n")
+    _write(os.path.join(root, "digestpkg", "b.py"), "from digestpkg import a\nimport os\n")
+    _write(os.path.join(root, "digestpkg", "c.py"), "Y = 2\n")
+
+    with add_sys_path(root):
+        try:
+            for m in ("digestpkg.a", "digestpkg.b", "digestpkg.c"):
+                importlib.import_module(m)
+
+            before = ModuleDigests([root])
+            b1, c1 = before.digest("digestpkg.b"), before.digest("digestpkg.c")
+            assert b1 is not None
+            # Modules outside of the root do not participate
+            assert before.digest("os") is None
+
+            _write(os.path.join(root, "digestpkg", "a.py"), "X = 2\n")
+            after = ModuleDigests([root])
+            assert after.digest("digestpkg.b") != b1
+            assert after.digest("digestpkg.c") == c1
+        finally:
+            for m in list(sys.modules):
+                if m.startswith("digestpkg"):
+                    del sys.modules[m]
+
+
+def test_serialization_cache_roundtrip(tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    t = TaskSpec()
+    t.template.id.name = "t1"
+    lp = LaunchPlan()
+    lp.id.name = "lp1"
+
+    cache = SerializationCache(cache_dir, "settings")
+    assert cache.get("task/t1", "d1") is None
+    cache.put("task/t1", "d1", [t, lp])
+    cache.put("task/no_module", None, [t])
+    cache.save(["0_t1_1.pb"])
+
+    cache = SerializationCache(cache_dir, "settings")
+    assert cache.previous_outputs == ["0_t1_1.pb"]
+    assert cache.get("task/t1", "d2") is None
+    assert cache.get("task/no_module", None) is None
+    assert cache.get("task/t1", "d1") == [t, lp]
+    assert cache.hits == 1
+    assert cache.misses == 2
+
+    # Different settings invalidate every entry, but still remember the previous outputs
+    cache = SerializationCache(cache_dir, "other settings")
+    assert cache.get("task/t1", "d1") is None
+    assert cache.previous_outputs == ["0_t1_1.pb"]
+
+    # Entities that were not looked up are pruned along with their objects
+    cache.save([])
+    assert os.listdir(os.path.join(cache_dir, "objects")) == []